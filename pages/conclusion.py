@@ -1,123 +1,83 @@
 import streamlit as st
+from utils.theme import register_page_css
 
-def local_css():
-    """
-    Menerapkan CSS kustom untuk aplikasi Streamlit.
-    
-    Fungsi ini menambahkan styling untuk:
-    - Tombol utama dan sidebar
-    - Header dan subheader
-    - Blok pertanyaan, kesimpulan, dan rekomendasi
-    - Highlight teks dan gradient header
-    """
-    st.markdown(f"""
-        <style>
-            .stButton>button {{
-                background-color: #1a5fb4;
-                color: white !important;
-                border-radius: 5px;
-                padding: 12px 16px;
-                margin: 8px 0;
-                font-weight: bold;
-                cursor: pointer;
-                text-align: center;
-                box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
-                transition: all 0.3s ease;
-                border: none;
-                width: 100%;
-            }}
-            
-            .stButton>button:hover {{
-                background-color: #0d47a1;
-                color: white !important;
-                transform: scale(1.05);
-                box-shadow: 0 8px 12px rgba(0, 0, 0, 0.2);
-            }}
-            
-            .sidebar .stButton>button {{
-                color: white !important;
-                background-color: #1a5fb4;
-            }}
-            
-            .sidebar .stButton>button:hover {{
-                color: white !important;
-                background-color: #0d47a1;
-            }}
-
-            .main h1 {{
-                color: #1e3c72 !important;
-                border-bottom: 3px solid #ffd700;
-                padding-bottom: 8px;
-                margin-bottom: 1.5rem !important;
-                font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-            }}
-            
-            .main h2 {{
-                color: #1a5fb4 !important;
-                margin-top: 1.8rem !important;
-                padding-left: 10px;
-                border-left: 4px solid #ffd700;
-                font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-            }}
-            
-            .pertanyaan {{
-                background-color: #e6f0ff;
-                padding: 15px;
-                border-radius: 8px;
-                border-left: 4px solid #1a5fb4;
-                margin: 15px 0;
-                font-style: italic;
-                font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-            }}
-            
-            .kesimpulan {{
-                background-color: white;
-                padding: 15px;
-                border-radius: 8px;
-                border-left: 4px solid #ffd700;
-                margin: 15px 0;
-                box-shadow: 0 2px 5px rgba(0,0,0,0.1);
-                font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-            }}
-            
-            .rekomendasi {{
-                background-color: #fff9e6;
-                padding: 15px;
-                border-radius: 8px;
-                border-left: 4px solid #1e3c72;
-                margin: 15px 0;
-                font-weight: bold;
-                font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-            }}
-            
-            .main ul {{
-                padding-left: 20px;
-                font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-            }}
-            
-            .main li {{
-                margin-bottom: 8px;
-            }}
-            
-            .highlight {{
-                color: #1e3c72;
-                font-weight: bold;
-            }}
-            
-            .gradient-header {{
-                background: linear-gradient(90deg, #1a5fb4, #3584e4);
-                padding: 15px;
-                border-radius: 10px;
-                margin-bottom: 25px;
-            }}
-            
-            .gradient-header h1 {{
-                color: white !important;
-                margin: 0;
-                border-bottom: none !important;
-            }}
-        </style>
-        """, unsafe_allow_html=True)
+# Aturan CSS khusus halaman Conclusion (judul, blok pertanyaan, kesimpulan, dan rekomendasi)
+PAGE_CSS = """
+    .main h1 {
+        color: #1e3c72 !important;
+        border-bottom: 3px solid #ffd700;
+        padding-bottom: 8px;
+        margin-bottom: 1.5rem !important;
+        font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
+    }
+
+    .main h2 {
+        color: #1a5fb4 !important;
+        margin-top: 1.8rem !important;
+        padding-left: 10px;
+        border-left: 4px solid #ffd700;
+        font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
+    }
+
+    .pertanyaan {
+        background-color: #e6f0ff;
+        padding: 15px;
+        border-radius: 8px;
+        border-left: 4px solid #1a5fb4;
+        margin: 15px 0;
+        font-style: italic;
+        font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
+    }
+
+    .kesimpulan {
+        background-color: white;
+        padding: 15px;
+        border-radius: 8px;
+        border-left: 4px solid #ffd700;
+        margin: 15px 0;
+        box-shadow: 0 2px 5px rgba(0,0,0,0.1);
+        font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
+    }
+
+    .rekomendasi {
+        background-color: #fff9e6;
+        padding: 15px;
+        border-radius: 8px;
+        border-left: 4px solid #1e3c72;
+        margin: 15px 0;
+        font-weight: bold;
+        font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
+    }
+
+    .main ul {
+        padding-left: 20px;
+        font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
+    }
+
+    .main li {
+        margin-bottom: 8px;
+    }
+
+    .highlight {
+        color: #1e3c72;
+        font-weight: bold;
+    }
+
+    .gradient-header {
+        background: linear-gradient(90deg, #1a5fb4, #3584e4);
+        padding: 15px;
+        border-radius: 10px;
+        margin-bottom: 25px;
+    }
+
+    .gradient-header h1 {
+        color: white !important;
+        margin: 0;
+        border-bottom: none !important;
+    }
+"""
+
+register_page_css('conclusion', PAGE_CSS)
 
 def show_main_header():
     """
@@ -204,9 +164,6 @@ def app():
     Mengatur tata letak dan alur aplikasi analisis data.
     """
     
-    # Menerapkan CSS kustom
-    local_css()
-    
     # Menampilkan header utama
     show_main_header()
     
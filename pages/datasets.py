@@ -1,126 +1,16 @@
 import streamlit as st
 import pandas as pd
+import numpy as np
 import os
 from pathlib import Path
+from utils.data_loader import file_fingerprint, inspect_csv, load_dataset
+from utils.streaming import describe_summary, summarize_csv, use_streaming
+from utils.profiling import profile_dataset
+from utils.table_viewer import show_paginated_dataframe
+from utils.theme import DATA_PAGE_CSS, register_page_css
 
-def local_css():
-    """
-    Menerapkan tema kustom dengan CSS.
-    
-    Fungsi ini menambahkan styling untuk:
-    - Background utama
-    - Tombol dan elemen interaktif
-    - Kartu dataset dan insight
-    - Header dan typography
-    - Tabel dan expander
-    """
-    st.markdown(f"""
-    <style>
-        .main {{
-            background-color: #f5f9ff;
-        }}
-        
-        .stButton>button {{
-            background-color: #1a5fb4;
-            color: white !important;
-            border-radius: 5px;
-            padding: 12px 16px;
-            margin: 8px 0;
-            font-weight: bold;
-            cursor: pointer;
-            text-align: center;
-            box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
-            transition: all 0.3s ease;
-            border: none;
-            width: 100%;
-        }}
-        
-        .stButton>button:hover {{
-            background-color: #0d47a1;
-            color: white !important;
-            transform: scale(1.05);
-            box-shadow: 0 8px 12px rgba(0, 0, 0, 0.2);
-        }}
-        
-        .sidebar .stButton>button {{
-            color: white !important;
-            background-color: #1a5fb4;
-        }}
-        
-        .sidebar .stButton>button:hover {{
-            color: white !important;
-            background-color: #0d47a1;
-        }}
-        
-        .stSelectbox, .stDataFrame, .stTextInput, .stNumberInput {{
-            border: 1px solid #4a90e2;
-            border-radius: 5px;
-        }}
-        
-        .dataset-card {{
-            padding: 15px;
-            border-radius: 10px;
-            background: linear-gradient(145deg, #e6f0ff, #ffffff);
-            border-left: 4px solid #ffd700;
-            box-shadow: 0 2px 5px rgba(0,0,0,0.1);
-            margin-bottom: 15px;
-        }}
-        
-        .insight-card {{
-            padding: 15px;
-            border-radius: 10px;
-            background: #fff9e6;
-            border-left: 4px solid #1e3c72;
-            margin-bottom: 15px;
-            box-shadow: 0 2px 5px rgba(0,0,0,0.1);
-        }}
-        
-        .dataset-card h5 {{
-            color: #1a5fb4;
-            margin-bottom: 8px !important;
-        }}
-        
-        .dataset-card p {{
-            color: #333333;
-            margin: 5px 0 !important;
-        }}
-        
-        .stHeader {{
-            color: #1e3c72 !important;
-            font-weight: bold !important;
-        }}
-        
-        .st-expander {{
-            border: 1px solid #4a90e2;
-            border-radius: 5px;
-        }}
-        
-        .st-expander-header {{
-            background-color: #e6f0ff !important;
-            color: #1e3c72 !important;
-            font-weight: bold !important;
-        }}
-        
-        hr {{
-            border-top: 2px dashed #ffd700;
-            margin: 20px 0;
-        }}
-        
-        .highlight-blue {{
-            color: #1e3c72;
-            font-weight: bold;
-        }}
-        
-        .highlight-yellow {{
-            color: #FFD700;
-            font-weight: bold;
-        }}
-        
-        .stDataFrame {{
-            box-shadow: 0 2px 5px rgba(0,0,0,0.1);
-        }}
-    </style>
-    """, unsafe_allow_html=True)
+# Halaman data memakai aturan bersama DATA_PAGE_CSS dari tema
+register_page_css('datasets', DATA_PAGE_CSS)
 
 def get_filenames(folder_path):
     """
@@ -138,73 +28,155 @@ def get_filenames(folder_path):
         st.error(f"Folder '{folder_path}' tidak ditemukan.")
         return []
 
-def read_csv_datasets(file_list, folder_path="datasets"):
+def scan_datasets(file_list, folder_path="datasets"):
     """
-    Membaca file CSV dari daftar nama file dan mengembalikan dictionary of DataFrames.
+    Membaca metadata file CSV (ukuran, header, perkiraan jumlah baris) tanpa
+    memuat isinya. Dataset baru dimuat saat dipilih pengguna.
     
     Parameters:
         file_list (list): Daftar nama file
         folder_path (str): Path folder tempat file-file disimpan (default: 'datasets')
         
     Returns:
-        dict: Dictionary dengan format {nama_file: DataFrame}
+        dict: Dictionary dengan format {nama_file: metadata}
     """
-    datasets = {}
+    catalog = {}
     for file in file_list:
         if file.endswith(".csv"):
             file_path = os.path.join(folder_path, file)
             try:
                 dataset_name = os.path.splitext(file)[0]
-                datasets[dataset_name] = pd.read_csv(file_path)
+                catalog[dataset_name] = inspect_csv(file_path)
             except Exception as e:
                 st.error(f"Gagal membaca file {file}: {str(e)}")
-    return datasets
+    return catalog
 
-def show_dataset_card(selected_dataset, df):
+def format_dataset_option(meta):
+    """
+    Menyusun label pilihan dataset dari metadata file.
+    
+    Parameters:
+        meta (dict): Metadata dari inspect_csv
+        
+    Returns:
+        str: Label berisi nama, ukuran file, dan (perkiraan) jumlah baris
+    """
+    rows = f"{meta['estimated_rows']:,} baris" if meta['exact_rows'] else f"±{meta['estimated_rows']:,} baris"
+    return f"{meta['name']} ({meta['size_bytes']/1024/1024:.1f} MB, {rows})"
+
+def show_dataset_card(selected_dataset, n_rows, n_cols, memory_bytes):
     """
     Menampilkan kartu informasi dataset dalam format yang rapi.
     
     Parameters:
         selected_dataset (str): Nama dataset yang dipilih
-        df (DataFrame): Dataframe yang berisi data dataset
+        n_rows (int): Jumlah baris dataset
+        n_cols (int): Jumlah kolom dataset
+        memory_bytes (int): Ukuran memori dataset dalam byte
     """
     st.markdown(f"""
         <div class='dataset-card'>
             <h5>📁 Dataset: {selected_dataset}</h5>
-            <p>🔢 Jumlah Baris: {df.shape[0]:,}</p>
-            <p>📊 Jumlah Kolom: {df.shape[1]}</p>
-            <p>💾 Ukuran Memori: {df.memory_usage(deep=True).sum()/1024/1024:.2f} MB</p>
+            <p>🔢 Jumlah Baris: {n_rows:,}</p>
+            <p>📊 Jumlah Kolom: {n_cols}</p>
+            <p>💾 Ukuran Memori: {memory_bytes/1024/1024:.2f} MB</p>
         </div>
     """, unsafe_allow_html=True)
 
-def show_dataset_overview(datasets):
+def show_dataset_overview(catalog):
     """
-    Menampilkan overview dataset yang telah dimuat dalam bentuk interaktif.
+    Menampilkan overview dataset dalam bentuk interaktif. Hanya dataset yang
+    dipilih yang dimuat ke memori.
     
     Parameters:
-        datasets (dict): Dictionary berisi dataset yang telah dimuat
+        catalog (dict): Dictionary berisi metadata dataset dari scan_datasets
     """
     st.header("📂 Dataset Loaded", divider='blue')
     
-    if not datasets:
+    if not catalog:
         st.warning("Belum ada dataset yang dimuat.")
         return
     
     selected_dataset = st.selectbox(
         "Pilih Dataset",
-        list(datasets.keys()),
+        list(catalog.keys()),
+        format_func=lambda name: format_dataset_option(catalog[name]),
         help="Pilih dataset yang ingin Anda lihat"
     )
     
-    if selected_dataset:
-        df = datasets[selected_dataset]
-        show_dataset_card(selected_dataset, df)
+    if not selected_dataset:
+        return
+    
+    file_path = catalog[selected_dataset]['path']
+    
+    if use_streaming(file_path):
+        with st.spinner(f"Meringkas {selected_dataset}..."):
+            summary = summarize_csv(file_path)
+        show_dataset_card(selected_dataset, summary['rows'], len(summary['columns']), summary['memory_bytes'])
         
-        with st.expander(f"🔍 Lihat isi dataset {selected_dataset}", expanded=False):
-            st.dataframe(df, use_container_width=True)
+        st.info("ℹ️ Dataset ini terlalu besar untuk dimuat utuh; ringkasan dihitung secara streaming.")
         
         with st.expander(f"📊 Statistik Deskriptif {selected_dataset}", expanded=False):
-            st.write(df.describe())
+            st.write(describe_summary(summary))
+        return
+    
+    try:
+        with st.spinner(f"Memuat {selected_dataset}..."):
+            df = load_dataset(file_path)
+    except Exception as e:
+        st.error(f"Gagal membaca file {os.path.basename(file_path)}: {str(e)}")
+        return
+    
+    dataset_key = file_fingerprint(file_path)
+    exact = st.toggle(
+        "🎯 Statistik presisi",
+        key=f"exact_{selected_dataset}",
+        help="Hitung nilai unik, kuartil, dan memori secara pasti (lebih lambat untuk dataset besar)"
+    )
+    with st.spinner(f"Memprofilkan {selected_dataset}..."):
+        profile = profile_dataset(df, dataset_key, exact=exact)
+    
+    show_dataset_card(selected_dataset, df.shape[0], df.shape[1], profile['memory_bytes'].sum())
+    
+    with st.expander(f"🔍 Lihat isi dataset {selected_dataset}", expanded=False):
+        show_paginated_dataframe(df, dataset_key=dataset_key, key=f"viewer_{selected_dataset}")
+    
+    with st.expander(f"📊 Statistik Deskriptif {selected_dataset}", expanded=False):
+        show_profile_table(profile, exact)
+
+def show_profile_table(profile, exact):
+    """
+    Menampilkan tabel profil per kolom dataset.
+    
+    Parameters:
+        profile (pd.DataFrame): Profil dari profile_dataset
+        exact (bool): Apakah profil dihitung secara pasti
+    """
+    display = profile.copy()
+    for col in ['min', 'max']:
+        # Kolom min/max berisi angka dan tanggal sekaligus, ditampilkan sebagai teks
+        display[col] = display[col].map(
+            lambda v: '' if pd.isna(v) else f"{v:,.2f}" if isinstance(v, (int, float, np.number)) else str(v)
+        )
+    display['memory_bytes'] = display['memory_bytes'] / 1024 / 1024
+    display = display.rename(columns={'memory_bytes': 'memori (MB)'})
+    
+    st.dataframe(
+        display.style.format({
+            'count': '{:,.0f}',
+            'nulls': '{:,.0f}',
+            'distinct': '{:,.0f}',
+            'mean': '{:,.2f}',
+            'std': '{:,.2f}',
+            '25%': '{:,.2f}',
+            '50%': '{:,.2f}',
+            '75%': '{:,.2f}',
+            'memori (MB)': '{:,.2f}'
+        }, na_rep=''),
+        use_container_width=True
+    )
+    if not exact:
+        st.caption("Nilai unik (HyperLogLog), kuartil, dan memori merupakan perkiraan. Aktifkan statistik presisi untuk nilai pasti.")
 
 def show_insight_card(title, datasets, description):
     """
@@ -257,22 +229,18 @@ def show_main_header():
     """, unsafe_allow_html=True)
 
 def app():
-
-    # Menerapkan CSS kustom untuk seluruh aplikasi
-    local_css()
-    
     # Menampilkan header utama aplikasi
     show_main_header()
     
     # Mendapatkan path folder datasets
     folder_path = Path(__file__).parent.parent / 'datasets'
     
-    # Mengambil daftar file dan membaca dataset
+    # Mengambil daftar file dan metadata dataset (isi dimuat saat dipilih)
     file_list = get_filenames(folder_path)
-    datasets = read_csv_datasets(file_list, folder_path)
+    catalog = scan_datasets(file_list, folder_path)
     
-    # Menampilkan overview dataset yang telah dimuat
-    show_dataset_overview(datasets)
+    # Menampilkan overview dataset yang dipilih
+    show_dataset_overview(catalog)
     
     # Menambahkan divider visual
     st.markdown("---")
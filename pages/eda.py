@@ -1,15 +1,35 @@
 import streamlit as st
-import pandas as pd
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
-import plotly.express as px
+import numpy as np
 import os
 from pathlib import Path
+from utils.data_loader import MEMORY_BUDGET_BYTES, dataset_version, load_dataset, loaded_datasets
+from utils.downsampling import MAX_SCATTER_POINTS, cached_density_grid, cached_feature_histogram, cached_stratified_sample
+from utils.box_summary import MAX_OUTLIERS_PER_GROUP, cached_feature_box_summary, cached_freight_box_summary
+from utils.features import PRICE_GROUP_LABELS
+from utils.disk_cache import disk_cache_stats, get_or_compute
+from utils.figure_cache import cached_figure, figure_cache_stats
+from utils.ids import vocabulary_bytes
+from utils.freight_drivers import VOLUMETRIC_DIVISOR, load_freight_drivers
+from utils.trendlines import TRENDLINE_METHODS, cached_trendline
+from utils.rollups import load_payments_rollup, monthly_rollup
+from utils.metadata import column_bounds
+from utils.streaming import load_streamed_payments_rollup, use_streaming
+from utils.theme import DATA_PAGE_CSS, register_page_css
+
+# Catatan: plotly diimpor di dalam fungsi pembuat grafik agar tidak dimuat saat halaman
+# diimpor, hanya ketika sebuah grafik benar-benar dibuat (mempercepat cold start)
 
 BLUE_PALETTE = ["#1f77b4", "#4e79a7", "#5c8ab8", "#7eb0d5", "#a5c8e0"]
 YELLOW_PALETTE = ["#ffbb00", "#ffcc33", "#ffdd66", "#ffee99", "#fff6cc"]
 BACKGROUND_COLOR = "#f8f9fa"
 
+# Rentang dan jumlah bin histogram rasio ongkir; rasio di atas rentang masuk bucket overflow
+RATIO_RANGE = (0.0, 2.0)
+RATIO_BINS = 100
+
+# Halaman data memakai aturan bersama DATA_PAGE_CSS dari tema
+register_page_css('eda', DATA_PAGE_CSS)
+
 def get_base_dir():
     """
     Mengembalikan path absolut ke direktori utama proyek.
@@ -33,139 +53,29 @@ def get_dataset_paths():
         os.path.join(BASE_DIR, 'datasets', 'order_items_dataset.csv')
     )
 
-def local_css():
-    """
-    Menerapkan tema kustom CSS.
-    
-    Menambahkan CSS untuk:
-    - Warna dan tata letak utama
-    - Tombol dan elemen interaktif
-    - Kartu dataset dan insight
-    - Tipografi dan highlight
-    """
-    st.markdown(f"""
-    <style>
-        .main {{
-            background-color: #f5f9ff;
-        }}
-        
-        .stButton>button {{
-            background-color: #1a5fb4;
-            color: white !important;
-            border-radius: 5px;
-            padding: 12px 16px;
-            margin: 8px 0;
-            font-weight: bold;
-            cursor: pointer;
-            text-align: center;
-            box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
-            transition: all 0.3s ease;
-            border: none;
-            width: 100%;
-        }}
-        
-        .stButton>button:hover {{
-            background-color: #0d47a1;
-            color: white !important;
-            transform: scale(1.05);
-            box-shadow: 0 8px 12px rgba(0, 0, 0, 0.2);
-        }}
-        
-        .sidebar .stButton>button {{
-            color: white !important;
-            background-color: #1a5fb4;
-        }}
-        
-        .sidebar .stButton>button:hover {{
-            color: white !important;
-            background-color: #0d47a1;
-        }}
-        
-        .stSelectbox, .stDataFrame, .stTextInput, .stNumberInput {{
-            border: 1px solid #4a90e2;
-            border-radius: 5px;
-        }}
-        
-        .dataset-card {{
-            padding: 15px;
-            border-radius: 10px;
-            background: linear-gradient(145deg, #e6f0ff, #ffffff);
-            border-left: 4px solid #ffd700;
-            box-shadow: 0 2px 5px rgba(0,0,0,0.1);
-            margin-bottom: 15px;
-        }}
-        
-        .insight-card {{
-            padding: 15px;
-            border-radius: 10px;
-            background: #fff9e6;
-            border-left: 4px solid #1e3c72;
-            margin-bottom: 15px;
-            box-shadow: 0 2px 5px rgba(0,0,0,0.1);
-        }}
-        
-        .dataset-card h5 {{
-            color: #1a5fb4;
-            margin-bottom: 8px !important;
-        }}
-        
-        .dataset-card p {{
-            color: #333333;
-            margin: 5px 0 !important;
-        }}
-        
-        .stHeader {{
-            color: #1e3c72 !important;
-            font-weight: bold !important;
-        }}
-        
-        .st-expander {{
-            border: 1px solid #4a90e2;
-            border-radius: 5px;
-        }}
-        
-        .st-expander-header {{
-            background-color: #e6f0ff !important;
-            color: #1e3c72 !important;
-            font-weight: bold !important;
-        }}
-        
-        hr {{
-            border-top: 2px dashed #ffd700;
-            margin: 20px 0;
-        }}
-        
-        .highlight-blue {{
-            color: #1e3c72;
-            font-weight: bold;
-        }}
-        
-        .highlight-yellow {{
-            color: #FFD700;
-            font-weight: bold;
-        }}
-        
-        .stDataFrame {{
-            box-shadow: 0 2px 5px rgba(0,0,0,0.1);
-        }}
-    </style>
-    """, unsafe_allow_html=True)
-
 def load_payments_data():
     """
-    Memuat dataset pembayaran dan pesanan dari file CSV.
+    Memuat ringkasan harian pembayaran dan rentang tanggal pesanan.
+    
+    Dataset berukuran besar diringkas secara streaming per chunk sehingga tidak
+    pernah dimuat utuh ke memori.
     
     Returns:
-        tuple: (payments_df, orders_dataset) - DataFrame pembayaran dan pesanan
+        tuple: (payments_rollup, (min_date, max_date)) - Ringkasan harian pembayaran
+        dan rentang tanggal pembelian
         
     Raises:
         st.error: Menampilkan pesan error jika file tidak ditemukan
     """
     PAYMENTS_PATH, ORDERS_PATH, _ = get_dataset_paths()
     try:
-        payments_df = pd.read_csv(PAYMENTS_PATH)
-        orders_dataset = pd.read_csv(ORDERS_PATH)
-        return payments_df, orders_dataset
+        if use_streaming(PAYMENTS_PATH) or use_streaming(ORDERS_PATH):
+            payments_rollup = load_streamed_payments_rollup(PAYMENTS_PATH, ORDERS_PATH)
+        else:
+            payments_rollup = load_payments_rollup(PAYMENTS_PATH, ORDERS_PATH)
+        # Batas widget tanggal dibaca dari metadata dataset, tanpa menyentuh kolomnya
+        min_purchase, max_purchase = column_bounds(ORDERS_PATH, 'order_purchase_timestamp')
+        return payments_rollup, (min_purchase.date(), max_purchase.date())
     except FileNotFoundError as e:
         st.error(f"File dataset tidak ditemukan: {e}")
         st.error(f"Memeriksa path: {PAYMENTS_PATH}")
@@ -173,7 +83,7 @@ def load_payments_data():
 
 def load_order_items():
     """
-    Memuat dataset item pesanan dari file CSV.
+    Memuat dataset item pesanan dari cache dataset bersama.
     
     Returns:
         pd.DataFrame: DataFrame item pesanan
@@ -183,58 +93,33 @@ def load_order_items():
     """
     _, _, ORDER_ITEMS_PATH = get_dataset_paths()
     try:
-        return pd.read_csv(ORDER_ITEMS_PATH)
+        return load_dataset(ORDER_ITEMS_PATH, columns=['order_id', 'price', 'freight_value'])
     except FileNotFoundError as e:
         st.error(f"File dataset tidak ditemukan: {e}")
         st.error(f"Memeriksa path: {ORDER_ITEMS_PATH}")
         st.stop()
 
-def preprocess_payments_data(payments_df, orders_dataset, start_date=None, end_date=None):
-    """
-    Melakukan preprocessing data pembayaran dan pesanan dengan filter tanggal opsional.
-    
-    Parameters:
-        payments_df (pd.DataFrame): Data pembayaran
-        orders_dataset (pd.DataFrame): Data pesanan
-        start_date (str/datetime): Tanggal mulai (opsional)
-        end_date (str/datetime): Tanggal akhir (opsional)
-        
-    Returns:
-        pd.DataFrame: Data yang sudah diproses dengan kolom tambahan
+def calculate_monthly_stats(payments_rollup, start_date=None, end_date=None):
     """
-    processed_df = pd.merge(
-        payments_df[['order_id', 'payment_value']],
-        orders_dataset[['order_id', 'order_purchase_timestamp']],
-        on='order_id',
-        how='inner'
-    )
-    processed_df['order_purchase_timestamp'] = pd.to_datetime(processed_df['order_purchase_timestamp'])
-
-    if start_date is not None:
-        start_date = pd.to_datetime(start_date)
-        processed_df = processed_df[processed_df['order_purchase_timestamp'] >= start_date]
+    Menghitung statistik bulanan dari ringkasan harian pembayaran.
     
-    if end_date is not None:
-        end_date = pd.to_datetime(end_date)
-        processed_df = processed_df[processed_df['order_purchase_timestamp'] <= end_date]
-    
-    processed_df['month_year'] = processed_df['order_purchase_timestamp'].dt.to_period('M')
-    
-    return processed_df
-
-def calculate_monthly_stats(filtered_df):
-    """
-    Menghitung statistik bulanan dari data pembayaran.
+    Statistik disusun dari agregat harian yang sudah dihitung sebelumnya (dan
+    dibagi antar proses lewat cache disk), sehingga biayanya sebanding dengan
+    jumlah hari dalam rentang, bukan jumlah transaksi. Hasil per rentang tanggal
+    cukup murah untuk dihitung ulang dan tidak disimpan ke disk.
+    Median merupakan perkiraan sketsa kuantil (galat relatif sekitar 0.5%).
     
     Parameters:
-        filtered_df (pd.DataFrame): Data pembayaran yang sudah difilter
+        payments_rollup (dict): Ringkasan harian dari load_payments_data
+        start_date (str/datetime): Tanggal mulai inklusif (opsional)
+        end_date (str/datetime): Tanggal akhir inklusif (opsional)
         
     Returns:
         pd.DataFrame: Data statistik bulanan
     """
-    monthly_stats = filtered_df.groupby('month_year')['payment_value'].agg(['count', 'mean', 'median', 'sum']).reset_index()
+    monthly_stats = monthly_rollup(payments_rollup, start_date, end_date)[['month_key', 'count', 'mean', 'median', 'sum']]
     monthly_stats.columns = ['Bulan', 'Jumlah Transaksi', 'Rata-rata Pembayaran', 'Median Pembayaran', 'Total Pembayaran']
-    monthly_stats['Bulan'] = monthly_stats['Bulan'].astype(str)
+    monthly_stats['Bulan'] = (monthly_stats['Bulan'] // 100).astype(str) + '-' + (monthly_stats['Bulan'] % 100).astype(str).str.zfill(2)
     return monthly_stats
 
 def create_payment_trend_chart(monthly_stats):
@@ -247,6 +132,9 @@ def create_payment_trend_chart(monthly_stats):
     Returns:
         plotly.graph_objects.Figure: Figure Plotly yang sudah dikonfigurasi
     """
+    import plotly.graph_objects as go
+    from plotly.subplots import make_subplots
+    
     fig = make_subplots(specs=[[{"secondary_y": True}]])
 
     fig.add_trace(go.Scatter(
@@ -364,31 +252,50 @@ def show_key_insights():
 
 def show_price_shipping_analysis(order_items_dataset):
     """
-    Menampilkan analisis harga dan biaya pengiriman dalam bentuk tab.
+    Menampilkan analisis harga dan biaya pengiriman dengan pemilih tab.
+    
+    Berbeda dengan st.tabs yang menjalankan semua isi tab pada setiap rerun,
+    hanya analisis yang sedang dipilih yang dihitung dan dikirim ke browser.
+    Pilihan tab disimpan di session state sehingga bertahan antar rerun.
     
     Parameters:
         order_items_dataset (pd.DataFrame): Data item pesanan
     """
     st.subheader('📦 Analisis Harga dan Biaya Pengiriman')
     
-    tab1, tab2, tab3, tab4 = st.tabs([
-        "📊 Statistik Dasar", 
-        "📈 Korelasi", 
-        "📦 Distribusi Ongkir", 
-        "📉 Rasio Ongkir"
-    ])
-    
-    with tab1:
-        show_basic_stats(order_items_dataset)
-    
-    with tab2:
-        show_correlation_analysis(order_items_dataset)
+    analyses = {
+        "📊 Statistik Dasar": show_basic_stats,
+        "📈 Korelasi": show_correlation_analysis,
+        "📦 Distribusi Ongkir": show_shipping_distribution,
+        "📉 Rasio Ongkir": show_shipping_ratio_analysis,
+    }
+    
+    selected = st.radio(
+        "Analisis",
+        list(analyses),
+        horizontal=True,
+        key="price_shipping_tab",
+        label_visibility="collapsed"
+    )
     
-    with tab3:
-        show_shipping_distribution(order_items_dataset)
+    analyses[selected](order_items_dataset)
+
+@st.cache_resource(show_spinner=False, max_entries=8)
+def calculate_basic_stats(_order_items_dataset, dataset_key):
+    """
+    Menghitung statistik deskriptif harga dan biaya pengiriman sekali per versi
+    dataset, dibagi antar proses lewat cache disk.
     
-    with tab4:
-        show_shipping_ratio_analysis(order_items_dataset)
+    Parameters:
+        _order_items_dataset (pd.DataFrame): Data item pesanan (tidak di-hash)
+        dataset_key (tuple): Identitas versi dataset
+        
+    Returns:
+        pd.DataFrame: Statistik mean, std, min, kuartil, dan max per kolom
+    """
+    return get_or_compute('order_items_basic_stats', dataset_key, lambda: (
+        _order_items_dataset[['price', 'freight_value']].describe().loc[['mean', 'std', 'min', '25%', '50%', '75%', 'max']]
+    ))
 
 def show_basic_stats(order_items_dataset):
     """
@@ -403,7 +310,7 @@ def show_basic_stats(order_items_dataset):
     </div>
     """, unsafe_allow_html=True)
     
-    stats = order_items_dataset[['price', 'freight_value']].describe().loc[['mean', 'std', 'min', '25%', '50%', '75%', 'max']]
+    stats = calculate_basic_stats(order_items_dataset, dataset_version(order_items_dataset))
     st.dataframe(
         stats.style.format("{:.2f}")
         .background_gradient(cmap='Blues', subset=['price'])
@@ -427,36 +334,29 @@ def show_basic_stats(order_items_dataset):
     </div>
     """, unsafe_allow_html=True)
 
-def show_correlation_analysis(order_items_dataset):
+@st.cache_resource(show_spinner=False, max_entries=8)
+def calculate_price_freight_correlation(_order_items_dataset, dataset_key):
     """
-    Menampilkan analisis korelasi antara harga dan biaya pengiriman.
+    Menghitung korelasi Pearson harga dan biaya pengiriman sekali per versi dataset.
     
     Parameters:
-        order_items_dataset (pd.DataFrame): Data item pesanan
+        _order_items_dataset (pd.DataFrame): Data item pesanan (tidak di-hash)
+        dataset_key (tuple): Identitas versi dataset
+        
+    Returns:
+        float: Koefisien korelasi
     """
-    st.markdown(f"""
-    <div style="background-color:{BLUE_PALETTE[0]};padding:15px;border-radius:10px;margin-bottom:20px;box-shadow:0 4px 6px rgba(0,0,0,0.1);">
-        <h4 style="color:white;margin:0;text-align:center;">Hubungan Harga Produk dan Biaya Pengiriman</h4>
-    </div>
-    """, unsafe_allow_html=True)
-    
-    correlation = order_items_dataset[['price', 'freight_value']].corr().iloc[0, 1]
-    
-    fig_corr = px.scatter(
-        order_items_dataset.sample(frac=0.1),
-        x='price',
-        y='freight_value',
-        color_discrete_sequence=[BLUE_PALETTE[1]],
-        opacity=0.6,
-        trendline="lowess",
-        trendline_color_override=YELLOW_PALETTE[1],
-        labels={
-            'price': 'Harga Produk (Rp)',
-            'freight_value': 'Biaya Pengiriman (Rp)'
-        }
-    )
+    return _order_items_dataset[['price', 'freight_value']].corr().iloc[0, 1]
+
+def style_correlation_chart(fig, correlation):
+    """
+    Menerapkan tata letak standar grafik korelasi harga dan biaya pengiriman.
     
-    fig_corr.update_layout(
+    Parameters:
+        fig (plotly.graph_objects.Figure): Figure yang akan diatur
+        correlation (float): Koefisien korelasi untuk judul
+    """
+    fig.update_layout(
         plot_bgcolor='white',
         paper_bgcolor='white',
         font=dict(family="Arial", size=12),
@@ -469,10 +369,144 @@ def show_correlation_analysis(order_items_dataset):
         xaxis_title="<b>Harga Produk (Rp)</b>",
         yaxis_title="<b>Biaya Pengiriman (Rp)</b>"
     )
-    fig_corr.update_traces(
+
+def add_trendline(fig, trendline, method):
+    """
+    Menambahkan kurva garis tren yang sudah dihitung ke figure.
+    
+    Parameters:
+        fig (plotly.graph_objects.Figure): Figure tujuan
+        trendline (pd.DataFrame): Kurva dengan kolom x dan y
+        method (str): Nama metode garis tren untuk legenda
+    """
+    import plotly.graph_objects as go
+    
+    fig.add_trace(go.Scatter(
+        x=trendline['x'],
+        y=trendline['y'],
+        mode='lines',
+        name=f"Tren ({method})",
+        line=dict(color=YELLOW_PALETTE[1], width=3),
+        hovertemplate='Harga: Rp%{x:,.2f}<br>Tren ongkir: Rp%{y:,.2f}<extra></extra>'
+    ))
+
+def create_correlation_scatter(sample_df, correlation, trendline, method):
+    """
+    Membuat scatter plot harga vs biaya pengiriman dari sampel berukuran terbatas.
+    
+    Parameters:
+        sample_df (pd.DataFrame): Sampel deterministik data item pesanan
+        correlation (float): Koefisien korelasi seluruh data
+        trendline (pd.DataFrame): Kurva garis tren seluruh data
+        method (str): Nama metode garis tren
+        
+    Returns:
+        plotly.graph_objects.Figure: Figure Plotly yang sudah dikonfigurasi
+    """
+    import plotly.express as px
+    
+    fig = px.scatter(
+        sample_df,
+        x='price',
+        y='freight_value',
+        color_discrete_sequence=[BLUE_PALETTE[1]],
+        opacity=0.6,
+        labels={
+            'price': 'Harga Produk (Rp)',
+            'freight_value': 'Biaya Pengiriman (Rp)'
+        }
+    )
+    style_correlation_chart(fig, correlation)
+    fig.update_traces(
         marker=dict(size=5, line=dict(width=0.5, color='DarkSlateGrey'))
     )
+    add_trendline(fig, trendline, method)
+    fig.update_layout(showlegend=False)
+    return fig
+
+def create_correlation_density(grid, correlation, trendline, method):
+    """
+    Membuat heatmap kepadatan harga vs biaya pengiriman dari grid yang dihitung di server.
+    
+    Parameters:
+        grid (dict): Hasil density_grid
+        correlation (float): Koefisien korelasi seluruh data
+        trendline (pd.DataFrame): Kurva garis tren seluruh data
+        method (str): Nama metode garis tren
+        
+    Returns:
+        plotly.graph_objects.Figure: Figure Plotly yang sudah dikonfigurasi
+    """
+    import plotly.graph_objects as go
+    
+    counts = grid['counts']
+    # Skala log agar sel padat tidak menenggelamkan sel jarang; sel kosong dibuat transparan
+    z = np.where(counts > 0, np.log10(counts + 1), np.nan).astype('float32')
+    fig = go.Figure(go.Heatmap(
+        x=grid['x_centers'],
+        y=grid['y_centers'],
+        z=z,
+        customdata=counts.astype('int32'),
+        colorscale=[[0, BLUE_PALETTE[4]], [0.5, BLUE_PALETTE[2]], [1, BLUE_PALETTE[0]]],
+        colorbar=dict(title='log₁₀ jumlah'),
+        hovertemplate='Harga: Rp%{x:,.2f}<br>Ongkir: Rp%{y:,.2f}<br>%{customdata:,.0f} item<extra></extra>'
+    ))
+    style_correlation_chart(fig, correlation)
+    # Kurva dipotong ke rentang grid agar sumbu tidak melebar melewati heatmap
+    add_trendline(fig, trendline[trendline['x'] <= grid['x_centers'][-1]], method)
+    fig.update_layout(showlegend=False)
+    return fig
+
+def show_correlation_analysis(order_items_dataset):
+    """
+    Menampilkan analisis korelasi antara harga dan biaya pengiriman.
+    
+    Ukuran data yang dikirim ke browser dibatasi: mode sampel memakai sampel
+    berstrata deterministik, mode kepadatan memakai histogram 2D dari server.
+    
+    Parameters:
+        order_items_dataset (pd.DataFrame): Data item pesanan
+    """
+    st.markdown(f"""
+    <div style="background-color:{BLUE_PALETTE[0]};padding:15px;border-radius:10px;margin-bottom:20px;box-shadow:0 4px 6px rgba(0,0,0,0.1);">
+        <h4 style="color:white;margin:0;text-align:center;">Hubungan Harga Produk dan Biaya Pengiriman</h4>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    dataset_key = dataset_version(order_items_dataset)
+    correlation = calculate_price_freight_correlation(order_items_dataset, dataset_key)
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        mode = st.radio(
+            "Mode tampilan",
+            ["Sampel titik", "Kepadatan"],
+            horizontal=True,
+            key="correlation_mode",
+            help="Sampel titik: maksimal {:,} titik berstrata. Kepadatan: histogram 2D seluruh data.".format(MAX_SCATTER_POINTS)
+        )
+    with col2:
+        method = st.radio(
+            "Garis tren",
+            TRENDLINE_METHODS,
+            horizontal=True,
+            key="correlation_trendline",
+            help="Garis tren dihitung dari seluruh data yang dikelompokkan ke bin kuantil harga."
+        )
+    
+    trendline = cached_trendline(order_items_dataset, dataset_key, 'price', 'freight_value', method=method)
+    
+    if mode == "Kepadatan":
+        grid = cached_density_grid(order_items_dataset, dataset_key, 'price', 'freight_value')
+        fig_corr = cached_figure(create_correlation_density, grid, correlation, trendline, method)
+        caption = f"{grid['overflow']:,} item di atas persentil 99.5 tidak ditampilkan di grid."
+    else:
+        sample_df = cached_stratified_sample(order_items_dataset, dataset_key, 'price')
+        fig_corr = cached_figure(create_correlation_scatter, sample_df, correlation, trendline, method)
+        caption = f"Menampilkan {len(sample_df):,} dari {len(order_items_dataset):,} item (sampel berstrata, seed tetap)."
+    
     st.plotly_chart(fig_corr, use_container_width=True)
+    st.caption(caption)
     
     st.markdown(f"""
     <div style="background-color:#f8f9fa;padding:15px;border-radius:10px;border-left:4px solid {BLUE_PALETTE[0]};margin-top:20px;">
@@ -486,47 +520,53 @@ def show_correlation_analysis(order_items_dataset):
     </div>
     """, unsafe_allow_html=True)
 
-def show_shipping_distribution(order_items_dataset):
+def create_shipping_box_chart(stats, outliers):
     """
-    Menampilkan distribusi biaya pengiriman berdasarkan kelompok harga.
+    Membuat box plot biaya pengiriman per kelompok harga dari statistik yang sudah
+    dihitung, ditambah outlier terbatas. Ukuran figure tidak bergantung pada
+    jumlah item pesanan.
     
     Parameters:
-        order_items_dataset (pd.DataFrame): Data item pesanan
+        stats (pd.DataFrame): Statistik per kelompok dari box_summary
+        outliers (pd.DataFrame): Outlier terpilih per kelompok
+        
+    Returns:
+        plotly.graph_objects.Figure: Figure Plotly yang sudah dikonfigurasi
     """
-    st.markdown(f"""
-    <div style="background-color:{BLUE_PALETTE[0]};padding:15px;border-radius:10px;margin-bottom:20px;box-shadow:0 4px 6px rgba(0,0,0,0.1);">
-        <h4 style="color:white;margin:0;text-align:center;">Distribusi Biaya Pengiriman Berdasarkan Kelompok Harga</h4>
-    </div>
-    """, unsafe_allow_html=True)
-
-    order_items_dataset['price_group'] = pd.qcut(
-        order_items_dataset['price'],
-        q=4,
-        labels=['Murah', 'Sedang', 'Mahal', 'Sangat Mahal']
-    )
-
-    order_items_dataset['price_group'] = pd.Categorical(
-        order_items_dataset['price_group'],
-        categories=['Murah', 'Sedang', 'Mahal', 'Sangat Mahal'],
-        ordered=True
-    )
-
+    import plotly.graph_objects as go
+    
     color_sequence = [BLUE_PALETTE[1], BLUE_PALETTE[2], BLUE_PALETTE[3], BLUE_PALETTE[4]]
-
-    fig_box = px.box(
-        order_items_dataset,
-        x='price_group',
-        y='freight_value',
-        color='price_group',
-        color_discrete_sequence=color_sequence,
-        points='all',
-        hover_data=['price'],
-        labels={
-            'price_group': 'Kelompok Harga',
-            'freight_value': 'Biaya Pengiriman (Rp)',
-            'price': 'Harga Produk (Rp)'
-        }
-    )
+    
+    fig_box = go.Figure()
+    for _, row in stats.iterrows():
+        color = color_sequence[row['group']]
+        fig_box.add_trace(go.Box(
+            x=[row['label']],
+            q1=[row['q1']],
+            median=[row['median']],
+            q3=[row['q3']],
+            lowerfence=[row['lowerfence']],
+            upperfence=[row['upperfence']],
+            mean=[row['mean']],
+            name=row['label'],
+            marker_color=color,
+            boxpoints=False,
+            hoverinfo='y'
+        ))
+        group_outliers = outliers[outliers['group'] == row['group']]
+        fig_box.add_trace(go.Scatter(
+            x=group_outliers['label'],
+            y=group_outliers['value'],
+            customdata=group_outliers[['extra']],
+            mode='markers',
+            name=row['label'],
+            marker=dict(color=color, size=5, line=dict(width=0.5, color='DarkSlateGrey')),
+            hovertemplate="<br>".join([
+                "Kelompok: %{x}",
+                "Biaya Pengiriman: Rp%{y:,.2f}",
+                "Harga Produk: Rp%{customdata[0]:,.2f}"
+            ]) + "<extra></extra>"
+        ))
     
     fig_box.update_layout(
         xaxis_title="<b>Kelompok Harga</b>",
@@ -540,19 +580,29 @@ def show_shipping_distribution(order_items_dataset):
         boxgroupgap=0.3,
         xaxis=dict(
             categoryorder='array',
-            categoryarray=['Murah', 'Sedang', 'Mahal', 'Sangat Mahal']
+            categoryarray=PRICE_GROUP_LABELS
         )
     )
+    return fig_box
+
+def show_shipping_distribution(order_items_dataset):
+    """
+    Menampilkan distribusi biaya pengiriman berdasarkan kelompok harga.
     
-    fig_box.update_traces(
-        hovertemplate="<br>".join([
-            "Kelompok: %{x}",
-            "Biaya Pengiriman: Rp%{y:,.2f}",
-            "Harga Produk: Rp%{customdata[0]:,.2f}"
-        ])
-    )
+    Parameters:
+        order_items_dataset (pd.DataFrame): Data item pesanan
+    """
+    st.markdown(f"""
+    <div style="background-color:{BLUE_PALETTE[0]};padding:15px;border-radius:10px;margin-bottom:20px;box-shadow:0 4px 6px rgba(0,0,0,0.1);">
+        <h4 style="color:white;margin:0;text-align:center;">Distribusi Biaya Pengiriman Berdasarkan Kelompok Harga</h4>
+    </div>
+    """, unsafe_allow_html=True)
+
+    stats, outliers = cached_freight_box_summary(order_items_dataset, dataset_version(order_items_dataset))
+    fig_box = cached_figure(create_shipping_box_chart, stats, outliers)
     
     st.plotly_chart(fig_box, use_container_width=True)
+    st.caption(f"Titik menampilkan maksimal {MAX_OUTLIERS_PER_GROUP} outlier paling ekstrem di tiap sisi pagar per kelompok.")
 
     st.markdown("""
         <div style="background-color:#f8f9fa;padding:15px;border-radius:10px;border-left:4px solid {};margin-top:20px;">
@@ -566,6 +616,77 @@ def show_shipping_distribution(order_items_dataset):
         </div>
     """.format(BLUE_PALETTE[0], BLUE_PALETTE[0]), unsafe_allow_html=True)
 
+def create_shipping_ratio_chart(histogram, box_stats):
+    """
+    Membuat histogram rasio ongkir dari bin yang dihitung di server, dengan bucket
+    overflow untuk rasio di atas rentang dan box plot marginal dari statistik ringkas.
+    
+    Parameters:
+        histogram (dict): Hasil histogram_bins
+        box_stats (pd.Series): Statistik box plot (q1, median, q3, pagar, mean)
+        
+    Returns:
+        plotly.graph_objects.Figure: Figure Plotly yang sudah dikonfigurasi
+    """
+    import plotly.graph_objects as go
+    from plotly.subplots import make_subplots
+    
+    edges = histogram['edges']
+    width = edges[1] - edges[0]
+    
+    fig = make_subplots(rows=2, cols=1, shared_xaxes=True, row_heights=[0.2, 0.8], vertical_spacing=0.03)
+    
+    fig.add_trace(go.Box(
+        y=['Rasio'],
+        q1=[box_stats['q1']],
+        median=[box_stats['median']],
+        q3=[box_stats['q3']],
+        lowerfence=[box_stats['lowerfence']],
+        upperfence=[box_stats['upperfence']],
+        mean=[box_stats['mean']],
+        orientation='h',
+        marker_color=YELLOW_PALETTE[1],
+        boxpoints=False,
+        hoverinfo='x',
+        name=''
+    ), row=1, col=1)
+    
+    fig.add_trace(go.Bar(
+        x=(edges[:-1] + edges[1:]) / 2,
+        y=histogram['counts'],
+        width=width,
+        marker=dict(color=YELLOW_PALETTE[1], line=dict(width=0.5, color='DarkSlateGrey')),
+        opacity=0.8,
+        customdata=np.column_stack([edges[:-1], edges[1:]]),
+        hovertemplate='Rasio: %{customdata[0]:.2f}–%{customdata[1]:.2f}<br>%{y:,} produk<extra></extra>'
+    ), row=2, col=1)
+    
+    fig.add_trace(go.Bar(
+        x=[edges[-1] + width * 2],
+        y=[histogram['overflow']],
+        width=width * 2,
+        marker=dict(color=BLUE_PALETTE[3], line=dict(width=0.5, color='DarkSlateGrey')),
+        hovertemplate=f'Rasio > {edges[-1]:g}<br>%{{y:,}} produk<extra></extra>'
+    ), row=2, col=1)
+    
+    fig.update_layout(
+        plot_bgcolor='white',
+        paper_bgcolor='white',
+        font=dict(family="Arial", size=12),
+        margin=dict(l=20, r=20, t=40, b=20),
+        showlegend=False,
+        bargap=0
+    )
+    fig.update_xaxes(range=[edges[0], edges[-1] + width * 3.5], row=1, col=1)
+    fig.update_xaxes(title_text="<b>Rasio (Biaya Pengiriman/Harga)</b>", range=[edges[0], edges[-1] + width * 3.5], row=2, col=1)
+    fig.update_yaxes(showticklabels=False, row=1, col=1)
+    fig.update_yaxes(title_text="<b>Jumlah Produk</b>", row=2, col=1)
+    fig.add_annotation(
+        x=edges[-1] + width * 2, y=histogram['overflow'], text=f"> {edges[-1]:g}",
+        showarrow=False, yshift=10, row=2, col=1
+    )
+    return fig
+
 def show_shipping_ratio_analysis(order_items_dataset):
     """
     Menampilkan analisis rasio biaya pengiriman terhadap harga produk.
@@ -579,33 +700,13 @@ def show_shipping_ratio_analysis(order_items_dataset):
     </div>
     """, unsafe_allow_html=True)
     
-    order_items_dataset['shipping_ratio'] = order_items_dataset['freight_value'] / order_items_dataset['price']
-    
-    fig_hist = px.histogram(
-        order_items_dataset,
-        x='shipping_ratio',
-        nbins=150,
-        color_discrete_sequence=[YELLOW_PALETTE[1]],
-        marginal='box',
-        opacity=0.8,
-        labels={
-            'shipping_ratio': 'Rasio (Biaya Pengiriman/Harga)',
-            'count': 'Jumlah Produk'
-        }
-    )
-    fig_hist.update_layout(
-        plot_bgcolor='white',
-        paper_bgcolor='white',
-        font=dict(family="Arial", size=12),
-        margin=dict(l=20, r=20, t=40, b=20),
-        xaxis_title="<b>Rasio (Biaya Pengiriman/Harga)</b>",
-        yaxis_title="<b>Jumlah Produk</b>",
-        xaxis_range=[0, 2]
-    )
-    fig_hist.update_traces(
-        marker=dict(line=dict(width=0.5, color='DarkSlateGrey'))
-    )
+    dataset_key = dataset_version(order_items_dataset)
+    histogram = cached_feature_histogram(order_items_dataset, dataset_key, 'shipping_ratio', RATIO_BINS, RATIO_RANGE)
+    box_stats, _ = cached_feature_box_summary(order_items_dataset, dataset_key, 'shipping_ratio')
+    fig_hist = cached_figure(create_shipping_ratio_chart, histogram, box_stats.iloc[0])
     st.plotly_chart(fig_hist, use_container_width=True)
+    if histogram['missing']:
+        st.caption(f"{histogram['missing']:,} item dengan harga nol tidak memiliki rasio dan tidak ditampilkan.")
     
     st.markdown(f"""
         <div style="background-color:#f8f9fa;padding:15px;border-radius:10px;border-left:4px solid {BLUE_PALETTE[0]};margin-top:20px;">
@@ -620,25 +721,156 @@ def show_shipping_ratio_analysis(order_items_dataset):
         </div>
     """, unsafe_allow_html=True)
 
-def app():
-    # Menerapkan tema kustom
-    local_css()
+def create_freight_weight_chart(weight_curve):
+    """
+    Membuat grafik rata-rata biaya pengiriman per bin berat tertagih.
+    
+    Parameters:
+        weight_curve (pd.DataFrame): Kolom weight_kg, items, dan mean_freight
+        
+    Returns:
+        plotly.graph_objects.Figure: Figure Plotly yang sudah dikonfigurasi
+    """
+    import plotly.graph_objects as go
+    
+    fig = go.Figure(go.Scatter(
+        x=weight_curve['weight_kg'],
+        y=weight_curve['mean_freight'],
+        mode='lines+markers',
+        line=dict(color=BLUE_PALETTE[0], width=2),
+        marker=dict(size=5, color=YELLOW_PALETTE[0]),
+        customdata=weight_curve['items'],
+        hovertemplate='Berat tertagih ≥ %{x:.1f} kg<br>Rata-rata ongkir: %{y:.2f}<br>%{customdata:,} item<extra></extra>'
+    ))
+    fig.update_layout(
+        plot_bgcolor='white',
+        paper_bgcolor='white',
+        font=dict(family="Arial", size=12),
+        margin=dict(l=20, r=20, t=40, b=20),
+        xaxis_title="<b>Berat Tertagih (kg)</b>",
+        yaxis_title="<b>Rata-rata Biaya Pengiriman</b>"
+    )
+    return fig
 
-    # Header utama dengan gradient
-    st.markdown("""
-    <div style='background: linear-gradient(90deg, #1a5fb4, #3584e4); padding: 15px; border-radius: 10px; margin-bottom: 25px;'>
-        <h1 style='color: white; margin: 0;'>📊 Exploratory Data Analysis</h1>
-    </div>
-    """, unsafe_allow_html=True)
+def create_state_coefficient_chart(states):
+    """
+    Membuat grafik koefisien regresi ongkir per kg (berat aktual dan volumetrik)
+    untuk setiap negara bagian penjual.
+    
+    Parameters:
+        states (pd.DataFrame): Hasil regresi per negara bagian dari load_freight_drivers
+        
+    Returns:
+        plotly.graph_objects.Figure: Figure Plotly yang sudah dikonfigurasi
+    """
+    import plotly.graph_objects as go
+    
+    customdata = np.column_stack([states['r2'], states['items']])
+    fig = go.Figure()
+    for column, name, color in [
+        ('per_kg_weight', 'Per kg berat aktual', BLUE_PALETTE[0]),
+        ('per_kg_volumetric', 'Per kg berat volumetrik', YELLOW_PALETTE[0]),
+    ]:
+        fig.add_trace(go.Bar(
+            x=states.index,
+            y=states[column],
+            name=name,
+            marker_color=color,
+            customdata=customdata,
+            hovertemplate='%{x}: %{y:.2f}<br>R²: %{customdata[0]:.2f}<br>%{customdata[1]:,} item<extra>' + name + '</extra>'
+        ))
+    fig.update_layout(
+        barmode='group',
+        plot_bgcolor='white',
+        paper_bgcolor='white',
+        font=dict(family="Arial", size=12),
+        margin=dict(l=20, r=20, t=40, b=20),
+        legend=dict(orientation='h', yanchor='bottom', y=1.02, xanchor='right', x=1),
+        xaxis_title="<b>Negara Bagian Penjual</b>",
+        yaxis_title="<b>Tambahan Ongkir per kg</b>"
+    )
+    return fig
 
-    # Muat dataset
-    payments_df, orders_dataset = load_payments_data()
-    order_items_dataset = load_order_items()
+def show_freight_drivers():
+    """
+    Menampilkan analisis faktor penentu ongkir: berat aktual, berat volumetrik,
+    dan lokasi penjual. Join item pesanan dengan produk dan penjual serta regresi
+    per negara bagian dihitung sekali per versi dataset dan diambil dari cache.
+    """
+    st.subheader('🚚 Faktor Penentu Ongkir: Berat dan Lokasi Penjual')
+    
+    try:
+        drivers = load_freight_drivers()
+    except (FileNotFoundError, KeyError) as e:
+        st.info(f"ℹ️ Analisis ini membutuhkan dataset produk dan penjual: {e}")
+        return
+    
+    if not drivers['rows']:
+        st.warning("⚠️ Tidak ada item pesanan dengan data produk dan penjual yang lengkap.")
+        return
+    
+    overall = drivers['overall']
+    col1, col2, col3 = st.columns(3)
+    col1.metric("Tambahan ongkir per kg berat", f"{overall['per_kg_weight']:.2f}")
+    col2.metric("Tambahan ongkir per kg volumetrik", f"{overall['per_kg_volumetric']:.2f}")
+    col3.metric("R² (seluruh item)", f"{overall['r2']:.2f}")
+    
+    fig_curve = cached_figure(create_freight_weight_chart, drivers['weight_curve'])
+    st.plotly_chart(fig_curve, use_container_width=True)
+    st.caption(
+        f"Berat tertagih = maksimum berat aktual dan berat volumetrik (P x T x L / {VOLUMETRIC_DIVISOR:,} cm³). "
+        f"{drivers['volumetric_share']:.0%} dari {drivers['rows']:,} item memiliki berat volumetrik di atas berat aktualnya."
+    )
+    
+    states = drivers['states']
+    fig_states = cached_figure(create_state_coefficient_chart, states)
+    st.plotly_chart(fig_states, use_container_width=True)
+    
+    st.dataframe(
+        states.rename(columns={
+            'items': 'Jumlah Item',
+            'mean_freight': 'Rata-rata Ongkir',
+            'intercept': 'Intercept',
+            'per_kg_weight': 'Per kg Berat',
+            'per_kg_volumetric': 'Per kg Volumetrik',
+            'r2': 'R²'
+        }).style.format({
+            'Jumlah Item': '{:,}',
+            'Rata-rata Ongkir': '{:.2f}',
+            'Intercept': '{:.2f}',
+            'Per kg Berat': '{:.2f}',
+            'Per kg Volumetrik': '{:.2f}',
+            'R²': '{:.2f}'
+        }, na_rep='').background_gradient(cmap='Blues', subset=['R²']),
+        use_container_width=True
+    )
+    
+    best = states['r2'].idxmax() if states['r2'].notna().any() else None
+    st.markdown(f"""
+        <div style="background-color:#f8f9fa;padding:15px;border-radius:10px;border-left:4px solid {BLUE_PALETTE[0]};margin-top:20px;">
+            <h5 style="color:{BLUE_PALETTE[0]};margin-top:0;">📊 Insights:</h5>
+            <ul style="margin-bottom:0;">
+                <li>Berat aktual dan berat volumetrik bersama-sama menjelaskan <b>{overall['r2']:.0%}</b> variasi ongkir seluruh item.</li>
+                <li>Intercept regresi (ongkir dasar) sebesar <b>{overall['intercept']:.2f}</b>, tambahan per kg berat <b>{overall['per_kg_weight']:.2f}</b>.</li>
+                {f"<li>Berat paling menentukan ongkir untuk penjual di <b>{best}</b> (R² {states.loc[best, 'r2']:.2f}); perbedaan koefisien antar negara bagian menunjukkan pengaruh lokasi pengiriman.</li>" if best is not None else ""}
+            </ul>
+        </div>
+    """, unsafe_allow_html=True)
 
+@st.fragment
+def show_payment_trends(payments_rollup, min_date, max_date):
+    """
+    Menampilkan filter rentang tanggal, tabel statistik bulanan, dan grafik tren
+    pembayaran sebagai fragment: mengubah tanggal hanya menjalankan ulang bagian
+    ini, tanpa memuat ulang data atau merender analisis item pesanan.
+    
+    Parameters:
+        payments_rollup (dict): Ringkasan harian pembayaran
+        min_date (datetime.date): Tanggal paling awal data
+        max_date (datetime.date): Tanggal paling akhir data
+    """
     # Date range selector - dipindahkan ke bagian utama
     st.subheader("📅 Filter Rentang Tanggal")
-    min_date = pd.to_datetime(orders_dataset['order_purchase_timestamp']).min().date()
-    max_date = pd.to_datetime(orders_dataset['order_purchase_timestamp']).max().date()
 
     col1, col2 = st.columns(2)
     with col1:
@@ -661,22 +893,18 @@ def app():
     # Validate date range
     if start_date > end_date:
         st.error("Error: Tanggal akhir harus setelah tanggal mulai.")
-        st.stop()
+        return
 
-    # Preprocessing data pembayaran dengan filter tanggal
-    filtered_df = preprocess_payments_data(
-        payments_df, 
-        orders_dataset,
+    # Hitung statistik bulanan dari ringkasan harian dengan filter tanggal
+    monthly_stats = calculate_monthly_stats(
+        payments_rollup,
         start_date=start_date,
         end_date=end_date
     )
 
-    if filtered_df.empty:
+    if monthly_stats.empty:
         st.warning("⚠️ Tidak ada data transaksi untuk rentang tanggal yang dipilih.")
-        st.stop()
-
-    # Hitung statistik bulanan
-    monthly_stats = calculate_monthly_stats(filtered_df)
+        return
 
     # Tampilkan periode yang dipilih
     st.markdown(f"""
@@ -704,9 +932,25 @@ def app():
 
     # Tampilkan visualisasi tren pembayaran
     st.subheader('📊 Tren Total Pembayaran dan Jumlah Transaksi per Bulan')
-    fig = create_payment_trend_chart(monthly_stats)
+    # Satu figure per rentang tanggal: cukup di cache proses, tidak ditulis ke cache disk
+    fig = cached_figure(create_payment_trend_chart, monthly_stats, persist=False)
     st.plotly_chart(fig, use_container_width=True)
 
+def app():
+    # Header utama dengan gradient
+    st.markdown("""
+    <div style='background: linear-gradient(90deg, #1a5fb4, #3584e4); padding: 15px; border-radius: 10px; margin-bottom: 25px;'>
+        <h1 style='color: white; margin: 0;'>📊 Exploratory Data Analysis</h1>
+    </div>
+    """, unsafe_allow_html=True)
+
+    # Muat dataset
+    payments_rollup, (min_date, max_date) = load_payments_data()
+    order_items_dataset = load_order_items()
+
+    # Bagian yang bergantung pada tanggal dirender ulang sendiri (fragment)
+    show_payment_trends(payments_rollup, min_date, max_date)
+
     # Tampilkan insight utama
     st.subheader('🔍 Insight Utama')
     show_key_insights()
@@ -714,5 +958,31 @@ def app():
     # Tampilkan analisis harga dan biaya pengiriman
     show_price_shipping_analysis(order_items_dataset)
 
+    # Tampilkan faktor penentu ongkir (berat dan lokasi penjual)
+    show_freight_drivers()
+
+    with st.expander("⚙️ Statistik cache"):
+        cache_stats = figure_cache_stats()
+        st.caption(
+            f"Cache figure - Hit: {cache_stats['hits']:,} · Miss: {cache_stats['misses']:,} · "
+            f"Dibuang: {cache_stats['evictions']:,} · {cache_stats['entries']} figure "
+            f"({cache_stats['bytes'] / 1024:,.0f} KB)"
+        )
+        disk_stats = disk_cache_stats()
+        st.caption(
+            f"Cache disk bersama - Hit: {disk_stats['hits']:,} · Miss: {disk_stats['misses']:,} · "
+            f"Dibuang: {disk_stats['evictions']:,} · {disk_stats['entries']} entri "
+            f"({disk_stats['bytes'] / 1024 / 1024:,.1f} MB)"
+        )
+        tables = loaded_datasets()
+        st.caption(
+            f"Dataset di memori: {len(tables)} tabel · "
+            f"{sum(nbytes for _, _, nbytes in tables) / 1024 / 1024:,.1f} MB + kosakata ID "
+            f"{vocabulary_bytes() / 1024 / 1024:,.1f} MB dari anggaran "
+            f"{MEMORY_BUDGET_BYTES / 1024 / 1024:,.0f} MB"
+        )
+        for name, columns, nbytes in reversed(tables):
+            st.caption(f"• {name} ({', '.join(columns) if columns else 'semua kolom'}) - {nbytes / 1024 / 1024:,.2f} MB")
+
 if __name__ == "__main__":
     app()
\ No newline at end of file
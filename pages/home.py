@@ -1,125 +1,84 @@
 import streamlit as st
-from PIL import Image
+from utils.theme import register_page_css
 
-def local_css():
-    """
-    Menerapkan tema kustom.
-    
-    Fungsi ini menambahkan CSS kustom untuk:
-    - Header dan judul
-    - Kartu profil dan penelitian
-    - Tombol dan elemen UI lainnya
-    - Warna aksen dan border
-    """
-    st.markdown("""
-    <style>
-        .header {
-            background: linear-gradient(135deg, #1e3c72 0%, #2a5298 100%);
-            color: white;
-            padding: 2rem;
-            border-radius: 10px;
-            box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
-            margin-bottom: 2rem;
-        }
-        
-        .profile-card {
-            background-color: #ffffff;
-            border-radius: 15px;
-            padding: 2rem;
-            box-shadow: 0 4px 15px rgba(0, 0, 0, 0.1);
-            margin-bottom: 2rem;
-            display: flex;
-            align-items: center;
-            border: 2px solid #FFD700;
-        }
-        
-        .profile-img {
-            border-radius: 50%;
-            width: 150px;
-            height: 150px;
-            object-fit: cover;
-            margin-right: 2rem;
-            border: 5px solid #1e3c72;
-        }
-        
-        .research-card {
-            background-color: #f8f9fa;
-            border-radius: 15px;
-            padding: 1.5rem;
-            margin-bottom: 1.5rem;
-            border-left: 5px solid #FFD700;
-        }
-        
-        .research-card h3 {
-            color: #1e3c72;
-            margin-top: 0;
-        }
-        
-        .footer {
-            text-align: center;
-            margin-top: 2rem;
-            padding: 1rem;
-            color: #1e3c72;
-            border-top: 1px solid #FFD700;
-        }
-        
-        .ecommerce-bg {
-            background: linear-gradient(rgba(30, 60, 114, 0.8), rgba(30, 60, 114, 0.8)), 
-                        url('https://encrypted-tbn0.gstatic.com/images?q=tbn:ANd9GcTatmCOYtH1oyCaySYCRSdz8xdx18Gb2Araxw&s');
-            background-size: cover;
-            background-position: center;
-            padding: 3rem;
-            border-radius: 10px;
-            color: white;
-            text-shadow: 1px 1px 3px rgba(0,0,0,0.5);
-            margin-bottom: 2rem;
-        }
-        
-        .stButton>button {
-            background-color: #1a5fb4;
-            color: white;
-            border-radius: 5px;
-            padding: 12px 16px;
-            margin: 8px 0;
-            font-weight: bold;
-            cursor: pointer;
-            text-align: center;
-            box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
-            transition: all 0.3s ease;
-            border: none;
-            width: 100%;
-        }
-        
-        .stButton>button:hover {
-            background-color: #0d47a1;
-            color: white;
-            transform: scale(1.05);
-            box-shadow: 0 8px 12px rgba(0, 0, 0, 0.2);
-        }
-        
-        .stButton>button:focus:not(:active) {
-            background-color: #1a5fb4;
-            color: white;
-            box-shadow: 0 4px 10px rgba(0, 0, 0, 0.2);
-        }
-        
-        .highlight-blue {
-            color: #1e3c72;
-            font-weight: bold;
-        }
-        
-        .highlight-yellow {
-            color: #FFD700;
-            font-weight: bold;
-        }
-        
-        .border-yellow {
-            border: 1px solid #FFD700;
-            border-radius: 5px;
-            padding: 10px;
-        }
-        </style>
-    """, unsafe_allow_html=True)
+# Aturan CSS khusus halaman Home (header, kartu profil dan penelitian, footer)
+PAGE_CSS = """
+    .header {
+        background: linear-gradient(135deg, #1e3c72 0%, #2a5298 100%);
+        color: white;
+        padding: 2rem;
+        border-radius: 10px;
+        box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
+        margin-bottom: 2rem;
+    }
+
+    .profile-card {
+        background-color: #ffffff;
+        border-radius: 15px;
+        padding: 2rem;
+        box-shadow: 0 4px 15px rgba(0, 0, 0, 0.1);
+        margin-bottom: 2rem;
+        display: flex;
+        align-items: center;
+        border: 2px solid #FFD700;
+    }
+
+    .profile-img {
+        border-radius: 50%;
+        width: 150px;
+        height: 150px;
+        object-fit: cover;
+        margin-right: 2rem;
+        border: 5px solid #1e3c72;
+    }
+
+    .research-card {
+        background-color: #f8f9fa;
+        border-radius: 15px;
+        padding: 1.5rem;
+        margin-bottom: 1.5rem;
+        border-left: 5px solid #FFD700;
+    }
+
+    .research-card h3 {
+        color: #1e3c72;
+        margin-top: 0;
+    }
+
+    .footer {
+        text-align: center;
+        margin-top: 2rem;
+        padding: 1rem;
+        color: #1e3c72;
+        border-top: 1px solid #FFD700;
+    }
+
+    .ecommerce-bg {
+        background: linear-gradient(rgba(30, 60, 114, 0.8), rgba(30, 60, 114, 0.8)),
+                    url('https://encrypted-tbn0.gstatic.com/images?q=tbn:ANd9GcTatmCOYtH1oyCaySYCRSdz8xdx18Gb2Araxw&s');
+        background-size: cover;
+        background-position: center;
+        padding: 3rem;
+        border-radius: 10px;
+        color: white;
+        text-shadow: 1px 1px 3px rgba(0,0,0,0.5);
+        margin-bottom: 2rem;
+    }
+
+    .stButton>button:focus:not(:active) {
+        background-color: #1a5fb4;
+        color: white;
+        box-shadow: 0 4px 10px rgba(0, 0, 0, 0.2);
+    }
+
+    .border-yellow {
+        border: 1px solid #FFD700;
+        border-radius: 5px;
+        padding: 10px;
+    }
+"""
+
+register_page_css('home', PAGE_CSS)
 
 def show_header():
     """
@@ -136,6 +95,8 @@ def show_profile_section():
     """
     Menampilkan bagian profil pengguna dengan foto dan informasi kontak.
     """
+    from PIL import Image
+    
     with st.container():
         col1, col2 = st.columns([1, 4])
         
@@ -196,10 +157,6 @@ def show_footer():
     """, unsafe_allow_html=True)
 
 def app():
-
-    # Menerapkan tema kustom
-    local_css()
-    
     # Menampilkan header
     show_header()
     
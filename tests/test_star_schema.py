@@ -0,0 +1,37 @@
+import os
+import pytest
+from utils import data_loader
+from utils.star_schema import join_columns
+
+ORDER_ITEMS = (
+    'order_id,order_item_id,product_id,seller_id,shipping_limit_date,price,freight_value\n'
+    'o1,1,p1,s1,2018-01-01 10:00:00,10.0,1.5\n'
+    'o2,1,p2,s1,2018-01-02 10:00:00,20.0,2.5\n'
+)
+PRODUCTS = 'product_id,product_category_name,product_weight_g\np1,perfumaria,100\np2,bebes,200\np3,bebes,300\n'
+SELLERS = 'seller_id,seller_zip_code_prefix,seller_city,seller_state\ns1,13023,campinas,SP\n'
+
+@pytest.fixture
+def datasets(tmp_path, monkeypatch):
+    (tmp_path / 'order_items_dataset.csv').write_text(ORDER_ITEMS)
+    (tmp_path / 'products_dataset.csv').write_text(PRODUCTS)
+    (tmp_path / 'sellers_dataset.csv').write_text(SELLERS)
+    monkeypatch.setattr(data_loader, 'DATASETS_DIR', tmp_path)
+    return tmp_path
+
+def test_join_after_fact_table_changes_with_dimension_unchanged(datasets):
+    columns = ['price', 'product_weight_g', 'seller_state']
+    before = join_columns('order_items_dataset', columns)
+    assert before['product_weight_g'].tolist() == [100, 200]
+
+    # Hanya tabel fakta yang berubah; kosakata product_id ikut berubah karena p3 baru muncul di sana
+    path = datasets / 'order_items_dataset.csv'
+    with open(path, 'a') as f:
+        f.write('o3,1,p3,s1,2018-01-03 10:00:00,30.0,3.5\n')
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    after = join_columns('order_items_dataset', columns)
+    assert after['price'].tolist() == [10.0, 20.0, 30.0]
+    assert after['product_weight_g'].tolist() == [100, 200, 300]
+    assert after['seller_state'].tolist() == ['SP', 'SP', 'SP']
@@ -0,0 +1,3 @@
+"""
+Modul pendukung bersama untuk halaman-halaman aplikasi Streamlit.
+"""
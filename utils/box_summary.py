@@ -0,0 +1,97 @@
+import streamlit as st
+import pandas as pd
+import numpy as np
+from utils.features import PRICE_GROUP_LABELS, derived_features
+
+# Jumlah outlier maksimum per kelompok (di atas dan di bawah pagar) yang dikirim ke browser
+MAX_OUTLIERS_PER_GROUP = 200
+
+def box_summary(values, groups, labels, extra=None, top_k=MAX_OUTLIERS_PER_GROUP):
+    """
+    Menghitung statistik box plot per kelompok (kuartil, pagar Tukey 1.5 IQR,
+    rata-rata) serta outlier paling ekstrem per kelompok.
+
+    Parameters:
+        values (pd.Series): Nilai sumbu y
+        groups (np.ndarray): Kode kelompok 0..len(labels)-1 per baris (-1 diabaikan)
+        labels (list): Nama kelompok sesuai kode
+        extra (pd.Series): Kolom tambahan yang ikut disimpan untuk outlier (opsional)
+        top_k (int): Batas outlier per kelompok di tiap sisi pagar
+
+    Returns:
+        tuple: (stats, outliers) - DataFrame statistik per kelompok dan DataFrame
+        outlier dengan kolom group, value, dan extra
+    """
+    frame = pd.DataFrame({'group': groups, 'value': values.to_numpy('float64')})
+    if extra is not None:
+        frame['extra'] = extra.to_numpy()
+    frame = frame[(frame['group'] >= 0) & frame['value'].notna()]
+
+    grouped = frame.groupby('group')['value']
+    quartiles = grouped.quantile([0.25, 0.5, 0.75]).unstack()
+    stats = pd.DataFrame({
+        'q1': quartiles[0.25],
+        'median': quartiles[0.5],
+        'q3': quartiles[0.75],
+        'mean': grouped.mean(),
+        'count': grouped.size(),
+    })
+    iqr = stats['q3'] - stats['q1']
+    low_limit = frame['group'].map(stats['q1'] - 1.5 * iqr)
+    high_limit = frame['group'].map(stats['q3'] + 1.5 * iqr)
+    inside = frame['value'].between(low_limit, high_limit)
+
+    # Pagar (whisker) berhenti di nilai data terjauh yang masih di dalam batas
+    fences = frame[inside].groupby('group')['value'].agg(['min', 'max'])
+    stats['lowerfence'] = fences['min']
+    stats['upperfence'] = fences['max']
+    stats['label'] = [labels[code] for code in stats.index]
+
+    outside = frame[~inside]
+    above = outside[outside['value'] > high_limit[~inside]]
+    below = outside[outside['value'] < low_limit[~inside]]
+    outliers = pd.concat([
+        above.sort_values('value', ascending=False).groupby('group').head(top_k),
+        below.sort_values('value').groupby('group').head(top_k),
+    ])
+    outliers['label'] = [labels[code] for code in outliers['group']]
+    return stats.reset_index(), outliers.reset_index(drop=True)
+
+@st.cache_resource(show_spinner=False, max_entries=8)
+def cached_freight_box_summary(_order_items_dataset, dataset_key, top_k=MAX_OUTLIERS_PER_GROUP):
+    """
+    Statistik box plot biaya pengiriman per kelompok harga, sekali per versi dataset.
+
+    Parameters:
+        _order_items_dataset (pd.DataFrame): Data item pesanan (tidak di-hash)
+        dataset_key (tuple): Identitas versi dataset
+        top_k (int): Batas outlier per kelompok di tiap sisi pagar
+
+    Returns:
+        tuple: (stats, outliers) seperti box_summary
+    """
+    groups = derived_features(_order_items_dataset, ['price_group'], dataset_key)['price_group']
+    return box_summary(
+        _order_items_dataset['freight_value'],
+        groups.cat.codes.to_numpy(),
+        PRICE_GROUP_LABELS,
+        extra=_order_items_dataset['price'],
+        top_k=top_k
+    )
+
+@st.cache_resource(show_spinner=False, max_entries=8)
+def cached_feature_box_summary(_df, dataset_key, feature, top_k=0):
+    """
+    Statistik box plot satu kelompok untuk sebuah fitur turunan, sekali per versi dataset.
+
+    Parameters:
+        _df (pd.DataFrame): Data sumber (tidak di-hash)
+        dataset_key (tuple): Identitas versi dataset
+        feature (str): Nama fitur turunan
+        top_k (int): Batas outlier di tiap sisi pagar
+
+    Returns:
+        tuple: (stats, outliers) seperti box_summary
+    """
+    values = derived_features(_df, [feature], dataset_key)[feature]
+    return box_summary(values, np.zeros(len(values), dtype='int8'), [feature], top_k=top_k)
@@ -0,0 +1,235 @@
+import argparse
+import json
+import os
+import threading
+import pandas as pd
+from contextlib import contextmanager
+from pathlib import Path
+from utils.schemas import read_csv_typed
+from utils.shared_store import read_store, write_store
+
+try:
+    import fcntl
+except ImportError:
+    # Windows: konversi hanya diserialkan antar thread dalam satu proses
+    fcntl = None
+
+CACHE_DIRNAME = '.columnar'
+
+# Versi format sidecar; sidecar dengan versi lain dianggap usang dan dibuat ulang
+SCHEMA_VERSION = 4
+
+_path_locks = {}
+_path_locks_lock = threading.Lock()
+
+def schema_path(csv_path):
+    """
+    Mengembalikan path sidecar skema untuk sebuah file CSV.
+
+    Parameters:
+        csv_path (str/Path): Path file CSV sumber
+
+    Returns:
+        Path: Path file .schema.json di dalam folder cache kolumnar
+    """
+    csv_path = Path(csv_path)
+    return csv_path.parent / CACHE_DIRNAME / f"{csv_path.stem}.schema.json"
+
+def store_path(csv_path):
+    """
+    Mengembalikan path file Arrow IPC (store memory-mapped) untuk sebuah file CSV.
+
+    Parameters:
+        csv_path (str/Path): Path file CSV sumber
+
+    Returns:
+        Path: Path file .arrow di dalam folder cache kolumnar
+    """
+    csv_path = Path(csv_path)
+    return csv_path.parent / CACHE_DIRNAME / f"{csv_path.stem}.arrow"
+
+def read_schema(csv_path):
+    """
+    Membaca sidecar skema milik salinan kolumnar sebuah file CSV.
+
+    Parameters:
+        csv_path (str/Path): Path file CSV sumber
+
+    Returns:
+        dict: Isi sidecar skema, atau None jika belum ada
+    """
+    try:
+        with open(schema_path(csv_path), encoding='utf-8') as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+
+def is_fresh(csv_path):
+    """
+    Memeriksa apakah salinan kolumnar masih sesuai dengan file CSV sumber.
+
+    Parameters:
+        csv_path (str/Path): Path file CSV sumber
+
+    Returns:
+        bool: True jika store Arrow ada dan dibuat dari versi CSV yang sama
+        dengan format sidecar saat ini
+    """
+    schema = read_schema(csv_path)
+    if schema is None or schema.get('version') != SCHEMA_VERSION:
+        return False
+    if not store_path(csv_path).exists():
+        return False
+    stat = os.stat(csv_path)
+    source = schema.get('source', {})
+    return source.get('mtime_ns') == stat.st_mtime_ns and source.get('size') == stat.st_size
+
+def _atomic_write(path, write):
+    """
+    Menulis file melalui file sementara lalu os.replace agar pembaca tidak
+    pernah melihat file setengah jadi.
+    """
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        write(tmp_path)
+        os.replace(tmp_path, path)
+    finally:
+        if tmp_path.exists():
+            tmp_path.unlink()
+
+@contextmanager
+def _conversion_lock(csv_path):
+    """
+    Kunci eksklusif konversi sebuah file CSV, antar thread (sesi) maupun antar
+    proses (flock), sehingga store dan sidecar-nya selalu ditulis berpasangan.
+    """
+    lock_path = store_path(csv_path).with_suffix('.lock')
+    with _path_locks_lock:
+        thread_lock = _path_locks.setdefault(lock_path, threading.Lock())
+    with thread_lock, open(lock_path, 'a+b') as f:
+        if fcntl is not None:
+            fcntl.flock(f, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+def column_stats(df):
+    """
+    Menghitung metadata per kolom (jumlah nilai kosong, serta min/max untuk kolom
+    numerik dan tanggal) dalam bentuk yang dapat disimpan sebagai JSON.
+
+    Parameters:
+        df (pd.DataFrame): Data sumber
+
+    Returns:
+        dict: {kolom: {'kind', 'nulls', 'min', 'max'}}, dengan kind 'numeric',
+        'datetime', atau 'other'; tanggal disimpan sebagai string ISO
+    """
+    stats = {}
+    for col in df.columns:
+        series = df[col]
+        entry = {'kind': 'other', 'nulls': int(series.isna().sum()), 'min': None, 'max': None}
+        if pd.api.types.is_datetime64_any_dtype(series.dtype):
+            entry['kind'] = 'datetime'
+            if entry['nulls'] < len(series):
+                entry['min'], entry['max'] = series.min().isoformat(), series.max().isoformat()
+        elif pd.api.types.is_numeric_dtype(series.dtype) and not pd.api.types.is_bool_dtype(series.dtype):
+            entry['kind'] = 'numeric'
+            if entry['nulls'] < len(series):
+                entry['min'], entry['max'] = float(series.min()), float(series.max())
+        stats[col] = entry
+    return stats
+
+def convert_csv(csv_path, force=False):
+    """
+    Mengonversi file CSV menjadi store Arrow IPC bertipe untuk memory map
+    (lihat utils.shared_store), serta sidecar skema JSON yang juga mencatat
+    metadata per kolom (lihat column_stats).
+
+    Parameters:
+        csv_path (str/Path): Path file CSV sumber
+        force (bool): Konversi ulang walaupun salinan kolumnar masih segar
+
+    Returns:
+        Path: Path file .arrow hasil konversi
+    """
+    arrow_path = store_path(csv_path)
+    if not force and is_fresh(csv_path):
+        return arrow_path
+
+    arrow_path.parent.mkdir(exist_ok=True)
+    with _conversion_lock(csv_path):
+        # Thread atau proses lain mungkin sudah selesai mengonversi selama menunggu kunci
+        if not force and is_fresh(csv_path):
+            return arrow_path
+        _write_columnar(csv_path, arrow_path)
+    return arrow_path
+
+def _write_columnar(csv_path, arrow_path):
+    """
+    Membaca CSV lalu menulis store Arrow dan sidecar skemanya.
+    """
+    stat = os.stat(csv_path)
+    df = read_csv_typed(csv_path)
+    _atomic_write(arrow_path, lambda p: write_store(df, p))
+
+    schema = {
+        'version': SCHEMA_VERSION,
+        'source': {
+            'path': Path(csv_path).name,
+            'mtime_ns': stat.st_mtime_ns,
+            'size': stat.st_size,
+        },
+        'rows': len(df),
+        'columns': {col: str(dtype) for col, dtype in df.dtypes.items()},
+        'column_stats': column_stats(df),
+    }
+    _atomic_write(schema_path(csv_path), lambda p: p.write_text(json.dumps(schema, indent=2), encoding='utf-8'))
+
+def read_columnar(csv_path, columns=None):
+    """
+    Membaca salinan kolumnar sebuah file CSV, membuatnya terlebih dahulu jika
+    belum ada atau sudah usang. Data dibuka dari store Arrow yang di-memory-map
+    sehingga kolom numerik dipakai bersama oleh semua proses di host yang sama.
+
+    Parameters:
+        csv_path (str/Path): Path file CSV sumber
+        columns (list): Kolom yang dibaca (opsional, default semua kolom)
+
+    Returns:
+        pd.DataFrame: DataFrame read-only hasil proyeksi kolom
+    """
+    try:
+        convert_csv(csv_path)
+    except OSError:
+        # Folder dataset read-only: baca langsung dari CSV
+        return read_csv_typed(csv_path, usecols=columns)
+    return read_store(store_path(csv_path), columns=columns)
+
+def convert_folder(folder_path, force=False):
+    """
+    Mengonversi semua file CSV dalam sebuah folder menjadi store Arrow.
+
+    Parameters:
+        folder_path (str/Path): Folder berisi file CSV
+        force (bool): Konversi ulang semua file
+
+    Returns:
+        list: Daftar path file .arrow yang dihasilkan
+    """
+    return [convert_csv(path, force=force) for path in sorted(Path(folder_path).glob('*.csv'))]
+
+def main():
+    parser = argparse.ArgumentParser(description="Konversi dataset CSV menjadi store Arrow kolumnar.")
+    parser.add_argument('folder', nargs='?', default=str(Path(__file__).parent.parent / 'datasets'),
+                        help="Folder berisi file CSV (default: datasets/)")
+    parser.add_argument('--force', action='store_true', help="Konversi ulang walaupun cache masih segar")
+    args = parser.parse_args()
+
+    for arrow_path in convert_folder(args.folder, force=args.force):
+        print(f"✔ {arrow_path}")
+
+if __name__ == "__main__":
+    main()
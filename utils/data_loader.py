@@ -0,0 +1,204 @@
+import streamlit as st
+import csv
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from utils.columnar import read_columnar
+from utils.ids import intern_ids, is_id_column, vocabulary_bytes
+
+DATASETS_DIR = Path(__file__).parent.parent / 'datasets'
+
+# Batas cache dataset per proses: jumlah entri dan total memori (dapat diatur lewat environment)
+MAX_LOADED_DATASETS = int(os.environ.get('DATASET_CACHE_MAX_ENTRIES', 16))
+MEMORY_BUDGET_BYTES = int(os.environ.get('DATASET_CACHE_MEMORY_MB', 1024)) * 1024 * 1024
+
+# Jumlah byte awal file yang dibaca untuk memperkirakan jumlah baris
+ROW_ESTIMATE_SAMPLE_BYTES = 64 * 1024
+
+_loaded_tables = OrderedDict()
+_loaded_lock = threading.Lock()
+_key_locks = {}
+
+def dataset_path(name):
+    """
+    Mengembalikan path file CSV untuk nama dataset tertentu.
+
+    Parameters:
+        name (str): Nama dataset tanpa ekstensi, misalnya 'orders_dataset'
+
+    Returns:
+        Path: Path menuju file CSV di folder datasets
+    """
+    return DATASETS_DIR / f"{name}.csv"
+
+def file_fingerprint(path):
+    """
+    Membuat sidik jari file berdasarkan path, waktu modifikasi, dan ukuran.
+
+    Parameters:
+        path (str/Path): Path file
+
+    Returns:
+        tuple: (path, mtime_ns, size) yang berubah setiap kali file diubah
+
+    Raises:
+        FileNotFoundError: Jika file tidak ditemukan
+    """
+    stat = os.stat(path)
+    return str(Path(path).resolve()), stat.st_mtime_ns, stat.st_size
+
+def inspect_csv(path):
+    """
+    Membaca metadata file CSV tanpa memuat isinya: ukuran, header, dan perkiraan
+    jumlah baris dari rata-rata panjang baris pada potongan awal file.
+
+    Parameters:
+        path (str/Path): Path file CSV
+
+    Returns:
+        dict: name, path, size_bytes, columns, estimated_rows, dan exact_rows
+        (True jika seluruh file muat dalam sampel sehingga jumlah baris pasti)
+
+    Raises:
+        FileNotFoundError: Jika file tidak ditemukan
+    """
+    return _cached_inspect(*file_fingerprint(path))
+
+@st.cache_data(show_spinner=False, max_entries=256)
+def _cached_inspect(path, mtime_ns, size):
+    """
+    Metadata file CSV sekali per versi file.
+    """
+    with open(path, 'rb') as f:
+        sample = f.read(ROW_ESTIMATE_SAMPLE_BYTES)
+    header_end = sample.find(b'\n') + 1 or len(sample)
+    header = next(csv.reader([sample[:header_end].decode('utf-8-sig', errors='replace')]), [])
+    body = sample[header_end:]
+    exact = len(sample) == size
+    lines = body.count(b'\n') + (1 if exact and body and not body.endswith(b'\n') else 0)
+    if exact or not lines:
+        estimated_rows = lines
+    else:
+        estimated_rows = int((size - header_end) / (len(body) / lines))
+    return {
+        'name': Path(path).stem,
+        'path': path,
+        'size_bytes': size,
+        'columns': [col.strip() for col in header],
+        'estimated_rows': estimated_rows,
+        'exact_rows': exact,
+    }
+
+def _evict_tables():
+    """
+    Membuang dataset yang paling lama tidak dipakai hingga batas jumlah entri
+    dan anggaran memori terpenuhi. Kosakata ID ikut dihitung dalam anggaran.
+    Dataset terbaru selalu dipertahankan.
+    """
+    total = sum(nbytes for _, nbytes in _loaded_tables.values()) + vocabulary_bytes()
+    while len(_loaded_tables) > 1 and (len(_loaded_tables) > MAX_LOADED_DATASETS or total > MEMORY_BUDGET_BYTES):
+        _, (_, nbytes) = _loaded_tables.popitem(last=False)
+        total -= nbytes
+
+def id_vocabulary_keys(path, columns):
+    """
+    Mengembalikan sidik jari semua dataset sefolder yang memiliki kolom ID
+    tertentu, sebagai kunci kosakata global kolom tersebut. Kode ID sebuah tabel
+    berubah bila salah satu file ini berubah, walaupun tabel itu sendiri tetap.
+
+    Parameters:
+        path (str/Path): Path file CSV dataset
+        columns (list): Kolom dataset; kolom yang bukan ID diabaikan
+
+    Returns:
+        dict: {kolom ID: tuple sidik jari (path, mtime_ns, size)}
+    """
+    id_columns = [col for col in columns if is_id_column(col)]
+    if not id_columns:
+        return {}
+    sources = [inspect_csv(source) for source in sorted(Path(path).parent.glob('*.csv'))]
+    return {
+        col: tuple(file_fingerprint(meta['path']) for meta in sources if col in meta['columns'])
+        for col in id_columns
+    }
+
+def _load_table(path, mtime_ns, size, columns=None):
+    """
+    Membaca dataset dari salinan kolumnarnya (dibuat otomatis saat pertama kali,
+    kolom numerik di-memory-map) dengan proyeksi kolom opsional. Kolom ID diganti
+    kode int32 dari kosakata global (lihat utils.ids). Hasil disimpan dalam LRU per proses dengan
+    kunci (path, mtime_ns, size, columns, kunci kosakata) sehingga perubahan file
+    itu sendiri maupun file lain yang menyumbang kosakata ID-nya membatalkan
+    cache, dan dibatasi oleh MAX_LOADED_DATASETS serta MEMORY_BUDGET_BYTES.
+
+    DataFrame yang dikembalikan dipakai bersama oleh semua sesi dan larik
+    numeriknya read-only, jangan diubah in-place.
+    """
+    # Kode ID bergantung pada kosakata (file-file sefolder), jadi kuncinya ikut menentukan entri cache
+    vocabulary_keys = id_vocabulary_keys(path, columns or inspect_csv(path)['columns'])
+    key = (path, mtime_ns, size, columns, tuple(sorted(vocabulary_keys.items())))
+    with _loaded_lock:
+        if key in _loaded_tables:
+            _loaded_tables.move_to_end(key)
+            return _loaded_tables[key][0]
+        key_lock = _key_locks.setdefault(key, threading.Lock())
+
+    # Kunci per dataset: sesi lain yang meminta dataset yang sama menunggu, bukan membaca ulang
+    with key_lock:
+        with _loaded_lock:
+            if key in _loaded_tables:
+                _loaded_tables.move_to_end(key)
+                return _loaded_tables[key][0]
+        df = read_columnar(path, columns=list(columns) if columns else None)
+        df = intern_ids(df, vocabulary_keys)
+        df.attrs['fingerprint'] = (path, mtime_ns, size)
+        # Kolom yang di-memory-map tidak menambah memori proses, hanya page cache bersama
+        nbytes = int(df.memory_usage(deep=True).sum()) - df.attrs.get('mapped_bytes', 0)
+        with _loaded_lock:
+            _loaded_tables[key] = (df, nbytes)
+            _evict_tables()
+            _key_locks.pop(key, None)
+    return df
+
+def dataset_version(df):
+    """
+    Mengembalikan identitas versi dataset yang dimuat lewat load_dataset, untuk
+    dipakai sebagai kunci cache turunan (agregat, profil, grafik).
+
+    Parameters:
+        df (pd.DataFrame): DataFrame hasil load_dataset (atau salinannya)
+
+    Returns:
+        tuple: Sidik jari (path, mtime_ns, size) file sumber, atau None jika tidak diketahui
+    """
+    return df.attrs.get('fingerprint')
+
+def loaded_datasets():
+    """
+    Mengembalikan daftar dataset yang sedang berada di cache LRU.
+
+    Returns:
+        list: Tuple (nama, kolom, byte memori) dari yang paling lama hingga terbaru dipakai
+    """
+    with _loaded_lock:
+        return [(Path(key[0]).stem, key[3], nbytes) for key, (_, nbytes) in _loaded_tables.items()]
+
+def load_dataset(name_or_path, columns=None):
+    """
+    Memuat dataset dari cache proses, membaca ulang hanya jika file berubah.
+
+    Parameters:
+        name_or_path (str/Path): Nama dataset (misalnya 'orders_dataset') atau path file CSV
+        columns (list): Kolom yang dibutuhkan (opsional, default semua kolom)
+
+    Returns:
+        pd.DataFrame: DataFrame bersama yang bersifat read-only
+
+    Raises:
+        FileNotFoundError: Jika file dataset tidak ditemukan
+    """
+    path = Path(name_or_path)
+    if path.suffix != '.csv':
+        path = dataset_path(str(name_or_path))
+    return _load_table(*file_fingerprint(path), columns=tuple(columns) if columns else None)
@@ -0,0 +1,284 @@
+import hashlib
+import os
+import pickle
+import threading
+from contextlib import contextmanager
+from functools import lru_cache
+from importlib import metadata
+from pathlib import Path
+import numpy as np
+import pandas as pd
+
+try:
+    import fcntl
+except ImportError:
+    # Windows: tanpa kunci antar proses, penulisan tetap atomik lewat os.replace
+    fcntl = None
+
+# Lokasi dan batas ukuran cache hasil di disk, dipakai bersama oleh semua proses (dapat diatur lewat environment)
+RESULT_CACHE_DIR = Path(os.environ.get('RESULT_CACHE_DIR', Path(__file__).parent.parent / '.cache' / 'results'))
+RESULT_CACHE_MAX_BYTES = int(os.environ.get('RESULT_CACHE_MB', 512)) * 1024 * 1024
+
+# Naikkan saat format entri berubah; bersama hash kode aplikasi dan versi pustaka menjadi bagian setiap kunci
+CACHE_VERSION = 1
+
+# Pustaka yang versinya menentukan isi dan format hasil (pickle pandas, JSON figure Plotly)
+VERSIONED_PACKAGES = ('numpy', 'pandas', 'pyarrow', 'plotly')
+
+APP_DIR = Path(__file__).parent.parent
+
+# Jumlah penulisan di antara pemindaian ukuran penuh; di antaranya ukuran cache hanya diperkirakan
+EVICT_SCAN_INTERVAL = 256
+
+_MISSING = object()
+_counters = {'hits': 0, 'misses': 0, 'writes': 0, 'evictions': 0}
+_counters_lock = threading.Lock()
+
+# Perkiraan ukuran cache: hasil pemindaian terakhir ditambah entri yang ditulis proses ini sejak itu
+_size_estimate = {'bytes': None, 'writes': 0}
+_size_lock = threading.Lock()
+
+def _update_hash(digest, value):
+    """
+    Menambahkan isi sebuah nilai (DataFrame, Series, larik, dict, list, skalar)
+    ke digest secara rekursif.
+    """
+    if isinstance(value, pd.DataFrame):
+        digest.update(b'df')
+        digest.update(repr(list(value.columns)).encode())
+        digest.update(pd.util.hash_pandas_object(value, index=True).to_numpy().tobytes())
+    elif isinstance(value, pd.Series):
+        digest.update(b'series')
+        digest.update(repr(value.name).encode())
+        digest.update(pd.util.hash_pandas_object(value, index=True).to_numpy().tobytes())
+    elif isinstance(value, np.ndarray):
+        digest.update(f'array{value.dtype.str}{value.shape}'.encode())
+        digest.update(np.ascontiguousarray(value).tobytes())
+    elif isinstance(value, dict):
+        digest.update(b'dict')
+        for key in sorted(value, key=repr):
+            _update_hash(digest, key)
+            _update_hash(digest, value[key])
+    elif isinstance(value, (list, tuple)):
+        digest.update(f'{type(value).__name__}{len(value)}'.encode())
+        for item in value:
+            _update_hash(digest, item)
+    else:
+        digest.update(repr(value).encode())
+
+def content_hash(*parts):
+    """
+    Membuat hash isi dari sekumpulan nilai (data agregat, sidik jari dataset,
+    parameter) untuk dipakai sebagai kunci cache.
+
+    Parameters:
+        *parts: Nilai yang menentukan hasil yang disimpan
+
+    Returns:
+        str: Hash heksadesimal
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        _update_hash(digest, part)
+    return digest.hexdigest()
+
+@lru_cache(maxsize=1)
+def cache_version():
+    """
+    Versi cache untuk kode yang sedang berjalan: CACHE_VERSION, versi pustaka
+    VERSIONED_PACKAGES, dan hash seluruh kode aplikasi (app.py, pages/, utils/).
+    Setiap deploy yang mengubah kode analisis atau pembuat grafik otomatis memakai
+    kunci baru, dan entri lama habis lewat eviction LRU. Dihitung sekali per proses.
+
+    Returns:
+        tuple: (CACHE_VERSION, versi pustaka, hash kode)
+    """
+    versions = []
+    for package in VERSIONED_PACKAGES:
+        try:
+            versions.append((package, metadata.version(package)))
+        except metadata.PackageNotFoundError:
+            versions.append((package, None))
+    digest = hashlib.blake2b(digest_size=16)
+    for path in sorted([APP_DIR / 'app.py', *APP_DIR.glob('pages/*.py'), *APP_DIR.glob('utils/*.py')]):
+        try:
+            digest.update(path.relative_to(APP_DIR).as_posix().encode())
+            digest.update(path.read_bytes())
+        except OSError:
+            continue
+    return CACHE_VERSION, tuple(versions), digest.hexdigest()
+
+def _count(name, amount=1):
+    with _counters_lock:
+        _counters[name] += amount
+
+@contextmanager
+def _file_lock(path):
+    """
+    Kunci eksklusif antar proses (flock) selama blok with berjalan.
+    """
+    with open(path, 'a+b') as f:
+        if fcntl is not None:
+            fcntl.flock(f, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+def _entry_path(key):
+    return RESULT_CACHE_DIR / key[:2] / f"{key}.pkl"
+
+def _lock_path(key):
+    # Kunci dibagi ke 256 file tetap agar file kunci tidak ikut terhapus saat eviction
+    return RESULT_CACHE_DIR / 'locks' / f"{key[:2]}.lock"
+
+def _read_entry(path):
+    """
+    Membaca entri cache dan menandainya baru dipakai (mtime) untuk LRU.
+    """
+    try:
+        with open(path, 'rb') as f:
+            value = pickle.load(f)
+    except Exception:
+        # Entri rusak atau dibuat versi pustaka/kelas lain (AttributeError,
+        # ModuleNotFoundError, ...) diperlakukan sebagai miss dan ditulis ulang
+        return _MISSING
+    try:
+        os.utime(path)
+    except OSError:
+        pass
+    return value
+
+def _write_entry(path, value):
+    """
+    Menulis entri melalui file sementara lalu os.replace agar pembaca di proses
+    lain tidak pernah melihat file setengah jadi.
+
+    Returns:
+        int: Ukuran entri dalam byte
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+            size = f.tell()
+        os.replace(tmp_path, path)
+        return size
+    finally:
+        if tmp_path.exists():
+            tmp_path.unlink()
+
+def _entries():
+    """
+    Daftar entri cache beserta (mtime, ukuran), dilewati jika hilang di tengah pemindaian.
+    """
+    entries = []
+    for path in RESULT_CACHE_DIR.glob('*/*.pkl'):
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            continue
+        entries.append((stat.st_mtime_ns, stat.st_size, path))
+    return entries
+
+def evict(max_bytes=None):
+    """
+    Membuang entri yang paling lama tidak dipakai hingga total ukuran cache di
+    bawah batas. Entri terbaru selalu dipertahankan.
+
+    Parameters:
+        max_bytes (int): Batas total ukuran (default RESULT_CACHE_MAX_BYTES)
+    """
+    max_bytes = RESULT_CACHE_MAX_BYTES if max_bytes is None else max_bytes
+    (RESULT_CACHE_DIR / 'locks').mkdir(parents=True, exist_ok=True)
+    with _file_lock(RESULT_CACHE_DIR / 'locks' / 'evict.lock'):
+        entries = sorted(_entries())
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in entries[:-1]:
+            if total <= max_bytes:
+                break
+            try:
+                path.unlink()
+                _count('evictions')
+            except FileNotFoundError:
+                pass
+            total -= size
+    with _size_lock:
+        _size_estimate['bytes'], _size_estimate['writes'] = total, 0
+
+def _after_write(size):
+    """
+    Memperbarui perkiraan ukuran cache setelah sebuah entri ditulis, dan
+    menjalankan evict() (yang memindai seluruh folder) hanya bila perkiraan
+    melewati RESULT_CACHE_MAX_BYTES, belum pernah dipindai, atau setiap
+    EVICT_SCAN_INTERVAL penulisan untuk ikut menghitung tulisan proses lain.
+    """
+    with _size_lock:
+        if _size_estimate['bytes'] is not None:
+            _size_estimate['bytes'] += size
+        _size_estimate['writes'] += 1
+        scan = (
+            _size_estimate['bytes'] is None
+            or _size_estimate['bytes'] > RESULT_CACHE_MAX_BYTES
+            or _size_estimate['writes'] >= EVICT_SCAN_INTERVAL
+        )
+    if scan:
+        evict()
+
+def get_or_compute(namespace, key_parts, compute):
+    """
+    Mengambil hasil dari cache disk bersama, atau menghitung dan menyimpannya.
+    Kunci cache adalah hash isi dari namespace, key_parts (misalnya sidik jari
+    dataset dan argumen), dan cache_version() sehingga hasil dari kode atau versi
+    pustaka lain tidak pernah dipakai. Saat beberapa proses meminta kunci yang sama, hanya satu
+    yang menghitung; proses lain menunggu lalu membaca hasilnya.
+
+    Parameters:
+        namespace (str): Nama fungsi atau jenis hasil
+        key_parts (tuple): Nilai yang menentukan hasil
+        compute (callable): Fungsi tanpa argumen yang menghasilkan nilai (harus dapat di-pickle)
+
+    Returns:
+        object: Hasil dari cache atau dari compute()
+    """
+    key = content_hash(namespace, key_parts, cache_version())
+    path = _entry_path(key)
+    value = _read_entry(path)
+    if value is not _MISSING:
+        _count('hits')
+        return value
+
+    try:
+        _lock_path(key).parent.mkdir(parents=True, exist_ok=True)
+    except OSError:
+        # Folder cache tidak dapat ditulis: hitung langsung tanpa cache disk
+        _count('misses')
+        return compute()
+
+    with _file_lock(_lock_path(key)):
+        value = _read_entry(path)
+        if value is not _MISSING:
+            _count('hits')
+            return value
+        _count('misses')
+        value = compute()
+        try:
+            size = _write_entry(path, value)
+            _count('writes')
+            _after_write(size)
+        except OSError:
+            pass
+        return value
+
+def disk_cache_stats():
+    """
+    Mengembalikan statistik cache disk untuk proses ini dan isi folder cache.
+
+    Returns:
+        dict: hits, misses, writes, evictions, entries, dan bytes
+    """
+    entries = _entries()
+    with _counters_lock:
+        return {**_counters, 'entries': len(entries), 'bytes': sum(size for _, size, _ in entries)}
@@ -0,0 +1,121 @@
+import streamlit as st
+import pandas as pd
+import numpy as np
+from utils.features import derived_features
+
+# Batas jumlah titik scatter yang dikirim ke browser
+MAX_SCATTER_POINTS = 5_000
+
+# Seed tetap agar sampel (dan grafik) stabil antar rerun
+SAMPLE_SEED = 42
+
+# Jumlah bin per sumbu untuk grid kepadatan
+DENSITY_BINS = 80
+
+# Kuantil atas rentang grid kepadatan; nilai di atasnya dihitung sebagai overflow
+DENSITY_RANGE_QUANTILE = 0.995
+
+def stratified_sample(df, column, max_points=MAX_SCATTER_POINTS, n_strata=20, seed=SAMPLE_SEED):
+    """
+    Mengambil sampel deterministik berstrata berdasarkan kuantil sebuah kolom,
+    dengan ukuran maksimum tetap berapa pun jumlah baris data.
+
+    Setiap strata mendapat jatah sebanding dengan ukurannya, minimal satu titik,
+    sehingga nilai ekstrem di ekor distribusi tetap terwakili.
+
+    Parameters:
+        df (pd.DataFrame): Data sumber
+        column (str): Kolom dasar pembentukan strata
+        max_points (int): Jumlah titik maksimum
+        n_strata (int): Jumlah strata kuantil
+        seed (int): Seed generator acak
+
+    Returns:
+        pd.DataFrame: Sampel baris dengan urutan asli
+    """
+    if len(df) <= max_points:
+        return df
+    rng = np.random.default_rng(seed)
+    strata = pd.qcut(df[column].rank(method='first'), q=n_strata, labels=False).to_numpy()
+    positions = []
+    for stratum in range(n_strata):
+        members = np.flatnonzero(strata == stratum)
+        quota = max(1, int(round(max_points * len(members) / len(df))))
+        positions.append(rng.choice(members, min(quota, len(members)), replace=False))
+    return df.iloc[np.sort(np.concatenate(positions))]
+
+def density_grid(x, y, bins=DENSITY_BINS, range_quantile=DENSITY_RANGE_QUANTILE):
+    """
+    Menghitung histogram 2D di server untuk grafik kepadatan.
+
+    Parameters:
+        x (pd.Series): Nilai sumbu x
+        y (pd.Series): Nilai sumbu y
+        bins (int): Jumlah bin per sumbu
+        range_quantile (float): Kuantil batas atas rentang grid
+
+    Returns:
+        dict: x_centers, y_centers, counts (bentuk [y, x]), dan overflow
+        (jumlah titik di luar rentang grid)
+    """
+    x = x.to_numpy('float64')
+    y = y.to_numpy('float64')
+    valid = ~(np.isnan(x) | np.isnan(y))
+    x, y = x[valid], y[valid]
+    x_max = np.quantile(x, range_quantile) if len(x) else 1.0
+    y_max = np.quantile(y, range_quantile) if len(y) else 1.0
+    counts, x_edges, y_edges = np.histogram2d(x, y, bins=bins, range=[[0, x_max], [0, y_max]])
+    return {
+        'x_centers': (x_edges[:-1] + x_edges[1:]) / 2,
+        'y_centers': (y_edges[:-1] + y_edges[1:]) / 2,
+        'counts': counts.T,
+        'overflow': int(len(x) - counts.sum()),
+    }
+
+@st.cache_resource(show_spinner=False, max_entries=16)
+def cached_stratified_sample(_df, dataset_key, column, max_points=MAX_SCATTER_POINTS, seed=SAMPLE_SEED):
+    """
+    stratified_sample yang disimpan per versi dataset dan parameter sampel.
+    """
+    return stratified_sample(_df, column, max_points=max_points, seed=seed)
+
+@st.cache_resource(show_spinner=False, max_entries=16)
+def cached_density_grid(_df, dataset_key, x_column, y_column, bins=DENSITY_BINS):
+    """
+    density_grid yang disimpan per versi dataset dan parameter grid.
+    """
+    return density_grid(_df[x_column], _df[y_column], bins=bins)
+
+def histogram_bins(values, bins, value_range):
+    """
+    Menghitung histogram di server untuk rentang yang terlihat, dengan bucket
+    overflow untuk nilai di atas rentang.
+
+    Parameters:
+        values (np.ndarray): Nilai yang akan di-bin (NaN diabaikan)
+        bins (int): Jumlah bin dalam rentang
+        value_range (tuple): (batas bawah, batas atas) rentang yang terlihat
+
+    Returns:
+        dict: edges, counts, overflow (di atas rentang), underflow (di bawah
+        rentang), dan missing (NaN)
+    """
+    values = np.asarray(values, dtype='float64')
+    valid = values[~np.isnan(values)]
+    low, high = value_range
+    counts, edges = np.histogram(valid, bins=bins, range=(low, high))
+    return {
+        'edges': edges,
+        'counts': counts,
+        'overflow': int(np.count_nonzero(valid > high)),
+        'underflow': int(np.count_nonzero(valid < low)),
+        'missing': int(len(values) - len(valid)),
+    }
+
+@st.cache_resource(show_spinner=False, max_entries=16)
+def cached_feature_histogram(_df, dataset_key, feature, bins, value_range):
+    """
+    histogram_bins untuk sebuah fitur turunan, disimpan per versi dataset dan parameter.
+    """
+    values = derived_features(_df, [feature], dataset_key)[feature].to_numpy()
+    return histogram_bins(values, bins, value_range)
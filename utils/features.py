@@ -0,0 +1,67 @@
+import streamlit as st
+import pandas as pd
+import numpy as np
+
+PRICE_GROUP_LABELS = ['Murah', 'Sedang', 'Mahal', 'Sangat Mahal']
+
+def price_group(df):
+    """
+    Kelompok harga berdasarkan kuartil harga (Murah hingga Sangat Mahal).
+
+    Parameters:
+        df (pd.DataFrame): Data item pesanan dengan kolom price
+
+    Returns:
+        pd.Categorical: Kategori terurut dengan kode int8
+    """
+    codes = pd.qcut(df['price'], q=4, labels=False).fillna(-1).to_numpy('int8')
+    return pd.Categorical.from_codes(codes, categories=PRICE_GROUP_LABELS, ordered=True)
+
+def shipping_ratio(df):
+    """
+    Rasio biaya pengiriman terhadap harga produk. Harga nol menghasilkan NaN.
+
+    Parameters:
+        df (pd.DataFrame): Data item pesanan dengan kolom price dan freight_value
+
+    Returns:
+        np.ndarray: Rasio float32
+    """
+    price = df['price'].to_numpy('float32')
+    freight = df['freight_value'].to_numpy('float32')
+    return np.divide(freight, price, out=np.full(len(price), np.nan, dtype='float32'), where=price > 0)
+
+# Registri fitur turunan: nama -> fungsi yang menghitung kolom dari DataFrame sumber
+FEATURES = {
+    'price_group': price_group,
+    'shipping_ratio': shipping_ratio,
+}
+
+@st.cache_resource(show_spinner=False, max_entries=32)
+def _cached_feature(_df, dataset_key, name):
+    """
+    Menghitung satu fitur turunan sekali per versi dataset.
+    """
+    return FEATURES[name](_df)
+
+def derived_features(df, names, dataset_key):
+    """
+    Mengambil kolom turunan berdasarkan nama dalam DataFrame terpisah yang ringkas.
+    DataFrame sumber tidak pernah diubah, dan setiap fitur dihitung sekali per
+    versi dataset lalu dipakai bersama oleh semua tab dan sesi.
+
+    Parameters:
+        df (pd.DataFrame): Data sumber (read-only)
+        names (list): Nama fitur dari FEATURES
+        dataset_key (tuple): Identitas versi dataset
+
+    Returns:
+        pd.DataFrame: Kolom fitur dengan index yang sama dengan df
+
+    Raises:
+        KeyError: Jika nama fitur tidak terdaftar
+    """
+    for name in names:
+        if name not in FEATURES:
+            raise KeyError(f"Fitur turunan tidak dikenal: {name}")
+    return pd.DataFrame({name: _cached_feature(df, dataset_key, name) for name in names}, index=df.index)
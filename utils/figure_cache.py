@@ -0,0 +1,74 @@
+import os
+import threading
+from collections import OrderedDict
+from utils.disk_cache import content_hash, get_or_compute
+
+# Batas total ukuran JSON figure yang disimpan per proses (dapat diatur lewat environment)
+FIGURE_CACHE_MAX_BYTES = int(os.environ.get('FIGURE_CACHE_MB', 64)) * 1024 * 1024
+
+_figures = OrderedDict()
+_figures_lock = threading.Lock()
+_counters = {'hits': 0, 'misses': 0, 'evictions': 0}
+
+def _evict_figures():
+    """
+    Membuang figure yang paling lama tidak dipakai hingga total ukuran JSON di
+    bawah FIGURE_CACHE_MAX_BYTES. Figure terbaru selalu dipertahankan.
+    """
+    total = sum(len(figure_json) for figure_json in _figures.values())
+    while len(_figures) > 1 and total > FIGURE_CACHE_MAX_BYTES:
+        _, figure_json = _figures.popitem(last=False)
+        total -= len(figure_json)
+        _counters['evictions'] += 1
+
+def cached_figure(builder, *args, persist=True, **kwargs):
+    """
+    Membangun figure Plotly lewat builder, atau mengambilnya dari cache jika
+    masukan dengan isi yang sama sudah pernah dirender. Kunci cache adalah nama
+    builder ditambah hash isi argumen, sehingga rerun karena widget lain tidak
+    membangun ulang figure. Cache proses diisi dari cache disk bersama.
+
+    Parameters:
+        builder (callable): Fungsi pembuat figure
+        *args, **kwargs: Argumen builder (data agregat dan parameter grafik)
+        persist (bool): Simpan juga di cache disk; False untuk figure yang
+            argumennya bergantung pada input bebas pengguna (misalnya rentang
+            tanggal) agar cache disk tidak tumbuh setiap interaksi
+
+    Returns:
+        plotly.graph_objects.Figure: Figure hasil builder atau hasil deserialisasi cache
+    """
+    import plotly.io as pio
+
+    key = (builder.__module__, builder.__qualname__, content_hash(args, kwargs))
+    with _figures_lock:
+        figure_json = _figures.get(key)
+        if figure_json is not None:
+            _figures.move_to_end(key)
+            _counters['hits'] += 1
+        else:
+            _counters['misses'] += 1
+    if figure_json is not None:
+        return pio.from_json(figure_json)
+
+    # Lapis kedua: cache disk bersama antar proses (replika baru langsung hangat)
+    build = lambda: pio.to_json(builder(*args, **kwargs), validate=False)
+    figure_json = get_or_compute('figure', key, build) if persist else build()
+    with _figures_lock:
+        _figures[key] = figure_json
+        _evict_figures()
+    return pio.from_json(figure_json)
+
+def figure_cache_stats():
+    """
+    Mengembalikan statistik cache figure.
+
+    Returns:
+        dict: hits, misses, evictions, entries, dan bytes (total ukuran JSON)
+    """
+    with _figures_lock:
+        return {
+            **_counters,
+            'entries': len(_figures),
+            'bytes': sum(len(figure_json) for figure_json in _figures.values()),
+        }
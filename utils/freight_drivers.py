@@ -0,0 +1,159 @@
+import streamlit as st
+import pandas as pd
+import numpy as np
+from utils.disk_cache import get_or_compute
+from utils.star_schema import join_columns, join_fingerprints
+
+# Pembagi berat volumetrik kurir (cm³ per kg)
+VOLUMETRIC_DIVISOR = 6000
+
+# Lebar bin dan batas atas berat tertagih (kg) untuk kurva ongkir; di atas batas masuk bin terakhir
+WEIGHT_BIN_KG = 0.5
+MAX_WEIGHT_KG = 30.0
+
+# Jumlah baris minimum agar regresi sebuah negara bagian ditampilkan
+MIN_GROUP_ROWS = 30
+
+FREIGHT_COLUMNS = [
+    'freight_value', 'product_weight_g', 'product_length_cm',
+    'product_height_cm', 'product_width_cm', 'seller_state',
+]
+
+def volumetric_weight_kg(length_cm, height_cm, width_cm):
+    """
+    Menghitung berat volumetrik paket.
+
+    Parameters:
+        length_cm (np.ndarray): Panjang produk (cm)
+        height_cm (np.ndarray): Tinggi produk (cm)
+        width_cm (np.ndarray): Lebar produk (cm)
+
+    Returns:
+        np.ndarray: Berat volumetrik (kg) = panjang x tinggi x lebar / VOLUMETRIC_DIVISOR
+    """
+    return np.asarray(length_cm, dtype='float64') * height_cm * width_cm / VOLUMETRIC_DIVISOR
+
+def grouped_regression(groups, features, target, n_groups):
+    """
+    Regresi linear (OLS dengan intercept) untuk setiap kelompok sekaligus. Setiap
+    elemen X'X dan X'y per kelompok dijumlahkan dengan np.bincount, lalu semua
+    sistem persamaan diselesaikan dalam satu operasi pseudo-inverse bertumpuk.
+
+    Parameters:
+        groups (np.ndarray): Kode kelompok 0..n_groups-1 per baris
+        features (np.ndarray): Matriks fitur (baris x fitur)
+        target (np.ndarray): Variabel target per baris
+        n_groups (int): Jumlah kelompok
+
+    Returns:
+        dict: n (baris per kelompok), coef (kelompok x (1 + fitur), intercept di
+        kolom pertama), dan r2 (koefisien determinasi per kelompok)
+    """
+    design = np.column_stack([np.ones(len(target)), features])
+    n_params = design.shape[1]
+    xtx = np.empty((n_groups, n_params, n_params))
+    for i in range(n_params):
+        for j in range(i, n_params):
+            xtx[:, i, j] = xtx[:, j, i] = np.bincount(groups, weights=design[:, i] * design[:, j], minlength=n_groups)
+    xty = np.stack([np.bincount(groups, weights=design[:, i] * target, minlength=n_groups) for i in range(n_params)], axis=1)
+    yty = np.bincount(groups, weights=target * target, minlength=n_groups)
+    n = xtx[:, 0, 0]
+
+    coef = np.einsum('gij,gj->gi', np.linalg.pinv(xtx), xty)
+    # Jumlah kuadrat galat dan total dari statistik cukup, tanpa lintasan kedua atas data
+    sse = yty - 2 * np.einsum('gi,gi->g', coef, xty) + np.einsum('gi,gij,gj->g', coef, xtx, coef)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        sst = yty - xty[:, 0] ** 2 / n
+        r2 = np.where(sst > 0, 1 - sse / sst, np.nan)
+    return {'n': n.astype('int64'), 'coef': coef, 'r2': r2}
+
+def build_freight_drivers(joined):
+    """
+    Menghitung faktor penentu ongkir dari item pesanan yang sudah digabung dengan
+    dimensi produk dan lokasi penjual.
+
+    Parameters:
+        joined (pd.DataFrame): Hasil join_columns dengan kolom FREIGHT_COLUMNS
+
+    Returns:
+        dict: {'states': DataFrame regresi per negara bagian penjual,
+               'overall': Series regresi seluruh data,
+               'weight_curve': DataFrame rata-rata ongkir per bin berat tertagih,
+               'volumetric_share': porsi item yang berat volumetriknya melebihi berat aktual,
+               'rows': jumlah item yang dianalisis}
+    """
+    weight_kg = joined['product_weight_g'].to_numpy('float64', na_value=np.nan) / 1000
+    volumetric_kg = volumetric_weight_kg(
+        joined['product_length_cm'].to_numpy('float64', na_value=np.nan),
+        joined['product_height_cm'].to_numpy('float64', na_value=np.nan),
+        joined['product_width_cm'].to_numpy('float64', na_value=np.nan),
+    )
+    freight = joined['freight_value'].to_numpy('float64', na_value=np.nan)
+    states = joined['seller_state'].astype('category')
+    codes = states.cat.codes.to_numpy()
+
+    # Item tanpa produk/penjual yang cocok atau tanpa dimensi tidak diikutkan
+    valid = np.isfinite(weight_kg) & np.isfinite(volumetric_kg) & np.isfinite(freight) & (codes >= 0)
+    weight_kg, volumetric_kg, freight, codes = weight_kg[valid], volumetric_kg[valid], freight[valid], codes[valid]
+    features = np.column_stack([weight_kg, volumetric_kg])
+
+    by_state = grouped_regression(codes, features, freight, len(states.cat.categories))
+    overall = grouped_regression(np.zeros(len(freight), dtype='int64'), features, freight, 1)
+
+    def regression_frame(result, index):
+        return pd.DataFrame({
+            'items': result['n'],
+            'intercept': result['coef'][:, 0],
+            'per_kg_weight': result['coef'][:, 1],
+            'per_kg_volumetric': result['coef'][:, 2],
+            'r2': result['r2'],
+        }, index=index)
+
+    state_frame = regression_frame(by_state, pd.Index(states.cat.categories, name='seller_state'))
+    state_frame['mean_freight'] = np.bincount(codes, weights=freight, minlength=len(state_frame)) / np.maximum(state_frame['items'], 1)
+    state_frame = state_frame[state_frame['items'] >= MIN_GROUP_ROWS].sort_values('items', ascending=False)
+
+    # Kurva ongkir terhadap berat tertagih (maksimum berat aktual dan volumetrik)
+    chargeable = np.maximum(weight_kg, volumetric_kg)
+    n_bins = int(MAX_WEIGHT_KG / WEIGHT_BIN_KG)
+    bins = np.minimum((chargeable / WEIGHT_BIN_KG).astype('int64'), n_bins - 1)
+    counts = np.bincount(bins, minlength=n_bins)
+    sums = np.bincount(bins, weights=freight, minlength=n_bins)
+    weight_curve = pd.DataFrame({
+        'weight_kg': np.arange(n_bins) * WEIGHT_BIN_KG,
+        'items': counts,
+        'mean_freight': np.divide(sums, counts, out=np.full(n_bins, np.nan), where=counts > 0),
+    })
+
+    return {
+        'states': state_frame,
+        'overall': regression_frame(overall, ['Semua']).iloc[0],
+        'weight_curve': weight_curve[weight_curve['items'] > 0].reset_index(drop=True),
+        'volumetric_share': float(np.mean(volumetric_kg > weight_kg)) if len(freight) else np.nan,
+        'rows': int(len(freight)),
+    }
+
+@st.cache_resource(show_spinner=False, max_entries=4)
+def _cached_freight_drivers(fingerprints):
+    """
+    Analisis faktor ongkir sekali per versi semua tabel terkait, dibagi antar
+    proses lewat cache disk; join hanya dijalankan saat cache disk kosong.
+    """
+    parameters = (VOLUMETRIC_DIVISOR, WEIGHT_BIN_KG, MAX_WEIGHT_KG, MIN_GROUP_ROWS)
+    return get_or_compute('freight_drivers', (fingerprints, parameters), lambda: build_freight_drivers(
+        join_columns('order_items_dataset', FREIGHT_COLUMNS)
+    ))
+
+def load_freight_drivers():
+    """
+    Mengambil analisis faktor penentu ongkir (berat, berat volumetrik, dan
+    negara bagian penjual) dari cache.
+
+    Returns:
+        dict: Hasil build_freight_drivers
+
+    Raises:
+        FileNotFoundError: Jika dataset item pesanan tidak ditemukan
+        KeyError: Jika dataset produk atau penjual tidak tersedia
+    """
+    return _cached_freight_drivers(join_fingerprints('order_items_dataset'))
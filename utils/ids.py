@@ -0,0 +1,188 @@
+import threading
+import pandas as pd
+import numpy as np
+from collections import OrderedDict
+from utils.columnar import is_fresh, read_columnar
+from utils.schemas import read_csv_typed
+from utils.shared_store import ID_COLUMNS, is_id_column
+
+# ID_COLUMNS dan is_id_column didefinisikan di shared_store (lapisan penyimpanan yang
+# meng-encode kolom ID) dan diekspor ulang di sini sebagai satu definisi bersama
+
+# Kode untuk ID kosong
+MISSING_CODE = -1
+
+# Jumlah baris per chunk saat mengumpulkan ID dari CSV yang belum memiliki salinan kolumnar
+VOCABULARY_CHUNK_ROWS = 200_000
+
+_vocabularies = OrderedDict()
+_vocabulary_lock = threading.Lock()
+
+def _unique_values(path, column):
+    """
+    Nilai unik sebuah kolom ID dalam satu file dataset. Jika salinan kolumnar
+    sudah ada, kategori kolom dibaca dari store yang di-memory-map; jika belum,
+    hanya kolom ID yang dibaca per chunk sehingga file sebesar apa pun (termasuk
+    yang diringkas secara streaming) tidak pernah dimuat atau dikonversi utuh.
+    """
+    if is_fresh(path):
+        series = read_columnar(path, columns=[column])[column]
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            return series.cat.categories.to_numpy(dtype=object)
+        return series.dropna().unique().astype(object)
+    seen = set()
+    with read_csv_typed(path, usecols=[column], chunksize=VOCABULARY_CHUNK_ROWS) as reader:
+        for chunk in reader:
+            seen.update(chunk[column].dropna().unique())
+    return np.array(list(seen), dtype=object)
+
+def _current_fingerprints(fingerprints):
+    """
+    Sidik jari terkini file-file kosakata, untuk mendeteksi kunci yang sudah usang.
+    """
+    # Impor di dalam fungsi: data_loader sendiri mengimpor modul ini
+    from utils.data_loader import file_fingerprint
+    try:
+        return tuple(file_fingerprint(fingerprint[0]) for fingerprint in fingerprints)
+    except FileNotFoundError:
+        return None
+
+def vocabulary(column, fingerprints):
+    """
+    Kosakata global sebuah kolom ID: gabungan terurut semua nilai dari setiap
+    dataset yang memiliki kolom tersebut. Karena terurut dan hanya bergantung
+    pada versi file, kode yang dihasilkan sama di semua proses, dan urutan
+    kode sama dengan urutan leksikal ID.
+
+    Kosakata disimpan per proses dan dihitung dalam anggaran memori dataset
+    (lihat vocabulary_bytes). Hanya versi terbaru per kolom yang dipertahankan.
+
+    Parameters:
+        column (str): Nama kolom ID
+        fingerprints (tuple): Sidik jari (path, mtime_ns, size) semua file yang memiliki kolom
+
+    Returns:
+        pd.Index: ID unik terurut; posisi dalam index adalah kodenya
+
+    Raises:
+        ValueError: Jika salah satu file sudah berubah sejak sidik jari dibuat,
+        karena kosakata yang dibangun ulang tidak lagi cocok dengan kode lama
+    """
+    key = (column, fingerprints)
+    with _vocabulary_lock:
+        if key in _vocabularies:
+            _vocabularies.move_to_end(key)
+            return _vocabularies[key][0]
+
+    if _current_fingerprints(fingerprints) != fingerprints:
+        raise ValueError(f"Kosakata '{column}' usang: file sumber sudah berubah, muat ulang dataset")
+    values = [_unique_values(fingerprint[0], column) for fingerprint in fingerprints]
+    ids = pd.Index(np.concatenate(values) if values else np.array([], dtype=object)).unique().sort_values()
+    nbytes = int(ids.memory_usage(deep=True))
+
+    with _vocabulary_lock:
+        # Kosakata versi lama kolom ini tidak lagi dirujuk tabel yang bisa diambil dari cache
+        for stale in [k for k in _vocabularies if k[0] == column and k != key]:
+            del _vocabularies[stale]
+        _vocabularies[key] = (ids, nbytes)
+    return ids
+
+def vocabulary_bytes():
+    """
+    Total memori kosakata ID yang sedang disimpan proses ini.
+
+    Returns:
+        int: Jumlah byte
+    """
+    with _vocabulary_lock:
+        return sum(nbytes for _, nbytes in _vocabularies.values())
+
+def encode_ids(series, ids):
+    """
+    Mengubah kolom ID teks (atau kategori) menjadi kode int32 berdasarkan kosakata.
+
+    Parameters:
+        series (pd.Series): Kolom ID
+        ids (pd.Index): Kosakata dari vocabulary()
+
+    Returns:
+        np.ndarray: Kode int32, MISSING_CODE untuk nilai kosong atau tidak dikenal
+    """
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        # Cukup mencari kategori unik di kosakata, lalu dipetakan lewat kode kategori
+        category_codes = np.append(ids.get_indexer(series.cat.categories), MISSING_CODE)
+        return category_codes[series.cat.codes.to_numpy()].astype('int32')
+    return ids.get_indexer(series).astype('int32')
+
+def decode_ids(codes, ids):
+    """
+    Mengembalikan kode ke ID teks, hanya untuk ditampilkan.
+
+    Parameters:
+        codes (array-like): Kode int32
+        ids (pd.Index): Kosakata dari vocabulary()
+
+    Returns:
+        np.ndarray: Larik objek berisi ID, None untuk MISSING_CODE
+    """
+    codes = np.asarray(codes)
+    values = ids.to_numpy(dtype=object)[np.where(codes == MISSING_CODE, 0, codes)] if len(ids) else np.full(len(codes), None, dtype=object)
+    values[codes == MISSING_CODE] = None
+    return values
+
+def intern_ids(df, vocabulary_keys):
+    """
+    Mengganti kolom ID dengan kode int32 sehingga join dan groupby berjalan pada
+    integer. Kunci kosakata disimpan di attrs['id_vocabularies'] untuk pencarian
+    balik saat ditampilkan.
+
+    Kolom lain tidak disalin: larik yang di-memory-map read_store tetap menunjuk
+    ke file (dan attrs['mapped_bytes'] tetap berlaku), karena hanya kolom ID
+    yang diganti dan kolom ID sendiri tidak pernah di-map tanpa salinan.
+
+    Parameters:
+        df (pd.DataFrame): Data hasil pembacaan
+        vocabulary_keys (dict): {kolom: sidik jari file} untuk vocabulary()
+
+    Returns:
+        pd.DataFrame: DataFrame baru dengan kolom ID berupa kode
+    """
+    columns = [col for col in df.columns if col in vocabulary_keys]
+    if not columns:
+        return df
+    # Salinan dangkal berbagi blok kolom dengan df; assign() akan menyalin semua kolom
+    interned = df.copy(deep=False)
+    for col in columns:
+        interned[col] = encode_ids(df[col], vocabulary(col, vocabulary_keys[col]))
+    interned.attrs = {**df.attrs, 'id_vocabularies': {col: vocabulary_keys[col] for col in columns}}
+    return interned
+
+def id_vocabulary(df, column):
+    """
+    Mengambil kosakata kolom ID yang sudah di-intern pada sebuah DataFrame.
+
+    Parameters:
+        df (pd.DataFrame): DataFrame hasil load_dataset (atau potongannya)
+        column (str): Nama kolom
+
+    Returns:
+        pd.Index: Kosakata, atau None jika kolom tidak di-intern
+    """
+    key = df.attrs.get('id_vocabularies', {}).get(column)
+    return None if key is None else vocabulary(column, key)
+
+def decode_frame(df):
+    """
+    Menyalin DataFrame dengan kolom ID dikembalikan ke teks untuk ditampilkan.
+
+    Parameters:
+        df (pd.DataFrame): Potongan data berisi kolom ID ter-intern
+
+    Returns:
+        pd.DataFrame: Salinan dengan ID berupa teks
+    """
+    decoded = {}
+    for col in df.attrs.get('id_vocabularies', {}):
+        if col in df.columns:
+            decoded[col] = decode_ids(df[col].to_numpy(), id_vocabulary(df, col))
+    return df.assign(**decoded) if decoded else df
@@ -0,0 +1,85 @@
+import streamlit as st
+import pandas as pd
+from utils.columnar import column_stats, convert_csv, read_schema
+from utils.data_loader import file_fingerprint, load_dataset
+from utils.streaming import summarize_csv, use_streaming
+
+def _metadata_from_summary(summary):
+    """
+    Menyusun metadata kolom dari ringkasan streaming untuk file berukuran besar.
+    """
+    stats = {col: {'kind': 'other', 'nulls': None, 'min': None, 'max': None} for col in summary['columns']}
+    for col, acc in summary['numeric'].items():
+        has_data = acc['count'] > 0
+        stats[col] = {
+            'kind': 'numeric',
+            'nulls': summary['rows'] - acc['count'],
+            'min': float(acc['min']) if has_data else None,
+            'max': float(acc['max']) if has_data else None,
+        }
+    for col, acc in summary['datetime'].items():
+        stats[col] = {
+            'kind': 'datetime',
+            'nulls': acc['nulls'],
+            'min': acc['min'].isoformat() if pd.notna(acc['min']) else None,
+            'max': acc['max'].isoformat() if pd.notna(acc['max']) else None,
+        }
+    return {'rows': summary['rows'], 'column_stats': stats}
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def _cached_metadata(path, mtime_ns, size):
+    """
+    Metadata dataset sekali per versi file.
+    """
+    if use_streaming(path):
+        return _metadata_from_summary(summarize_csv(path))
+    try:
+        # Metadata dicatat saat konversi ke store Arrow dan disimpan di sidecar skema
+        convert_csv(path)
+        schema = read_schema(path)
+        if schema is not None and 'column_stats' in schema:
+            return {'rows': schema['rows'], 'column_stats': schema['column_stats']}
+    except OSError:
+        pass
+    # Folder dataset read-only: hitung dari dataset yang dimuat
+    df = load_dataset(path)
+    return {'rows': len(df), 'column_stats': column_stats(df)}
+
+def dataset_metadata(path):
+    """
+    Mengambil metadata dataset (jumlah baris, serta jumlah nilai kosong dan
+    min/max per kolom) tanpa memindai ulang kolom. Metadata dibaca dari sidecar
+    skema salinan kolumnar, atau dari ringkasan streaming untuk file besar.
+
+    Parameters:
+        path (str/Path): Path file CSV
+
+    Returns:
+        dict: rows dan column_stats ({kolom: {'kind', 'nulls', 'min', 'max'}})
+
+    Raises:
+        FileNotFoundError: Jika file tidak ditemukan
+    """
+    return _cached_metadata(*file_fingerprint(path))
+
+def column_bounds(path, column):
+    """
+    Mengambil nilai minimum dan maksimum sebuah kolom dari metadata dataset,
+    misalnya untuk batas widget filter.
+
+    Parameters:
+        path (str/Path): Path file CSV
+        column (str): Nama kolom numerik atau tanggal
+
+    Returns:
+        tuple: (min, max) sebagai float atau pd.Timestamp
+
+    Raises:
+        KeyError: Jika kolom tidak ada atau tidak memiliki min/max
+    """
+    entry = dataset_metadata(path)['column_stats'][column]
+    if entry['min'] is None:
+        raise KeyError(f"Kolom {column} tidak memiliki nilai min/max")
+    if entry['kind'] == 'datetime':
+        return pd.Timestamp(entry['min']), pd.Timestamp(entry['max'])
+    return entry['min'], entry['max']
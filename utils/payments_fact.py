@@ -0,0 +1,61 @@
+import pandas as pd
+import numpy as np
+from utils.data_loader import load_dataset
+from utils.star_schema import key_index, lookup_positions
+
+def build_payments_fact(payments_df, orders_dataset):
+    """
+    Membangun tabel fakta pembayaran yang sudah digabung dengan waktu pembelian
+    dan diurutkan berdasarkan timestamp.
+
+    Parameters:
+        payments_df (pd.DataFrame): Data pembayaran (order_id, payment_value)
+        orders_dataset (pd.DataFrame): Data pesanan (order_id, order_purchase_timestamp)
+
+    Returns:
+        pd.DataFrame: Kolom order_id, payment_value, purchase_ts (int64 nanodetik)
+        dan month_key (int32, format YYYYMM), terurut menurut purchase_ts
+    """
+    # Join lewat indeks kunci pesanan (bukan pd.merge); pembayaran tanpa pesanan dibuang (inner join)
+    ids = payments_df.attrs.get('id_vocabularies', {}).get('order_id')
+    positions = lookup_positions(
+        key_index(orders_dataset, 'order_id'),
+        payments_df['order_id'],
+        None if ids is None else ('order_id', ids)
+    )
+    matched = positions >= 0
+    # Sudah bertipe datetime dari loader bertipe (format tetap TIMESTAMP_FORMAT), tidak diparse ulang
+    timestamps = orders_dataset['order_purchase_timestamp'].iloc[positions[matched]]
+    valid = np.flatnonzero(matched)[timestamps.notna().to_numpy()]
+    timestamps = timestamps[timestamps.notna()]
+
+    fact = pd.DataFrame({
+        'order_id': payments_df['order_id'].to_numpy()[valid],
+        'payment_value': payments_df['payment_value'].to_numpy()[valid],
+        'purchase_ts': timestamps.to_numpy('datetime64[ns]').view('int64'),
+        'month_key': (timestamps.dt.year * 100 + timestamps.dt.month).to_numpy('int32'),
+    })
+    return fact.sort_values('purchase_ts', kind='stable', ignore_index=True)
+
+def load_payments_fact(payments_path, orders_path):
+    """
+    Membangun tabel fakta pembayaran dari dataset pembayaran dan pesanan.
+
+    Tabel fakta tidak disimpan di cache: satu-satunya pemakainya adalah
+    pembuatan ringkasan harian, yang sudah di-cache (lihat utils.rollups),
+    sehingga tabel ini hanya hidup selama ringkasan dibangun. Dataset sumbernya
+    diambil lewat load_dataset dan tetap dibatasi MEMORY_BUDGET_BYTES.
+
+    Parameters:
+        payments_path (str/Path): Path CSV pembayaran
+        orders_path (str/Path): Path CSV pesanan
+
+    Returns:
+        pd.DataFrame: Tabel fakta hasil build_payments_fact
+
+    Raises:
+        FileNotFoundError: Jika salah satu file dataset tidak ditemukan
+    """
+    payments_df = load_dataset(payments_path, columns=['order_id', 'payment_value'])
+    orders_dataset = load_dataset(orders_path, columns=['order_id', 'order_purchase_timestamp'])
+    return build_payments_fact(payments_df, orders_dataset)
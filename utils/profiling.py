@@ -0,0 +1,150 @@
+import streamlit as st
+import pandas as pd
+import numpy as np
+import sys
+from utils.disk_cache import get_or_compute
+from utils.ids import MISSING_CODE, is_id_column
+from utils.streaming import signed_sketch, sketch_quantile
+
+# Presisi HyperLogLog: 2^12 register, galat standar sekitar 1.6%
+HLL_PRECISION = 12
+
+# Jumlah nilai sampel untuk memperkirakan memori kolom objek
+MEMORY_SAMPLE_SIZE = 1_000
+
+PROFILE_COLUMNS = ['dtype', 'count', 'nulls', 'distinct', 'mean', 'std', 'min', '25%', '50%', '75%', 'max', 'memory_bytes']
+
+def hll_distinct(series, precision=HLL_PRECISION):
+    """
+    Memperkirakan jumlah nilai unik dengan HyperLogLog dalam satu lintasan vektor.
+
+    Parameters:
+        series (pd.Series): Kolom data, nilai kosong diabaikan
+        precision (int): Jumlah bit indeks register (m = 2^precision)
+
+    Returns:
+        int: Perkiraan jumlah nilai unik
+    """
+    values = series.dropna().to_numpy()
+    if len(values) == 0:
+        return 0
+    hashes = pd.util.hash_array(values)
+    m = 1 << precision
+    index = (hashes >> np.uint64(64 - precision)).astype('int64')
+    rest = hashes & np.uint64((1 << (64 - precision)) - 1)
+    # Posisi bit 1 pertama (dari kiri) pada sisa hash
+    width = 64 - precision
+    bit_length = np.zeros(len(rest), dtype='int64')
+    nonzero = rest > 0
+    bit_length[nonzero] = np.floor(np.log2(rest[nonzero].astype('float64'))).astype('int64') + 1
+    rank = width - bit_length + 1
+
+    registers = np.zeros(m, dtype='int64')
+    np.maximum.at(registers, index, rank)
+
+    alpha = 0.7213 / (1 + 1.079 / m)
+    estimate = alpha * m * m / np.sum(np.power(2.0, -registers))
+    empty = np.count_nonzero(registers == 0)
+    if estimate <= 2.5 * m and empty:
+        # Koreksi rentang kecil: linear counting
+        estimate = m * np.log(m / empty)
+    return int(round(estimate))
+
+def estimate_memory(series, sample_size=MEMORY_SAMPLE_SIZE, seed=0):
+    """
+    Memperkirakan memori "deep" sebuah kolom tanpa menelusuri semua objek string.
+
+    Parameters:
+        series (pd.Series): Kolom data
+        sample_size (int): Jumlah nilai sampel untuk kolom objek
+        seed (int): Seed sampel agar hasil stabil
+
+    Returns:
+        int: Perkiraan jumlah byte
+    """
+    if series.dtype != object:
+        return int(series.memory_usage(deep=True, index=False))
+    n = len(series)
+    if n <= sample_size:
+        return int(series.memory_usage(deep=True, index=False))
+    positions = np.random.default_rng(seed).choice(n, sample_size, replace=False)
+    sample = series.to_numpy()[positions]
+    average = np.mean([sys.getsizeof(value) for value in sample])
+    # Larik pointer 8 byte per baris ditambah objek yang ditunjuk
+    return int(n * (8 + average))
+
+def profile_column(series, exact=False):
+    """
+    Menghitung profil satu kolom.
+
+    Parameters:
+        series (pd.Series): Kolom data
+        exact (bool): Hitung nilai unik, kuartil, dan memori secara pasti
+
+    Returns:
+        dict: Statistik kolom sesuai PROFILE_COLUMNS
+    """
+    # Kolom ID yang di-intern berupa kode integer; statistik numeriknya tidak bermakna
+    interned = is_id_column(series.name) and pd.api.types.is_integer_dtype(series.dtype)
+    nulls = int((series.to_numpy() == MISSING_CODE).sum()) if interned else int(series.isna().sum())
+    profile = dict.fromkeys(PROFILE_COLUMNS, np.nan)
+    profile.update({
+        'dtype': str(series.dtype),
+        'count': len(series) - nulls,
+        'nulls': nulls,
+    })
+
+    if isinstance(series.dtype, pd.CategoricalDtype) or interned:
+        # Nilai unik cukup dihitung dari kode kategori/ID yang terpakai
+        codes = series.cat.codes.to_numpy() if not interned else series.to_numpy()
+        profile['distinct'] = len(np.unique(codes[codes >= 0]))
+    else:
+        profile['distinct'] = series.nunique() if exact else hll_distinct(series)
+
+    if interned or pd.api.types.is_bool_dtype(series.dtype):
+        pass
+    elif pd.api.types.is_numeric_dtype(series.dtype):
+        values = series.to_numpy('float64', na_value=np.nan)
+        has_data = profile['count'] > 0
+        profile['mean'] = np.nanmean(values) if has_data else np.nan
+        profile['std'] = np.nanstd(values, ddof=1) if profile['count'] > 1 else np.nan
+        profile['min'] = np.nanmin(values) if has_data else np.nan
+        profile['max'] = np.nanmax(values) if has_data else np.nan
+        if has_data and exact:
+            profile['25%'], profile['50%'], profile['75%'] = series.quantile([0.25, 0.5, 0.75]).to_numpy()
+        elif has_data:
+            sketch = signed_sketch(values)
+            profile['25%'], profile['50%'], profile['75%'] = (sketch_quantile(sketch, q) for q in (0.25, 0.5, 0.75))
+    elif pd.api.types.is_datetime64_any_dtype(series.dtype):
+        profile['min'] = series.min()
+        profile['max'] = series.max()
+
+    profile['memory_bytes'] = int(series.memory_usage(deep=True, index=False)) if exact else estimate_memory(series)
+    return profile
+
+@st.cache_resource(show_spinner=False, max_entries=32)
+def _cached_profile(_df, dataset_key, exact):
+    """
+    Profil dataset sekali per (versi dataset, mode), dibagi antar proses lewat cache disk.
+    """
+    return get_or_compute('profile', (dataset_key, [(col, str(dtype)) for col, dtype in _df.dtypes.items()], exact), lambda: pd.DataFrame(
+        [profile_column(_df[col], exact=exact) for col in _df.columns],
+        index=_df.columns,
+        columns=PROFILE_COLUMNS
+    ))
+
+def profile_dataset(df, dataset_key, exact=False):
+    """
+    Mengambil profil per kolom sebuah dataset: jumlah nilai kosong, perkiraan nilai
+    unik (HyperLogLog), min/max, perkiraan kuartil, dan perkiraan memori dari sampel.
+    Hasil disimpan per versi dataset sehingga hanya dihitung sekali.
+
+    Parameters:
+        df (pd.DataFrame): Data sumber
+        dataset_key (hashable): Identitas versi dataset, misalnya sidik jari file
+        exact (bool): Gunakan perhitungan pasti (lebih lambat)
+
+    Returns:
+        pd.DataFrame: Satu baris per kolom dengan kolom PROFILE_COLUMNS
+    """
+    return _cached_profile(df, dataset_key, exact)
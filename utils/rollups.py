@@ -0,0 +1,175 @@
+import streamlit as st
+import pandas as pd
+import numpy as np
+from utils.data_loader import file_fingerprint
+from utils.disk_cache import get_or_compute
+from utils.payments_fact import load_payments_fact
+
+NS_PER_DAY = 86_400 * 10**9
+
+# Akurasi relatif sketsa kuantil: median hasil sketsa berada sekitar 0.5% dari nilai sebenarnya
+RELATIVE_ACCURACY = 0.005
+GAMMA = (1 + RELATIVE_ACCURACY) / (1 - RELATIVE_ACCURACY)
+LOG_GAMMA = np.log(GAMMA)
+
+# Indeks bucket khusus untuk nilai nol atau negatif
+ZERO_BUCKET = np.iinfo(np.int32).min
+
+def sketch_buckets(values):
+    """
+    Memetakan nilai ke indeks bucket logaritmik sketsa kuantil.
+
+    Parameters:
+        values (np.ndarray): Nilai pembayaran
+
+    Returns:
+        np.ndarray: Indeks bucket int32, ZERO_BUCKET untuk nilai <= 0
+    """
+    values = np.asarray(values, dtype='float64')
+    buckets = np.full(len(values), ZERO_BUCKET, dtype='int32')
+    positive = values > 0
+    buckets[positive] = np.ceil(np.log(values[positive]) / LOG_GAMMA).astype('int32')
+    return buckets
+
+def bucket_values(buckets):
+    """
+    Mengembalikan nilai representatif untuk setiap indeks bucket sketsa.
+
+    Parameters:
+        buckets (np.ndarray): Indeks bucket dari sketch_buckets
+
+    Returns:
+        np.ndarray: Nilai perkiraan per bucket
+    """
+    buckets = np.asarray(buckets)
+    values = 2 * np.power(GAMMA, buckets.astype('float64')) / (GAMMA + 1)
+    return np.where(buckets == ZERO_BUCKET, 0.0, values)
+
+def build_daily_rollup(payments_fact):
+    """
+    Mengagregasi tabel fakta pembayaran menjadi ringkasan harian yang dapat digabung.
+
+    Parameters:
+        payments_fact (pd.DataFrame): Baris dengan kolom purchase_ts, month_key, dan payment_value
+
+    Returns:
+        dict: {'days': DataFrame per hari (day, month_key, count, sum, sumsq),
+               'sketch': DataFrame per hari dan bucket (day, bucket, count)}
+    """
+    values = payments_fact['payment_value'].to_numpy('float64')
+    rows = pd.DataFrame({
+        'day': (payments_fact['purchase_ts'].to_numpy() // NS_PER_DAY).astype('int32'),
+        'month_key': payments_fact['month_key'].to_numpy(),
+        'bucket': sketch_buckets(values),
+        'value': values,
+        'value_sq': values * values,
+    })
+
+    days = rows.groupby('day', sort=True).agg(
+        month_key=('month_key', 'first'),
+        count=('value', 'size'),
+        sum=('value', 'sum'),
+        sumsq=('value_sq', 'sum'),
+    ).reset_index()
+    sketch = rows.groupby(['day', 'bucket'], sort=True).size().rename('count').reset_index()
+    return {'days': days, 'sketch': sketch}
+
+def append_daily_rollup(rollup, new_payments_fact):
+    """
+    Menambahkan baris pembayaran baru ke ringkasan harian tanpa menghitung ulang
+    riwayat dari data mentah. Hari yang tumpang tindih digabung dengan penjumlahan.
+
+    Parameters:
+        rollup (dict): Ringkasan harian dari build_daily_rollup
+        new_payments_fact (pd.DataFrame): Baris baru dengan skema tabel fakta
+
+    Returns:
+        dict: Ringkasan harian gabungan
+    """
+    delta = build_daily_rollup(new_payments_fact)
+    days = pd.concat([rollup['days'], delta['days']], ignore_index=True).groupby('day', sort=True).agg(
+        month_key=('month_key', 'first'),
+        count=('count', 'sum'),
+        sum=('sum', 'sum'),
+        sumsq=('sumsq', 'sum'),
+    ).reset_index()
+    sketch = pd.concat([rollup['sketch'], delta['sketch']], ignore_index=True).groupby(
+        ['day', 'bucket'], sort=True
+    )['count'].sum().reset_index()
+    return {'days': days, 'sketch': sketch}
+
+def _day_bounds(day_keys, start_date=None, end_date=None):
+    """
+    Mencari posisi hari awal dan akhir (inklusif) dengan binary search.
+    """
+    lo, hi = 0, len(day_keys)
+    if start_date is not None:
+        lo = int(np.searchsorted(day_keys, pd.Timestamp(start_date).value // NS_PER_DAY, side='left'))
+    if end_date is not None:
+        hi = int(np.searchsorted(day_keys, pd.Timestamp(end_date).value // NS_PER_DAY, side='right'))
+    return lo, max(lo, hi)
+
+def monthly_rollup(rollup, start_date=None, end_date=None):
+    """
+    Menyusun statistik bulanan dari ringkasan harian dalam rentang tanggal.
+
+    Parameters:
+        rollup (dict): Ringkasan harian dari build_daily_rollup
+        start_date (str/datetime): Hari pertama inklusif (opsional)
+        end_date (str/datetime): Hari terakhir inklusif (opsional)
+
+    Returns:
+        pd.DataFrame: Kolom month_key, count, sum, mean, std, dan median (perkiraan sketsa)
+    """
+    days = rollup['days']
+    lo, hi = _day_bounds(days['day'].to_numpy(), start_date, end_date)
+    days = days.iloc[lo:hi]
+
+    monthly = days.groupby('month_key', sort=True)[['count', 'sum', 'sumsq']].sum()
+    monthly['mean'] = monthly['sum'] / monthly['count']
+    variance = (monthly['sumsq'] - monthly['count'] * monthly['mean'] ** 2) / (monthly['count'] - 1)
+    monthly['std'] = np.sqrt(variance.clip(lower=0))
+
+    sketch = rollup['sketch']
+    lo, hi = _day_bounds(sketch['day'].to_numpy(), start_date, end_date)
+    sketch = sketch.iloc[lo:hi]
+    sketch = sketch.assign(month_key=sketch['day'].map(days.set_index('day')['month_key']))
+    sketch = sketch.groupby(['month_key', 'bucket'], sort=True)['count'].sum().reset_index()
+
+    # Median: bucket pertama yang kumulatifnya melewati peringkat tengah (n - 1) / 2
+    cumulative = sketch.groupby('month_key')['count'].cumsum()
+    target_rank = (sketch['month_key'].map(monthly['count']) - 1) / 2
+    median_rows = sketch[cumulative > target_rank].groupby('month_key').head(1)
+    monthly['median'] = pd.Series(bucket_values(median_rows['bucket'].to_numpy()), index=median_rows['month_key'].to_numpy())
+
+    return monthly.reset_index()[['month_key', 'count', 'sum', 'mean', 'std', 'median']]
+
+@st.cache_resource(show_spinner=False, max_entries=4)
+def _cached_payments_rollup(payments_fingerprint, orders_fingerprint):
+    """
+    Membangun ringkasan harian sekali per versi dataset pembayaran dan pesanan,
+    atau membacanya dari cache disk bersama jika proses lain sudah membangunnya.
+    """
+    rollup = get_or_compute(
+        'payments_rollup',
+        (payments_fingerprint, orders_fingerprint),
+        lambda: build_daily_rollup(load_payments_fact(payments_fingerprint[0], orders_fingerprint[0]))
+    )
+    return {**rollup, 'version': (payments_fingerprint, orders_fingerprint)}
+
+def load_payments_rollup(payments_path, orders_path):
+    """
+    Mengambil ringkasan harian pembayaran dari cache proses.
+
+    Parameters:
+        payments_path (str/Path): Path CSV pembayaran
+        orders_path (str/Path): Path CSV pesanan
+
+    Returns:
+        dict: Ringkasan harian bersama yang bersifat read-only, dengan tambahan
+        version (sidik jari kedua file) untuk kunci cache turunan
+
+    Raises:
+        FileNotFoundError: Jika salah satu file dataset tidak ditemukan
+    """
+    return _cached_payments_rollup(file_fingerprint(payments_path), file_fingerprint(orders_path))
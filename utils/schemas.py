@@ -0,0 +1,106 @@
+import pandas as pd
+from pathlib import Path
+
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# Skema tipe data per dataset Olist. Kolom yang tidak ada di file akan diabaikan,
+# kolom yang tidak terdaftar dibiarkan mengikuti inferensi pandas.
+DATASET_SCHEMAS = {
+    'orders_dataset': {
+        'dtype': {
+            'order_status': 'category',
+        },
+        'parse_dates': [
+            'order_purchase_timestamp',
+            'order_approved_at',
+            'order_delivered_carrier_date',
+            'order_delivered_customer_date',
+            'order_estimated_delivery_date',
+        ],
+    },
+    'order_payments_dataset': {
+        'dtype': {
+            'payment_sequential': 'int16',
+            'payment_type': 'category',
+            'payment_installments': 'int16',
+            'payment_value': 'float64',
+        },
+    },
+    'order_items_dataset': {
+        'dtype': {
+            'order_item_id': 'int16',
+            'price': 'float32',
+            'freight_value': 'float32',
+        },
+        'parse_dates': ['shipping_limit_date'],
+    },
+    'products_dataset': {
+        'dtype': {
+            'product_category_name': 'category',
+        },
+    },
+    'sellers_dataset': {
+        'dtype': {
+            'seller_zip_code_prefix': 'category',
+            'seller_city': 'category',
+            'seller_state': 'category',
+        },
+    },
+    'customers_dataset': {
+        'dtype': {
+            'customer_zip_code_prefix': 'category',
+            'customer_city': 'category',
+            'customer_state': 'category',
+        },
+    },
+    'geolocation_dataset': {
+        'dtype': {
+            'geolocation_zip_code_prefix': 'category',
+            'geolocation_city': 'category',
+            'geolocation_state': 'category',
+        },
+    },
+    'product_category_name_translation': {
+        'dtype': {
+            'product_category_name': 'category',
+            'product_category_name_english': 'category',
+        },
+    },
+}
+
+def read_options(name, columns):
+    """
+    Menyusun argumen pd.read_csv dari skema dataset untuk kolom yang tersedia.
+
+    Parameters:
+        name (str): Nama dataset
+        columns (list): Daftar kolom yang ada di header file
+
+    Returns:
+        dict: Argumen dtype, parse_dates, dan date_format untuk pd.read_csv
+    """
+    schema = DATASET_SCHEMAS.get(name, {})
+    dtype = {col: kind for col, kind in schema.get('dtype', {}).items() if col in columns}
+    parse_dates = [col for col in schema.get('parse_dates', []) if col in columns]
+    options = {'dtype': dtype}
+    if parse_dates:
+        options['parse_dates'] = parse_dates
+        options['date_format'] = TIMESTAMP_FORMAT
+    return options
+
+def read_csv_typed(path, **kwargs):
+    """
+    Membaca file CSV dengan tipe data sesuai skema dataset.
+
+    Parameters:
+        path (str/Path): Path file CSV
+        **kwargs: Argumen tambahan untuk pd.read_csv (misalnya chunksize)
+
+    Returns:
+        pd.DataFrame: DataFrame dengan tipe data eksplisit
+    """
+    name = Path(path).stem
+    columns = pd.read_csv(path, nrows=0).columns
+    if kwargs.get('usecols') is not None:
+        columns = [col for col in columns if col in kwargs['usecols']]
+    return pd.read_csv(path, **read_options(name, columns), **kwargs)
@@ -0,0 +1,81 @@
+import pandas as pd
+import pyarrow as pa
+import pyarrow.ipc as ipc
+
+# Kolom ID heksadesimal Olist: di-encode kamus di store dan di-intern menjadi kode integer (utils.ids)
+ID_COLUMNS = ('order_id', 'customer_id', 'product_id', 'seller_id')
+
+def is_id_column(name):
+    """
+    Memeriksa apakah sebuah kolom merupakan kolom ID Olist.
+
+    Parameters:
+        name (str): Nama kolom
+
+    Returns:
+        bool: True jika kolom termasuk ID_COLUMNS
+    """
+    return name in ID_COLUMNS
+
+def _is_text_id(name, series):
+    """
+    Kolom ID berupa teks yang akan di-encode kamus.
+    """
+    return is_id_column(name) and (series.dtype == object or pd.api.types.is_string_dtype(series.dtype))
+
+def store_table(df):
+    """
+    Menyusun tabel Arrow untuk penyimpanan bersama: kolom ID teks di-encode
+    kamus (kategori terurut) sehingga setiap proses hanya menyimpan kode integer
+    dan satu salinan nilai unik.
+
+    Parameters:
+        df (pd.DataFrame): Data bertipe dari loader
+
+    Returns:
+        pa.Table: Tabel Arrow tanpa index
+    """
+    encoded = {col: df[col].astype('category') for col in df.columns if _is_text_id(col, df[col])}
+    return pa.Table.from_pandas(df.assign(**encoded) if encoded else df, preserve_index=False)
+
+def write_store(df, path):
+    """
+    Menulis tabel ke file Arrow IPC tanpa kompresi agar dapat di-memory-map.
+
+    Parameters:
+        df (pd.DataFrame): Data sumber
+        path (str/Path): Path file tujuan
+    """
+    table = store_table(df)
+    with ipc.new_file(str(path), table.schema) as writer:
+        writer.write_table(table)
+
+def _is_zero_copy(column):
+    """
+    Kolom numerik/tanggal tanpa nilai kosong dipetakan ke pandas tanpa salinan.
+    """
+    kind = column.type
+    return column.null_count == 0 and (pa.types.is_integer(kind) or pa.types.is_floating(kind) or pa.types.is_timestamp(kind))
+
+def read_store(path, columns=None):
+    """
+    Membuka file Arrow IPC lewat memory map. Kolom numerik dan tanggal tanpa nilai
+    kosong langsung menunjuk ke halaman file yang di-map, sehingga semua sesi dan
+    proses di satu host berbagi satu salinan fisik lewat page cache. Larik hasilnya
+    bersifat read-only.
+
+    Parameters:
+        path (str/Path): Path file Arrow IPC
+        columns (list): Kolom yang dibaca (opsional, default semua kolom)
+
+    Returns:
+        pd.DataFrame: DataFrame dengan attrs['mapped_bytes'] berisi jumlah byte
+        yang dipetakan tanpa salinan
+    """
+    source = pa.memory_map(str(path), 'r')
+    table = ipc.open_file(source).read_all()
+    if columns:
+        table = table.select(columns)
+    df = table.to_pandas(split_blocks=True)
+    df.attrs['mapped_bytes'] = sum(col.nbytes for col in table.columns if _is_zero_copy(col))
+    return df
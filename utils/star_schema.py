@@ -0,0 +1,239 @@
+import streamlit as st
+import pandas as pd
+import numpy as np
+from utils.data_loader import dataset_path, file_fingerprint, id_vocabulary_keys, inspect_csv, load_dataset
+from utils.ids import MISSING_CODE, decode_ids, id_vocabulary, vocabulary
+
+# Graf foreign key dataset Olist: tabel -> [(kolom foreign key, tabel dimensi, kunci dimensi)]
+FOREIGN_KEYS = {
+    'order_items_dataset': [
+        ('order_id', 'orders_dataset', 'order_id'),
+        ('product_id', 'products_dataset', 'product_id'),
+        ('seller_id', 'sellers_dataset', 'seller_id'),
+    ],
+    'order_payments_dataset': [('order_id', 'orders_dataset', 'order_id')],
+    'order_reviews_dataset': [('order_id', 'orders_dataset', 'order_id')],
+    'orders_dataset': [('customer_id', 'customers_dataset', 'customer_id')],
+    'products_dataset': [
+        ('product_category_name', 'product_category_name_translation', 'product_category_name'),
+    ],
+}
+
+# Posisi untuk kunci yang tidak ditemukan di tabel dimensi
+MISSING_POSITION = -1
+
+def key_index(df, column):
+    """
+    Membangun indeks kunci unik sebuah tabel dimensi. Kolom ID yang di-intern
+    memakai tabel alamat langsung (kode -> posisi baris) sehingga pencarian cukup
+    satu operasi take; kolom lain memakai hash index pandas.
+
+    Parameters:
+        df (pd.DataFrame): Tabel dimensi
+        column (str): Kolom kunci
+
+    Returns:
+        tuple: ((kolom, sidik jari kosakata) atau None, larik alamat atau pd.Index)
+
+    Raises:
+        ValueError: Jika kunci tidak unik
+    """
+    ids = id_vocabulary(df, column)
+    if ids is None:
+        index = pd.Index(df[column])
+        if not index.is_unique:
+            raise ValueError(f"Kunci '{column}' tidak unik")
+        return None, index
+
+    codes = df[column].to_numpy()
+    present = np.flatnonzero(codes != MISSING_CODE)
+    if len(np.unique(codes[present])) != len(present):
+        raise ValueError(f"Kunci '{column}' tidak unik")
+    # Slot terakhir menampung MISSING_CODE (-1) sehingga kode kosong langsung menghasilkan MISSING_POSITION
+    table = np.full(len(ids) + 1, MISSING_POSITION, dtype='int64')
+    table[codes[present]] = present
+    return (column, df.attrs['id_vocabularies'][column]), table
+
+def lookup_positions(index, keys, ids_key=None):
+    """
+    Mencari posisi baris tabel dimensi untuk setiap kunci.
+
+    Parameters:
+        index (tuple): Hasil key_index
+        keys (pd.Series): Kunci foreign key dari tabel fakta
+        ids_key (tuple): (kolom, sidik jari kosakata) jika keys berupa kode ID (opsional)
+
+    Returns:
+        np.ndarray: Posisi int64, MISSING_POSITION jika tidak ditemukan
+    """
+    vocabulary_key, table = index
+    if ids_key is not None and ids_key != vocabulary_key:
+        # Kosakata berbeda atau dimensi tidak di-intern: kunci dikembalikan ke teks lebih dulu
+        keys = pd.Series(decode_ids(keys.to_numpy(), vocabulary(*ids_key)), name=keys.name)
+    if vocabulary_key is not None:
+        codes = keys.to_numpy() if ids_key == vocabulary_key else vocabulary(*vocabulary_key).get_indexer(keys)
+        return table[codes]
+    if isinstance(keys.dtype, pd.CategoricalDtype):
+        # Cukup mencari kategori unik, lalu dipetakan lewat kode kategori
+        category_positions = np.append(table.get_indexer(keys.cat.categories), MISSING_POSITION)
+        return category_positions[keys.cat.codes.to_numpy()]
+    return table.get_indexer(keys)
+
+@st.cache_resource(show_spinner=False, max_entries=32)
+def _cached_key_index(fingerprint, column, vocabulary_key):
+    """
+    Indeks kunci sekali per versi tabel dimensi dan versi kosakata kolom kuncinya;
+    tabel alamat langsung disusun dari kode ID, yang ikut berubah bila file lain
+    yang memiliki kolom tersebut (misalnya tabel fakta) berubah.
+    """
+    return key_index(load_dataset(fingerprint[0], columns=[column]), column)
+
+def table_index(table, column):
+    """
+    Mengambil indeks kunci sebuah tabel dari cache proses.
+
+    Parameters:
+        table (str): Nama dataset, misalnya 'products_dataset'
+        column (str): Kolom kunci
+
+    Returns:
+        tuple: Hasil key_index
+
+    Raises:
+        FileNotFoundError: Jika file dataset tidak ditemukan
+    """
+    path = dataset_path(table)
+    vocabulary_key = id_vocabulary_keys(path, [column]).get(column)
+    return _cached_key_index(file_fingerprint(path), column, vocabulary_key)
+
+def reachable_tables(fact):
+    """
+    Menelusuri graf foreign key (BFS) dari sebuah tabel fakta, hanya melalui
+    dataset yang filenya tersedia.
+
+    Parameters:
+        fact (str): Nama dataset fakta
+
+    Returns:
+        dict: {tabel: (tabel induk, foreign key, kunci dimensi)} terurut menurut jarak,
+        dengan tabel fakta sendiri bernilai None
+    """
+    paths = {fact: None}
+    queue = [fact]
+    while queue:
+        table = queue.pop(0)
+        for foreign_key, dimension, key in FOREIGN_KEYS.get(table, ()):
+            if dimension not in paths and dataset_path(dimension).exists():
+                paths[dimension] = (table, foreign_key, key)
+                queue.append(dimension)
+    return paths
+
+def _take(df, column, positions):
+    """
+    Mengambil nilai kolom pada posisi tertentu; posisi MISSING_POSITION menjadi
+    nilai kosong (MISSING_CODE untuk kolom ID yang di-intern).
+    """
+    series = df[column]
+    if positions is None:
+        return series.reset_index(drop=True)
+    if id_vocabulary(df, column) is not None:
+        values = np.where(positions == MISSING_POSITION, MISSING_CODE, series.to_numpy()[positions]).astype('int32')
+        return pd.Series(values, name=column)
+    return pd.Series(series.array.take(positions, allow_fill=True), name=column)
+
+def _plan(fact, columns, paths):
+    """
+    Menentukan tabel pemilik setiap kolom yang diminta: tabel fakta lebih dulu,
+    lalu tabel dimensi terdekat.
+    """
+    table_columns = {table: inspect_csv(dataset_path(table))['columns'] for table in paths}
+    owners = {}
+    for column in columns:
+        owner = next((table for table in paths if column in table_columns[table]), None)
+        if owner is None:
+            raise KeyError(f"Kolom '{column}' tidak ditemukan pada {fact} maupun tabel dimensinya")
+        owners[column] = owner
+
+    # Setiap tabel pemilik membutuhkan rantai induknya hingga tabel fakta
+    needed = {}
+    for column, owner in owners.items():
+        needed.setdefault(owner, []).append(column)
+        table = owner
+        while paths[table] is not None:
+            parent, foreign_key, _ = paths[table]
+            needed.setdefault(parent, [])
+            if foreign_key not in needed[parent]:
+                needed[parent].append(foreign_key)
+            table = parent
+    return owners, needed
+
+@st.cache_resource(show_spinner=False, max_entries=16)
+def _cached_join(fact, columns, fingerprints):
+    """
+    Hasil join sekali per (tabel fakta, kolom, versi semua tabel yang terjangkau).
+    """
+    paths = reachable_tables(fact)
+    owners, needed = _plan(fact, columns, paths)
+
+    frames = {}
+    positions = {}
+    for table in paths:
+        if table not in needed:
+            continue
+        frames[table] = load_dataset(dataset_path(table), columns=needed[table])
+        if paths[table] is None:
+            positions[table] = None
+            continue
+        parent, foreign_key, key = paths[table]
+        parent_frame = frames[parent]
+        keys = _take(parent_frame, foreign_key, positions[parent])
+        ids_fingerprints = parent_frame.attrs.get('id_vocabularies', {}).get(foreign_key)
+        ids_key = None if ids_fingerprints is None else (foreign_key, ids_fingerprints)
+        positions[table] = lookup_positions(table_index(table, key), keys, ids_key)
+
+    joined = pd.DataFrame({column: _take(frames[owner], column, positions[owner]) for column, owner in owners.items()})
+    joined.attrs['fingerprint'] = fingerprints
+    joined.attrs['id_vocabularies'] = {
+        column: frames[owner].attrs['id_vocabularies'][column]
+        for column, owner in owners.items()
+        if column in frames[owner].attrs.get('id_vocabularies', {})
+    }
+    return joined
+
+def join_fingerprints(fact):
+    """
+    Mengembalikan versi semua tabel yang terjangkau dari tabel fakta, untuk
+    dipakai sebagai kunci cache hasil turunan join.
+
+    Parameters:
+        fact (str): Nama dataset fakta
+
+    Returns:
+        tuple: Sidik jari (path, mtime_ns, size) per tabel dalam urutan BFS
+
+    Raises:
+        FileNotFoundError: Jika dataset fakta tidak ditemukan
+    """
+    return tuple(file_fingerprint(dataset_path(table)) for table in reachable_tables(fact))
+
+def join_columns(fact, columns):
+    """
+    Mengambil kolom dari tabel fakta beserta kolom tabel dimensi yang terhubung
+    lewat graf FOREIGN_KEYS, misalnya item pesanan dengan berat produk, negara
+    bagian penjual, dan kategori berbahasa Inggris. Setiap join memakai indeks
+    kunci yang di-cache per versi tabel, bukan pd.merge, dan baris fakta yang
+    tidak memiliki pasangan tetap ada dengan nilai kosong (left join).
+
+    Parameters:
+        fact (str): Nama dataset fakta, misalnya 'order_items_dataset'
+        columns (list): Kolom yang diminta, boleh berasal dari tabel dimensi
+
+    Returns:
+        pd.DataFrame: DataFrame bersama yang bersifat read-only, satu baris per
+        baris tabel fakta, dengan attrs['fingerprint'] berisi versi semua tabel terkait
+
+    Raises:
+        FileNotFoundError: Jika dataset fakta tidak ditemukan
+        KeyError: Jika sebuah kolom tidak terjangkau dari tabel fakta
+    """
+    return _cached_join(fact, tuple(columns), join_fingerprints(fact))
@@ -0,0 +1,88 @@
+import importlib
+import sys
+import threading
+import time
+
+# Modul berat yang dibutuhkan halaman EDA, dimuat di latar belakang setelah Home tampil
+EDA_WARMUP_MODULES = [
+    'plotly.graph_objects',
+    'plotly.subplots',
+    'plotly.io',
+    'plotly.express',
+    'pages.eda',
+]
+
+_import_times = {}
+_import_lock = threading.Lock()
+_warmup_thread = None
+
+def timed_import(module_name, source='halaman'):
+    """
+    Mengimpor modul dan mencatat lama impor pertamanya dalam proses ini.
+
+    Parameters:
+        module_name (str): Nama modul, misalnya 'pages.eda'
+        source (str): Asal permintaan impor untuk laporan ('halaman' atau 'warm-up')
+
+    Returns:
+        module: Modul yang diimpor
+
+    Raises:
+        ImportError: Jika modul tidak dapat diimpor
+    """
+    # Selalu lewat importlib: modul yang sedang diimpor thread warm-up sudah ada di
+    # sys.modules tetapi belum lengkap, import_module menunggu kunci modulnya selesai
+    already_loaded = module_name in sys.modules
+    start = time.perf_counter()
+    module = importlib.import_module(module_name)
+    if not already_loaded:
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        with _import_lock:
+            _import_times.setdefault(module_name, {'ms': elapsed_ms, 'source': source, 'at': time.time()})
+    return module
+
+def _warm_up(module_names):
+    """
+    Mengimpor modul satu per satu; kegagalan diabaikan karena halaman akan
+    mengimpor ulang (dan menampilkan galat) saat benar-benar dibuka.
+    """
+    for module_name in module_names:
+        try:
+            timed_import(module_name, source='warm-up')
+        except ImportError:
+            pass
+
+def start_warmup(module_names=EDA_WARMUP_MODULES):
+    """
+    Menjalankan impor modul berat di thread latar belakang, sekali per proses.
+
+    Parameters:
+        module_names (list): Modul yang dimuat lebih awal
+
+    Returns:
+        threading.Thread: Thread warm-up (yang sudah berjalan jika dipanggil ulang)
+    """
+    global _warmup_thread
+    with _import_lock:
+        if _warmup_thread is None:
+            _warmup_thread = threading.Thread(target=_warm_up, args=(list(module_names),), name='import-warmup', daemon=True)
+            _warmup_thread.start()
+        return _warmup_thread
+
+def import_report():
+    """
+    Menyusun laporan waktu impor modul yang dicatat oleh timed_import.
+
+    Returns:
+        pd.DataFrame: Kolom modul, sumber, ms, dan kumulatif_ms, terurut menurut waktu impor
+    """
+    import pandas as pd
+
+    with _import_lock:
+        entries = sorted(_import_times.items(), key=lambda item: item[1]['at'])
+    report = pd.DataFrame(
+        [(name, entry['source'], entry['ms']) for name, entry in entries],
+        columns=['modul', 'sumber', 'ms']
+    )
+    report['kumulatif_ms'] = report['ms'].cumsum()
+    return report
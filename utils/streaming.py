@@ -0,0 +1,286 @@
+import streamlit as st
+import pandas as pd
+import numpy as np
+from utils.data_loader import file_fingerprint
+from utils.disk_cache import get_or_compute
+from utils.rollups import append_daily_rollup, bucket_values, build_daily_rollup, sketch_buckets, ZERO_BUCKET
+from utils.schemas import read_csv_typed
+
+# Ukuran chunk baris saat membaca file secara streaming
+CHUNK_ROWS = 200_000
+
+# File di atas ukuran ini diringkas secara streaming, tidak dimuat utuh ke memori
+STREAMING_THRESHOLD_BYTES = 500 * 1024 * 1024
+
+# Offset kunci sketsa bertanda agar nilai negatif, nol, dan positif terurut benar
+_SIGN_OFFSET = 1 << 40
+
+def use_streaming(path):
+    """
+    Menentukan apakah sebuah file perlu dibaca dalam mode streaming.
+
+    Parameters:
+        path (str/Path): Path file CSV
+
+    Returns:
+        bool: True jika ukuran file melebihi STREAMING_THRESHOLD_BYTES
+    """
+    return file_fingerprint(path)[2] > STREAMING_THRESHOLD_BYTES
+
+def iter_chunks(path, chunksize=CHUNK_ROWS, columns=None):
+    """
+    Membaca file CSV bertipe dalam potongan berukuran tetap.
+
+    Parameters:
+        path (str/Path): Path file CSV
+        chunksize (int): Jumlah baris per chunk
+        columns (list): Kolom yang dibaca (opsional)
+
+    Yields:
+        pd.DataFrame: Satu chunk data
+    """
+    with read_csv_typed(path, chunksize=chunksize, usecols=columns) as reader:
+        yield from reader
+
+def signed_sketch(values):
+    """
+    Membuat sketsa kuantil (kunci bucket bertanda -> jumlah) untuk nilai numerik apa pun.
+
+    Parameters:
+        values (np.ndarray): Nilai float, NaN diabaikan
+
+    Returns:
+        pd.Series: Jumlah nilai per kunci bucket, dapat digabung dengan Series.add
+    """
+    values = values[~np.isnan(values)]
+    buckets = sketch_buckets(np.abs(values)).astype('int64')
+    keys = np.where(buckets == ZERO_BUCKET, 0, _SIGN_OFFSET + buckets) * np.sign(values).astype('int64')
+    return pd.Series(keys).value_counts()
+
+def sketch_quantile(sketch, q):
+    """
+    Memperkirakan kuantil q dari sketsa bertanda.
+
+    Parameters:
+        sketch (pd.Series): Sketsa dari signed_sketch
+        q (float): Kuantil antara 0 dan 1
+
+    Returns:
+        float: Nilai perkiraan kuantil
+    """
+    sketch = sketch.sort_index()
+    rank = q * (sketch.sum() - 1)
+    key = sketch.index[np.argmax(sketch.cumsum().to_numpy() > rank)]
+    if key == 0:
+        return 0.0
+    return float(np.sign(key) * bucket_values(np.array([abs(key) - _SIGN_OFFSET]))[0])
+
+def summarize_chunk(chunk):
+    """
+    Menghitung ringkasan parsial satu chunk yang dapat digabung dengan chunk lain.
+
+    Parameters:
+        chunk (pd.DataFrame): Potongan data
+
+    Returns:
+        dict: Jumlah baris, kolom, memori, serta akumulator per kolom
+        (numerik, rentang tanggal, dan frekuensi nilai)
+    """
+    numeric = chunk.select_dtypes('number')
+    summary = {
+        'rows': len(chunk),
+        'columns': list(chunk.columns),
+        'memory_bytes': int(chunk.memory_usage(deep=True).sum()),
+        'numeric': {},
+        'datetime': {},
+        'values': {},
+    }
+    for col in chunk.select_dtypes('datetime').columns:
+        summary['datetime'][col] = {'min': chunk[col].min(), 'max': chunk[col].max(), 'nulls': int(chunk[col].isna().sum())}
+    for col in numeric.columns:
+        values = numeric[col].to_numpy('float64')
+        valid = values[~np.isnan(values)]
+        count = len(valid)
+        mean = valid.mean() if count else 0.0
+        summary['numeric'][col] = {
+            'count': count,
+            'mean': mean,
+            'm2': float(((valid - mean) ** 2).sum()),
+            'min': valid.min() if count else np.nan,
+            'max': valid.max() if count else np.nan,
+            'sketch': signed_sketch(values),
+        }
+    if numeric.columns.empty:
+        # Sama seperti describe(): kolom non-numerik hanya diringkas jika tidak ada kolom numerik
+        for col in chunk.columns:
+            summary['values'][col] = chunk[col].value_counts()
+    return summary
+
+def merge_summaries(left, right):
+    """
+    Menggabungkan dua ringkasan parsial (rumus Chan untuk rata-rata dan varians).
+
+    Parameters:
+        left (dict): Ringkasan parsial pertama, boleh None
+        right (dict): Ringkasan parsial kedua
+
+    Returns:
+        dict: Ringkasan gabungan
+    """
+    if left is None:
+        return right
+    merged = {
+        'rows': left['rows'] + right['rows'],
+        'columns': left['columns'],
+        'memory_bytes': left['memory_bytes'] + right['memory_bytes'],
+        'numeric': {},
+        'datetime': {},
+        'values': {},
+    }
+    for col, a in left['datetime'].items():
+        b = right['datetime'][col]
+        merged['datetime'][col] = {
+            'min': min((v for v in (a['min'], b['min']) if pd.notna(v)), default=pd.NaT),
+            'max': max((v for v in (a['max'], b['max']) if pd.notna(v)), default=pd.NaT),
+            'nulls': a['nulls'] + b['nulls'],
+        }
+    for col, a in left['numeric'].items():
+        b = right['numeric'][col]
+        count = a['count'] + b['count']
+        delta = b['mean'] - a['mean']
+        merged['numeric'][col] = {
+            'count': count,
+            'mean': a['mean'] + delta * b['count'] / count if count else 0.0,
+            'm2': a['m2'] + b['m2'] + delta ** 2 * a['count'] * b['count'] / count if count else 0.0,
+            'min': np.fmin(a['min'], b['min']),
+            'max': np.fmax(a['max'], b['max']),
+            'sketch': a['sketch'].add(b['sketch'], fill_value=0),
+        }
+    for col, counts in left['values'].items():
+        merged['values'][col] = counts.add(right['values'][col], fill_value=0)
+    return merged
+
+def describe_summary(summary):
+    """
+    Menyusun tabel setara df.describe() dari ringkasan streaming.
+
+    Parameters:
+        summary (dict): Ringkasan dari summarize_csv
+
+    Returns:
+        pd.DataFrame: Statistik deskriptif (kuartil merupakan perkiraan sketsa)
+    """
+    if summary['numeric']:
+        stats = {}
+        for col, acc in summary['numeric'].items():
+            count = acc['count']
+            has_data = count > 0
+            stats[col] = {
+                'count': float(count),
+                'mean': acc['mean'] if has_data else np.nan,
+                'std': np.sqrt(acc['m2'] / (count - 1)) if count > 1 else np.nan,
+                'min': acc['min'],
+                '25%': sketch_quantile(acc['sketch'], 0.25) if has_data else np.nan,
+                '50%': sketch_quantile(acc['sketch'], 0.50) if has_data else np.nan,
+                '75%': sketch_quantile(acc['sketch'], 0.75) if has_data else np.nan,
+                'max': acc['max'],
+            }
+        return pd.DataFrame(stats)
+
+    stats = {}
+    for col, counts in summary['values'].items():
+        stats[col] = {
+            'count': counts.sum(),
+            'unique': len(counts),
+            'top': counts.idxmax() if len(counts) else np.nan,
+            'freq': counts.max() if len(counts) else np.nan,
+        }
+    return pd.DataFrame(stats)
+
+@st.cache_resource(show_spinner=False, max_entries=32)
+def _cached_summary(path, mtime_ns, size, chunksize):
+    """
+    Meringkas file CSV dalam satu lintasan sekali per versi file.
+    """
+    summary = None
+    for chunk in iter_chunks(path, chunksize=chunksize):
+        summary = merge_summaries(summary, summarize_chunk(chunk))
+    return summary
+
+def summarize_csv(path, chunksize=CHUNK_ROWS):
+    """
+    Meringkas file CSV tanpa memuat seluruh isinya: jumlah baris dan kolom,
+    perkiraan memori, dan statistik deskriptif. Hanya satu chunk yang berada
+    di memori pada satu waktu.
+
+    Parameters:
+        path (str/Path): Path file CSV
+        chunksize (int): Jumlah baris per chunk
+
+    Returns:
+        dict: Ringkasan yang dapat ditampilkan dengan describe_summary
+    """
+    return _cached_summary(*file_fingerprint(path), chunksize)
+
+def stream_payments_rollup(payments_path, orders_path, chunksize=CHUNK_ROWS):
+    """
+    Membangun ringkasan harian pembayaran secara streaming.
+
+    Dataset pesanan dibaca per chunk untuk membentuk peta order_id -> timestamp,
+    lalu dataset pembayaran dibaca per chunk dan setiap chunk digabung ke
+    ringkasan harian. Hanya peta timestamp dan satu chunk yang disimpan di memori.
+
+    Parameters:
+        payments_path (str/Path): Path CSV pembayaran
+        orders_path (str/Path): Path CSV pesanan
+        chunksize (int): Jumlah baris per chunk
+
+    Returns:
+        dict: Ringkasan harian seperti hasil build_daily_rollup
+    """
+    purchase_ts = pd.concat([
+        chunk.dropna().set_index('order_id')['order_purchase_timestamp']
+        for chunk in iter_chunks(orders_path, chunksize, columns=['order_id', 'order_purchase_timestamp'])
+    ])
+    purchase_ts = purchase_ts[~purchase_ts.index.duplicated()]
+
+    rollup = None
+    for chunk in iter_chunks(payments_path, chunksize, columns=['order_id', 'payment_value']):
+        timestamps = chunk['order_id'].map(purchase_ts)
+        valid = timestamps.notna().to_numpy()
+        timestamps = timestamps[valid]
+        fact = pd.DataFrame({
+            'payment_value': chunk['payment_value'].to_numpy()[valid],
+            'purchase_ts': timestamps.to_numpy('datetime64[ns]').view('int64'),
+            'month_key': (timestamps.dt.year * 100 + timestamps.dt.month).to_numpy('int32'),
+        })
+        rollup = build_daily_rollup(fact) if rollup is None else append_daily_rollup(rollup, fact)
+    return rollup
+
+@st.cache_resource(show_spinner=False, max_entries=4)
+def _cached_streamed_rollup(payments_fingerprint, orders_fingerprint, chunksize):
+    """
+    Membangun ringkasan harian streaming sekali per versi dataset, atau membacanya
+    dari cache disk bersama.
+    """
+    rollup = get_or_compute(
+        'streamed_payments_rollup',
+        (payments_fingerprint, orders_fingerprint, chunksize),
+        lambda: stream_payments_rollup(payments_fingerprint[0], orders_fingerprint[0], chunksize)
+    )
+    return {**rollup, 'version': (payments_fingerprint, orders_fingerprint)}
+
+def load_streamed_payments_rollup(payments_path, orders_path, chunksize=CHUNK_ROWS):
+    """
+    Mengambil ringkasan harian pembayaran hasil streaming dari cache proses.
+
+    Parameters:
+        payments_path (str/Path): Path CSV pembayaran
+        orders_path (str/Path): Path CSV pesanan
+        chunksize (int): Jumlah baris per chunk
+
+    Returns:
+        dict: Ringkasan harian bersama yang bersifat read-only, dengan tambahan
+        version (sidik jari kedua file) untuk kunci cache turunan
+    """
+    return _cached_streamed_rollup(file_fingerprint(payments_path), file_fingerprint(orders_path), chunksize)
@@ -0,0 +1,127 @@
+import streamlit as st
+import pandas as pd
+import numpy as np
+import pyarrow as pa
+from utils.ids import decode_frame, id_vocabulary
+
+PAGE_SIZES = [25, 50, 100, 250]
+
+# Larik posisi yang disimpan per proses; di luar anggaran dataset, jadi dibatasi ketat
+POSITION_CACHE_ENTRIES = 8
+POSITION_CACHE_TTL = 600
+
+def _is_active_filter(filter_column, filter_value):
+    return bool(filter_column) and filter_value not in (None, '', (None, None))
+
+@st.cache_resource(show_spinner=False, max_entries=POSITION_CACHE_ENTRIES, ttl=POSITION_CACHE_TTL)
+def _row_positions(_df, dataset_key, sort_column, ascending, filter_column, filter_value):
+    """
+    Menghitung posisi baris setelah filter dan pengurutan di sisi server.
+    Disimpan per (versi dataset, parameter) sehingga berpindah halaman tidak
+    menghitung ulang filter maupun pengurutan. Posisi disimpan sebagai int32
+    bila jumlah baris memungkinkan; tanpa filter dan pengurutan hasilnya None
+    (urutan asli), sehingga tidak ada larik sepanjang tabel yang disimpan.
+    """
+    if not sort_column and not _is_active_filter(filter_column, filter_value):
+        return None
+    positions = np.arange(len(_df), dtype='int32' if len(_df) <= np.iinfo('int32').max else 'int64')
+
+    if _is_active_filter(filter_column, filter_value):
+        series = _df[filter_column]
+        if isinstance(filter_value, tuple):
+            low, high = filter_value
+            mask = np.ones(len(series), dtype=bool)
+            if low is not None:
+                mask &= (series >= low).to_numpy()
+            if high is not None:
+                mask &= (series <= high).to_numpy()
+        elif id_vocabulary(_df, filter_column) is not None:
+            # Kolom ID berupa kode: teks dicocokkan pada kosakata, lalu difilter lewat kode
+            matched = id_vocabulary(_df, filter_column).str.contains(filter_value, case=False, regex=False)
+            mask = np.isin(series.to_numpy(), np.flatnonzero(matched))
+        elif isinstance(series.dtype, pd.CategoricalDtype):
+            # Pencocokan teks cukup dilakukan pada kategori unik, lalu dipetakan lewat kode
+            matched = series.cat.categories.astype(str).str.contains(filter_value, case=False, regex=False)
+            mask = np.isin(series.cat.codes.to_numpy(), np.flatnonzero(matched))
+        else:
+            mask = series.astype(str).str.contains(filter_value, case=False, regex=False).to_numpy()
+        positions = positions[mask]
+
+    if sort_column:
+        # Kosakata ID terurut, sehingga urutan kode sama dengan urutan teks ID
+        values = pd.Series(_df[sort_column].to_numpy()[positions])
+        positions = positions[values.sort_values(ascending=ascending, kind='stable', na_position='last').index.to_numpy()]
+
+    return positions
+
+def payload_bytes(df):
+    """
+    Memperkirakan ukuran data yang dikirim ke browser (ukuran tabel Arrow).
+
+    Parameters:
+        df (pd.DataFrame): Data yang akan ditampilkan
+
+    Returns:
+        int: Jumlah byte
+    """
+    return pa.Table.from_pandas(df, preserve_index=False).nbytes
+
+def show_paginated_dataframe(df, dataset_key, key):
+    """
+    Menampilkan DataFrame per halaman: hanya potongan yang terlihat yang dikirim
+    ke browser, dengan pengurutan dan filter kolom yang dihitung di server.
+
+    Parameters:
+        df (pd.DataFrame): Data sumber (tidak diubah)
+        dataset_key (hashable): Identitas versi dataset, misalnya sidik jari file
+        key (str): Prefix key widget Streamlit
+    """
+    columns = list(df.columns)
+
+    col1, col2, col3 = st.columns([2, 1, 2])
+    with col1:
+        sort_column = st.selectbox("Urutkan berdasarkan", [None] + columns,
+                                   format_func=lambda c: "—" if c is None else c, key=f"{key}_sort")
+    with col2:
+        ascending = st.radio("Arah", ["Naik", "Turun"], horizontal=True, key=f"{key}_order") == "Naik"
+    with col3:
+        filter_column = st.selectbox("Filter kolom", [None] + columns,
+                                     format_func=lambda c: "—" if c is None else c, key=f"{key}_filter_col")
+
+    filter_value = None
+    if filter_column is not None:
+        if pd.api.types.is_numeric_dtype(df[filter_column]) and id_vocabulary(df, filter_column) is None:
+            low_col, high_col = st.columns(2)
+            with low_col:
+                low = st.number_input("Nilai minimum", value=None, key=f"{key}_filter_low")
+            with high_col:
+                high = st.number_input("Nilai maksimum", value=None, key=f"{key}_filter_high")
+            filter_value = (low, high)
+        else:
+            filter_value = st.text_input("Mengandung teks", key=f"{key}_filter_text")
+
+    positions = _row_positions(df, dataset_key, sort_column, ascending, filter_column, filter_value)
+    total_rows = len(df) if positions is None else len(positions)
+
+    col1, col2 = st.columns([1, 3])
+    with col1:
+        page_size = st.selectbox("Baris per halaman", PAGE_SIZES, index=1, key=f"{key}_page_size")
+    n_pages = max(1, -(-total_rows // page_size))
+    if st.session_state.get(f"{key}_page", 1) > n_pages:
+        # Filter baru bisa mengurangi jumlah halaman di bawah halaman yang sedang dibuka
+        st.session_state[f"{key}_page"] = n_pages
+    with col2:
+        page = st.number_input(f"Halaman (dari {n_pages:,})", min_value=1, max_value=n_pages,
+                               step=1, key=f"{key}_page")
+
+    start = (page - 1) * page_size
+    # Kode ID dikembalikan ke teks hanya untuk baris yang ditampilkan
+    page_rows = slice(start, start + page_size) if positions is None else positions[start:start + page_size]
+    page_df = decode_frame(df.iloc[page_rows])
+    st.dataframe(page_df, use_container_width=True)
+
+    end = start + len(page_df)
+    st.caption(
+        f"Menampilkan baris {start + 1 if len(page_df) else 0:,}–{end:,} dari {total_rows:,} "
+        f"· {payload_bytes(page_df) / 1024:.1f} KB dikirim ke browser"
+    )
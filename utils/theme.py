@@ -0,0 +1,239 @@
+import re
+import threading
+from functools import lru_cache
+import streamlit as st
+
+# Aturan bersama semua halaman: sidebar navigasi, kontainer utama, tombol, highlight, dan kartu
+BASE_CSS = """
+    .sidebar-title {
+        color: #1e3c72 !important;
+        font-size: 1.5rem !important;
+        font-weight: 700 !important;
+        margin-bottom: 1.5rem !important;
+        padding-bottom: 0.75rem;
+        position: relative;
+        font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
+        text-align: center;
+    }
+
+    .sidebar-title:after {
+        content: "";
+        position: absolute;
+        bottom: 0;
+        left: 25%;
+        width: 50%;
+        height: 3px;
+        background: linear-gradient(90deg, #ffd700, #1a5fb4);
+        border-radius: 3px;
+    }
+
+    .sidebar-title:hover {
+        text-shadow: 0 0 8px rgba(26, 95, 180, 0.3);
+        transition: text-shadow 0.3s ease;
+    }
+
+    .main {
+        background-color: #ffffff;
+        padding: 2rem;
+        border-radius: 10px;
+        box-shadow: 0 4px 10px rgba(0, 0, 0, 0.1);
+        margin-top: 1rem;
+    }
+
+    .stButton>button {
+        background-color: #1a5fb4;
+        color: white !important;
+        border-radius: 5px;
+        padding: 12px 16px;
+        margin: 8px 0;
+        font-weight: bold;
+        cursor: pointer;
+        text-align: center;
+        box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
+        transition: all 0.3s ease;
+        border: none;
+        width: 100%;
+    }
+
+    .stButton>button:hover {
+        background-color: #0d47a1;
+        color: white !important;
+        transform: scale(1.05);
+        box-shadow: 0 8px 12px rgba(0, 0, 0, 0.2);
+    }
+
+    .sidebar .stButton>button {
+        background-color: #1a5fb4 !important;
+        color: white !important;
+        border-radius: 8px !important;
+        padding: 12px 16px !important;
+        margin: 8px 0 !important;
+        font-weight: bold !important;
+        font-size: 1rem !important;
+        cursor: pointer !important;
+        text-align: center !important;
+        box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1) !important;
+        transition: all 0.3s ease !important;
+        border: none !important;
+        width: 100% !important;
+    }
+
+    .sidebar .stButton>button:hover {
+        background-color: #0d47a1 !important;
+        color: white !important;
+        transform: scale(1.02) !important;
+        box-shadow: 0 6px 10px rgba(0, 0, 0, 0.15) !important;
+    }
+
+    .sidebar .stButton>button:focus:not(:active) {
+        background-color: #1a5fb4 !important;
+        color: white !important;
+        box-shadow: 0 4px 10px rgba(0, 0, 0, 0.2) !important;
+    }
+
+    .sidebar .stButton>button[aria-pressed="true"] {
+        background-color: #0d47a1 !important;
+        border-left: 4px solid #ffd700 !important;
+    }
+
+    .highlight-blue {
+        color: #1e3c72;
+        font-weight: bold;
+    }
+
+    .highlight-yellow {
+        color: #FFD700;
+        font-weight: bold;
+    }
+
+    .dataset-card {
+        padding: 15px;
+        border-radius: 10px;
+        background: linear-gradient(145deg, #e6f0ff, #ffffff);
+        border-left: 4px solid #ffd700;
+        box-shadow: 0 2px 5px rgba(0,0,0,0.1);
+        margin-bottom: 15px;
+    }
+
+    .dataset-card h5 {
+        color: #1a5fb4;
+        margin-bottom: 8px !important;
+    }
+
+    .dataset-card p {
+        color: #333333;
+        margin: 5px 0 !important;
+    }
+
+    .insight-card {
+        padding: 15px;
+        border-radius: 10px;
+        background: #fff9e6;
+        border-left: 4px solid #1e3c72;
+        margin-bottom: 15px;
+        box-shadow: 0 2px 5px rgba(0,0,0,0.1);
+    }
+"""
+
+# Aturan halaman data (Datasets dan EDA): latar, widget tabel/filter, expander, dan garis pemisah
+DATA_PAGE_CSS = """
+    .main {
+        background-color: #f5f9ff;
+    }
+
+    .stSelectbox, .stDataFrame, .stTextInput, .stNumberInput {
+        border: 1px solid #4a90e2;
+        border-radius: 5px;
+    }
+
+    .stDataFrame {
+        box-shadow: 0 2px 5px rgba(0,0,0,0.1);
+    }
+
+    .stHeader {
+        color: #1e3c72 !important;
+        font-weight: bold !important;
+    }
+
+    .st-expander {
+        border: 1px solid #4a90e2;
+        border-radius: 5px;
+    }
+
+    .st-expander-header {
+        background-color: #e6f0ff !important;
+        color: #1e3c72 !important;
+        font-weight: bold !important;
+    }
+
+    hr {
+        border-top: 2px dashed #ffd700;
+        margin: 20px 0;
+    }
+"""
+
+_page_css = {}
+_page_css_lock = threading.Lock()
+
+def register_page_css(page, *css_blocks):
+    """
+    Mendaftarkan aturan CSS tambahan untuk sebuah halaman. Dipanggil sekali saat
+    modul halaman diimpor.
+
+    Parameters:
+        page (str): Nama modul halaman, misalnya 'eda'
+        *css_blocks (str): Blok aturan CSS (tanpa tag <style>)
+    """
+    with _page_css_lock:
+        _page_css[page] = css_blocks
+        build_stylesheet.cache_clear()
+
+def minify_css(css):
+    """
+    Memadatkan CSS dan membuang aturan yang identik. Salinan terakhir yang
+    dipertahankan agar urutan cascade tidak berubah.
+
+    Parameters:
+        css (str): Kumpulan aturan CSS tanpa at-rule bersarang
+
+    Returns:
+        str: CSS padat
+    """
+    css = re.sub(r'/\*.*?\*/', '', css, flags=re.S)
+    css = re.sub(r'\s+', ' ', css).strip()
+    css = re.sub(r'\s*([{}:;,>])\s*', r'\1', css)
+    css = css.replace(';}', '}')
+    rules = [rule + '}' for rule in css.split('}') if rule.strip()]
+    seen = set()
+    unique = []
+    for rule in reversed(rules):
+        if rule not in seen:
+            seen.add(rule)
+            unique.append(rule)
+    return ''.join(reversed(unique))
+
+@lru_cache(maxsize=None)
+def build_stylesheet(page=None):
+    """
+    Menyusun stylesheet tema untuk sebuah halaman: aturan bersama ditambah aturan
+    yang didaftarkan halaman, dipadatkan sekali per proses.
+
+    Parameters:
+        page (str): Nama modul halaman (opsional)
+
+    Returns:
+        str: Tag <style> berisi CSS padat
+    """
+    blocks = (BASE_CSS,) + _page_css.get(page, ())
+    return f"<style>{minify_css(''.join(blocks))}</style>"
+
+def apply_theme(page=None):
+    """
+    Menyisipkan stylesheet tema sebagai satu elemen. Streamlit membuang elemen
+    yang tidak dirender ulang, sehingga fungsi ini dipanggil sekali per run;
+    stylesheet-nya sendiri hanya disusun sekali per proses.
+
+    Parameters:
+        page (str): Nama modul halaman yang sedang aktif (opsional)
+    """
+    st.markdown(build_stylesheet(page), unsafe_allow_html=True)
@@ -0,0 +1,143 @@
+import streamlit as st
+import pandas as pd
+import numpy as np
+
+TRENDLINE_METHODS = ["LOWESS", "Median per bin", "Linear"]
+
+# Jumlah bin kuantil sumbu x sebagai dasar perhitungan garis tren
+TRENDLINE_BINS = 100
+
+# Proporsi data dalam jendela lokal LOWESS (sama dengan default statsmodels)
+LOWESS_FRAC = 2 / 3
+
+def _quantile_bins(x, n_bins):
+    """
+    Membagi nilai x ke bin berbasis kuantil dan mengembalikan kode bin per nilai.
+    """
+    edges = np.unique(np.quantile(x, np.linspace(0, 1, n_bins + 1)))
+    codes = np.clip(np.searchsorted(edges, x, side='right') - 1, 0, max(len(edges) - 2, 0))
+    return codes, max(len(edges) - 1, 1)
+
+def binned_stats(x, y, n_bins=TRENDLINE_BINS):
+    """
+    Menghitung statistik cukup (jumlah, Σx, Σy, Σx², Σxy) per bin kuantil x.
+
+    Parameters:
+        x (np.ndarray): Nilai sumbu x
+        y (np.ndarray): Nilai sumbu y
+        n_bins (int): Jumlah bin kuantil
+
+    Returns:
+        dict: Larik per bin yang tidak kosong: n, sx, sy, sxx, sxy, dan codes per nilai
+    """
+    codes, size = _quantile_bins(x, n_bins)
+    stats = {
+        'n': np.bincount(codes, minlength=size).astype('float64'),
+        'sx': np.bincount(codes, weights=x, minlength=size),
+        'sy': np.bincount(codes, weights=y, minlength=size),
+        'sxx': np.bincount(codes, weights=x * x, minlength=size),
+        'sxy': np.bincount(codes, weights=x * y, minlength=size),
+    }
+    filled = stats['n'] > 0
+    stats = {key: value[filled] for key, value in stats.items()}
+    stats['codes'] = codes
+    return stats
+
+def binned_lowess(stats, frac=LOWESS_FRAC):
+    """
+    Regresi linear lokal berbobot tricube (LOWESS tanpa iterasi robust) yang
+    dihitung dari statistik cukup per bin, dievaluasi di rata-rata x setiap bin.
+    Biayanya O(bin²), tidak bergantung pada jumlah baris data.
+
+    Parameters:
+        stats (dict): Hasil binned_stats
+        frac (float): Proporsi data dalam jendela lokal
+
+    Returns:
+        tuple: (x, y) titik-titik kurva
+    """
+    n, sx, sy, sxx, sxy = (stats[key] for key in ('n', 'sx', 'sy', 'sxx', 'sxy'))
+    centers = sx / n
+
+    # Lebar jendela per titik: jarak terdekat yang mencakup frac dari seluruh data
+    distance = np.abs(centers[:, None] - centers[None, :])
+    order = np.argsort(distance, axis=1)
+    cumulative = np.cumsum(n[order], axis=1)
+    reach = np.argmax(cumulative >= frac * n.sum(), axis=1)
+    bandwidth = np.take_along_axis(distance, order, axis=1)[np.arange(len(centers)), reach]
+    bandwidth = np.maximum(bandwidth, np.finfo('float64').eps) * 1.0001
+
+    weights = np.clip(1 - (distance / bandwidth[:, None]) ** 3, 0, None) ** 3
+    s0, s1, s2 = weights @ n, weights @ sx, weights @ sxx
+    t0, t1 = weights @ sy, weights @ sxy
+    denominator = s0 * s2 - s1 * s1
+    slope = np.divide(s0 * t1 - s1 * t0, denominator, out=np.zeros_like(denominator), where=denominator > 0)
+    intercept = (t0 - slope * s1) / s0
+    return centers, intercept + slope * centers
+
+def binned_median(x, y, stats):
+    """
+    Median y per bin kuantil x.
+
+    Parameters:
+        x (np.ndarray): Nilai sumbu x
+        y (np.ndarray): Nilai sumbu y
+        stats (dict): Hasil binned_stats
+
+    Returns:
+        tuple: (x, y) titik-titik kurva
+    """
+    medians = pd.Series(y).groupby(stats['codes']).median().to_numpy()
+    return stats['sx'] / stats['n'], medians
+
+def linear_fit(stats):
+    """
+    Regresi linear kuadrat terkecil seluruh data dari statistik cukup.
+
+    Parameters:
+        stats (dict): Hasil binned_stats
+
+    Returns:
+        tuple: (x, y) dua titik ujung garis
+    """
+    n, sx, sy, sxx, sxy = (stats[key].sum() for key in ('n', 'sx', 'sy', 'sxx', 'sxy'))
+    slope = (n * sxy - sx * sy) / (n * sxx - sx * sx)
+    intercept = (sy - slope * sx) / n
+    centers = stats['sx'] / stats['n']
+    x = np.array([centers.min(), centers.max()])
+    return x, intercept + slope * x
+
+def compute_trendline(x, y, method="LOWESS", n_bins=TRENDLINE_BINS, frac=LOWESS_FRAC):
+    """
+    Menghitung kurva garis tren y terhadap x.
+
+    Parameters:
+        x (pd.Series): Nilai sumbu x
+        y (pd.Series): Nilai sumbu y
+        method (str): Salah satu TRENDLINE_METHODS
+        n_bins (int): Jumlah bin kuantil
+        frac (float): Proporsi jendela LOWESS
+
+    Returns:
+        pd.DataFrame: Kolom x dan y kurva, terurut menurut x
+    """
+    x = x.to_numpy('float64')
+    y = y.to_numpy('float64')
+    valid = ~(np.isnan(x) | np.isnan(y))
+    x, y = x[valid], y[valid]
+    stats = binned_stats(x, y, n_bins)
+
+    if method == "Median per bin":
+        curve_x, curve_y = binned_median(x, y, stats)
+    elif method == "Linear":
+        curve_x, curve_y = linear_fit(stats)
+    else:
+        curve_x, curve_y = binned_lowess(stats, frac)
+    return pd.DataFrame({'x': curve_x, 'y': curve_y})
+
+@st.cache_resource(show_spinner=False, max_entries=32)
+def cached_trendline(_df, dataset_key, x_column, y_column, method="LOWESS", n_bins=TRENDLINE_BINS, frac=LOWESS_FRAC):
+    """
+    compute_trendline yang disimpan per versi dataset, kolom, dan parameter.
+    """
+    return compute_trendline(_df[x_column], _df[y_column], method=method, n_bins=n_bins, frac=frac)